@@ -0,0 +1,111 @@
+"""Microbenchmark: classifying many locales against one large source.
+
+Compares the previous recursive classifier (a full walk of the source per
+locale, rebuilding list paths and hashes for every leaf, plus a final walk for
+the snapshot) against one shared SourceIndex and flattened-target lookups.
+
+    python benchmarks/classify_locales.py [--keys 18000] [--locales 40]
+"""
+
+import argparse
+import copy
+import random
+import time
+
+from langsync.processor import LocaleProcessor, SourceIndex
+from langsync.state import compute_source_hashes, path_to_key, value_hash
+
+
+def legacy_classify(source, target, snapshot_hashes):
+    result = {"missing": [], "changed": [], "unchanged": [], "orphans": []}
+
+    def classify(source, target, path):
+        for key, value in source.items():
+            current_path = path + [key]
+            if isinstance(value, dict):
+                if key not in target or not isinstance(target[key], dict):
+                    target[key] = {}
+                classify(value, target[key], current_path)
+                continue
+            if key not in target or target[key] in (None, "") or isinstance(target[key], dict):
+                result["missing"].append(current_path)
+                continue
+            prior_hash = snapshot_hashes.get(path_to_key(current_path))
+            if prior_hash is not None and prior_hash != value_hash(value):
+                result["changed"].append(current_path)
+            else:
+                result["unchanged"].append(current_path)
+
+    def orphans(source, target, path):
+        for key, tval in target.items():
+            current_path = path + [key]
+            if key not in source:
+                result["orphans"].append(current_path)
+            elif isinstance(tval, dict):
+                orphans(source[key] if isinstance(source[key], dict) else {}, tval, current_path)
+
+    classify(source, target, [])
+    orphans(source, target, [])
+    return result
+
+
+def make_tree(n_keys, seed=7):
+    rng = random.Random(seed)
+    source = {}
+    for i in range(n_keys):
+        node = source
+        for depth in range(rng.randint(0, 3)):
+            node = node.setdefault(f"section{rng.randint(0, 30)}_{depth}", {})
+        node[f"key{i}"] = f"Sentence number {i} with {{count}} items"
+    return source
+
+
+def make_locales(source, n_locales, seed=7):
+    rng = random.Random(seed)
+    index = SourceIndex(source)
+    leaves = list(zip(index.paths, index.values))
+    locales = []
+    for _ in range(n_locales):
+        target = {}
+        for path, value in leaves:
+            if rng.random() < 0.97:
+                LocaleProcessor.set_value_by_path(target, path, value.upper())
+        target[f"orphan{rng.randint(0, 9)}"] = "old"
+        locales.append(target)
+    return locales
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=18000)
+    parser.add_argument("--locales", type=int, default=40)
+    args = parser.parse_args()
+
+    source = make_tree(args.keys)
+    snapshot = compute_source_hashes(source)
+    locales = make_locales(source, args.locales)
+
+    legacy_targets = copy.deepcopy(locales)
+    started = time.perf_counter()
+    legacy = [legacy_classify(source, target, snapshot) for target in legacy_targets]
+    compute_source_hashes(source)
+    legacy_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    index = SourceIndex(source)
+    indexed = [LocaleProcessor(source, index=index).classify_keys(target, snapshot) for target in locales]
+    indexed_time = time.perf_counter() - started
+
+    for old, new in zip(legacy, indexed):
+        assert [tuple(p) for p in old["missing"]] == [p for p, _ in new["missing_translatable"]]
+        assert [tuple(p) for p in old["unchanged"]] == new["unchanged"]
+        assert [tuple(p) for p in old["orphans"]] == new["orphans"]
+
+    print(f"{args.keys} keys x {args.locales} locales")
+    print(f"  recursive walks : {legacy_time:.3f}s")
+    print(f"  source index    : {indexed_time:.3f}s")
+    print(f"  speedup         : {legacy_time / indexed_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
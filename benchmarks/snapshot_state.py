@@ -0,0 +1,63 @@
+"""Microbenchmark: hashing a source and saving/loading its snapshot.
+
+Compares schema v1 (SHA-256 of each value's JSON, json.dump with indent)
+against v2 (BLAKE2b-64 of UTF-8 bytes, hand-serialized) on one source.
+
+    python benchmarks/snapshot_state.py [--keys 18000]
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from langsync.state import legacy_value_hash, load_state, save_state, value_hash
+
+
+def legacy_save(path, hashes):
+    payload = {"version": 1, "hashes": dict(sorted(hashes.items()))}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=18000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    leaves = {
+        f"section{rng.randint(0, 200)}.group{rng.randint(0, 20)}.key{i}": f"Sentence number {i} with {{count}} items"
+        for i in range(args.keys)
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = []
+        for label, hasher, saver in (
+            ("v1 sha256/json", legacy_value_hash, legacy_save),
+            ("v2 blake2b", value_hash, save_state),
+        ):
+            path = os.path.join(tmp, f"{label.split()[0]}.json")
+            hash_time, hashes = timed(lambda: {k: hasher(v) for k, v in leaves.items()})
+            save_time, _ = timed(saver, path, hashes)
+            load_time, (loaded, _) = timed(load_state, path)
+            assert loaded == hashes
+            rows.append((label, hash_time, save_time, load_time, os.path.getsize(path)))
+
+    print(f"{args.keys} keys")
+    print(f"  {'':16} {'hash':>8} {'save':>8} {'load':>8} {'size':>10}")
+    for label, hash_time, save_time, load_time, size in rows:
+        print(f"  {label:16} {hash_time:7.3f}s {save_time:7.3f}s {load_time:7.3f}s {size / 1024:8.0f}KB")
+
+
+if __name__ == "__main__":
+    main()
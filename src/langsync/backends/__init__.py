@@ -0,0 +1,86 @@
+"""Translation backends, selected with the `backend` key in langsync.json.
+
+Per-backend options go under `backends.<name>`, e.g.
+`"backends": {"offline": {"latency": 0.1}}`.
+"""
+
+import threading
+
+from ..errors import TranslationError
+from .argos import ArgosBackend
+from .base import TranslationBackend
+from .google import GoogleBackend
+from .http import DEFAULT_POOL_SIZE, pooled_session
+from .libretranslate import LibreTranslateBackend
+from .offline import OfflineBackend
+
+DEFAULT_BACKEND = "google"
+
+BACKENDS = {
+    ArgosBackend.name: ArgosBackend,
+    GoogleBackend.name: GoogleBackend,
+    LibreTranslateBackend.name: LibreTranslateBackend,
+    OfflineBackend.name: OfflineBackend,
+}
+
+
+def get_backend(name):
+    """Return the backend class registered as `name`."""
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise TranslationError(
+            f"unknown backend '{name}' (available: {', '.join(sorted(BACKENDS))})", kind="init",
+        ) from None
+
+
+def create_backend(name, source, target, options=None):
+    return get_backend(name)(source, target, **(options or {}))
+
+
+class BackendCache:
+    """Backend instances for one run, created once per (name, source, target)
+    and reused by every locale that maps to the same language code. Network
+    backends share one keep-alive session per backend name, with `pool_size`
+    connections (the run's worker count). `timeout` is the default per-request
+    timeout for backends that accept one; `backends.<name>.timeout` wins."""
+
+    def __init__(self, options=None, pool_size=DEFAULT_POOL_SIZE, timeout=None):
+        self.options = options or {}  # the `backends` config mapping
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._instances = {}
+        self._sessions = {}
+
+    def get(self, name, source, target):
+        key = (name, source, target)
+        with self._lock:
+            backend = self._instances.get(key)
+            if backend is None:
+                cls = get_backend(name)
+                options = dict(self.options.get(name) or {})
+                if cls.uses_session:
+                    if name not in self._sessions:
+                        self._sessions[name] = pooled_session(self.pool_size)
+                    options.setdefault('session', self._sessions[name])
+                if cls.accepts_timeout and self.timeout is not None:
+                    options.setdefault('timeout', self.timeout)
+                # Failures are not cached: the next locale gets the same error.
+                backend = self._instances[key] = cls(source, target, **options)
+        return backend
+
+    def __len__(self):
+        return len(self._instances)
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+__all__ = [
+    "ArgosBackend", "BACKENDS", "BackendCache", "DEFAULT_BACKEND", "GoogleBackend",
+    "LibreTranslateBackend", "OfflineBackend", "TranslationBackend", "create_backend", "get_backend",
+]
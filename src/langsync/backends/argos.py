@@ -0,0 +1,113 @@
+"""Local CPU translation with Argos Translate models (CTranslate2 + SentencePiece).
+
+Needs the optional `argostranslate` dependency and an installed language
+package per pair (`argospm install translate-en_fr`). No network is used.
+
+Each model is loaded once per process and a whole batch is tokenized and run
+through `ctranslate2.Translator.translate_batch` as one inference call. Work is
+spread across cores with a process pool shared by every locale in the run;
+options (under `backends.argos`):
+
+    processes   worker processes (default: CPU count; 0 runs in-process)
+    beam_size   beam width (default 2)
+    max_batch_items  strings per inference call (default 32)
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from ..errors import TranslationError
+from .base import TranslationBackend
+# LibreTranslate is built on Argos and shares its language codes.
+from .libretranslate import LANGUAGE_CODES
+
+_models = {}
+_models_lock = threading.Lock()
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def _require_argos():
+    try:
+        import argostranslate.package  # noqa: F401
+    except ImportError:
+        raise TranslationError(
+            "the argos backend needs the optional 'argostranslate' package "
+            "(pip install 'langsync[argos]')", kind="init",
+        ) from None
+
+
+def _find_package(source, target):
+    import argostranslate.package
+
+    for package in argostranslate.package.get_installed_packages():
+        if package.from_code == source and package.to_code == target:
+            return package
+    raise TranslationError(
+        f"no Argos model installed for {source} -> {target} "
+        f"(argospm install translate-{source}_{target})", kind="init",
+    )
+
+
+def _load_model(source, target):
+    """(tokenizer, translator) for a language pair, loaded once per process."""
+    key = (source, target)
+    with _models_lock:
+        model = _models.get(key)
+        if model is None:
+            import ctranslate2
+            import sentencepiece
+
+            path = str(_find_package(source, target).package_path)
+            tokenizer = sentencepiece.SentencePieceProcessor(model_file=os.path.join(path, "sentencepiece.model"))
+            translator = ctranslate2.Translator(os.path.join(path, "model"), device="cpu")
+            model = _models[key] = (tokenizer, translator)
+    return model
+
+
+def _translate_texts(source, target, texts, beam_size):
+    """Runs in a pool worker (or in-process): one batched inference call."""
+    tokenizer, translator = _load_model(source, target)
+    tokens = tokenizer.encode(list(texts), out_type=str)
+    results = translator.translate_batch(tokens, beam_size=beam_size, max_batch_size=len(tokens))
+    return [tokenizer.decode(result.hypotheses[0]).strip() for result in results]
+
+
+def _pool(processes):
+    with _pools_lock:
+        pool = _pools.get(processes)
+        if pool is None:
+            # Spawn, not fork: the parent is full of worker threads holding locks.
+            pool = _pools[processes] = ProcessPoolExecutor(
+                max_workers=processes, mp_context=multiprocessing.get_context("spawn"),
+            )
+    return pool
+
+
+class ArgosBackend(TranslationBackend):
+    name = "argos"
+    native_batch = True
+    # Real translations, worth keeping: memory entries are keyed by backend,
+    # so they are only ever served back to argos, not to google or libretranslate.
+    cacheable = True
+
+    def __init__(self, source, target, processes=None, beam_size=2, max_batch_items=32):
+        super().__init__(LANGUAGE_CODES.get(source, source), LANGUAGE_CODES.get(target, target))
+        _require_argos()
+        _find_package(self.source, self.target)
+        self.processes = (os.cpu_count() or 1) if processes is None else processes
+        self.beam_size = beam_size
+        self.max_batch_items = max_batch_items
+
+    def translate_batch(self, texts):
+        if not self.processes:
+            return _translate_texts(self.source, self.target, texts, self.beam_size)
+        future = _pool(self.processes).submit(
+            _translate_texts, self.source, self.target, list(texts), self.beam_size,
+        )
+        return future.result()
+
+    def translate(self, text):
+        return self.translate_batch([text])[0]
@@ -0,0 +1,54 @@
+"""The interface every translation backend implements.
+
+A backend translates between one source and one target language code. It may
+be called from many worker threads at once, so implementations keep any
+per-request client state thread-local. Pacing, retries, memory and the circuit
+breaker all live in `TranslationService`; a backend only sends requests and
+says what went wrong when one fails.
+"""
+
+import socket
+
+import requests
+
+from ..errors import TranslationError
+
+
+class TranslationBackend:
+    name = "base"
+    # Largest single request the backend accepts, in characters.
+    max_chars = 5000
+    # Most items one `translate_batch` request may carry (None: no limit).
+    max_batch_items = None
+    # True when `translate_batch` is one request for the whole list. Otherwise
+    # TranslationService packs batches into joined `translate` requests, or
+    # sends (and rate-limits) one `translate` request per item.
+    native_batch = False
+    # Whether results may be written to the persistent translation memory.
+    cacheable = True
+    # Whether the constructor accepts a shared keep-alive `session`.
+    uses_session = False
+    # Whether the constructor accepts a per-request `timeout` in seconds.
+    accepts_timeout = False
+
+    def __init__(self, source, target, **options):
+        if options:
+            raise TypeError(f"unknown option(s) for backend '{self.name}': {', '.join(sorted(options))}")
+        self.source = source
+        self.target = target
+
+    def translate(self, text):
+        raise NotImplementedError
+
+    def translate_batch(self, texts):
+        return [self.translate(text) for text in texts]
+
+    def classify_error(self, error):
+        """Map an exception raised by this backend to a TranslationError kind:
+        "rate_limit", "network" or "api"."""
+        if isinstance(error, TranslationError):
+            return error.kind
+        if isinstance(error, (TimeoutError, socket.timeout, ConnectionError,
+                              requests.Timeout, requests.ConnectionError)):
+            return "network"
+        return "api"
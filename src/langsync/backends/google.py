@@ -0,0 +1,71 @@
+"""Google Translate through its mobile web endpoint (as deep_translator does),
+over a pooled keep-alive session instead of a fresh connection per request."""
+
+from bs4 import BeautifulSoup
+from deep_translator import GoogleTranslator
+from deep_translator.constants import BASE_URLS
+from deep_translator.exceptions import RequestError, TooManyRequests, TranslationNotFound
+
+from .base import TranslationBackend
+from .http import pooled_session
+
+
+class GoogleTranslateError(RequestError):
+    """A non-2xx answer other than 429, keeping the status for classify_error."""
+
+    def __init__(self, status):
+        super().__init__(f"Google Translate HTTP {status}")
+        self.status = status
+
+
+class GoogleBackend(TranslationBackend):
+    name = "google"
+    max_chars = 5000
+    # One request per item: there is no bulk endpoint.
+    native_batch = False
+    uses_session = True
+    accepts_timeout = True
+
+    def __init__(self, source, target, session=None, timeout=30.0):
+        super().__init__(source, target)
+        # deep_translator validates the pair and maps language names to codes.
+        translator = GoogleTranslator(source=source, target=target)
+        self._params = {'sl': translator.source, 'tl': translator.target}
+        self.url = BASE_URLS.get("GOOGLE_TRANSLATE")
+        self.session = session if session is not None else pooled_session()
+        self.timeout = timeout
+
+    def translate(self, text):
+        text = text.strip()
+        if not text:
+            return text
+        response = self.session.get(self.url, params={**self._params, 'q': text},
+                                    timeout=self.timeout)
+        try:
+            if response.status_code == 429:
+                raise TooManyRequests()
+            if not 200 <= response.status_code < 300:
+                raise GoogleTranslateError(response.status_code)
+            soup = BeautifulSoup(response.text, "html.parser")
+        finally:
+            response.close()
+        element = soup.find("div", {"class": "t0"}) or soup.find("div", {"class": "result-container"})
+        if not element:
+            raise TranslationNotFound(text)
+        return element.get_text(strip=True)
+
+    def classify_error(self, error):
+        if isinstance(error, TooManyRequests):
+            return "rate_limit"
+        if isinstance(error, GoogleTranslateError):
+            # Server-side failures are transient; anything else is the request itself.
+            return "network" if error.status >= 500 else "api"
+        if isinstance(error, RequestError):
+            return "network"
+        # Transport failures and older deep_translator versions raise bare exceptions.
+        msg = str(error).lower()
+        if "429" in msg or "too many requests" in msg or "rate" in msg:
+            return "rate_limit"
+        if "timeout" in msg or "connection" in msg or "network" in msg:
+            return "network"
+        return super().classify_error(error)
@@ -0,0 +1,20 @@
+"""Keep-alive HTTP sessions for network backends.
+
+A `requests.Session` keeps TCP/TLS connections open between requests, so short
+UI strings stop paying DNS + TCP + TLS setup on every call. urllib3's
+connection pool is thread-safe, so one session is shared by every worker
+talking to the same backend; `pool_size` should match the run's concurrency.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 10
+
+
+def pooled_session(pool_size=DEFAULT_POOL_SIZE):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(1, pool_size))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
@@ -0,0 +1,75 @@
+"""LibreTranslate (self-hosted or hosted) via its native bulk endpoint.
+
+A whole batch goes out as one POST /translate with `q` set to the list of
+strings, over a keep-alive `requests.Session` shared by every worker using
+this backend. Options (under `backends.libretranslate`):
+
+    url          server base URL (default http://localhost:5000)
+    api_key      optional API key
+    timeout      per-request timeout in seconds (default 30)
+    max_chars    per-request character limit of the server (default 5000)
+    pool_size    keep-alive connections kept open when the backend owns its
+                 session (default 10; a run sizes it to its worker count)
+"""
+
+from .base import TranslationBackend
+from .http import DEFAULT_POOL_SIZE, pooled_session
+
+# get_translator_code() speaks Google's codes; LibreTranslate uses its own.
+LANGUAGE_CODES = {
+    'zh-CN': 'zh',
+    'zh-TW': 'zt',
+    'iw': 'he',
+    'no': 'nb',
+}
+
+
+class LibreTranslateError(Exception):
+    def __init__(self, status, message):
+        super().__init__(f"LibreTranslate HTTP {status}: {message}")
+        self.status = status
+
+
+class LibreTranslateBackend(TranslationBackend):
+    name = "libretranslate"
+    native_batch = True
+    uses_session = True
+    accepts_timeout = True
+
+    def __init__(self, source, target, url="http://localhost:5000", api_key=None, timeout=30.0,
+                 max_chars=5000, max_batch_items=None, pool_size=DEFAULT_POOL_SIZE, session=None):
+        super().__init__(LANGUAGE_CODES.get(source, source), LANGUAGE_CODES.get(target, target))
+        self.endpoint = url.rstrip('/') + '/translate'
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_chars = max_chars
+        self.max_batch_items = max_batch_items
+        self.session = session if session is not None else pooled_session(pool_size)
+
+    def _post(self, q):
+        payload = {'q': q, 'source': self.source, 'target': self.target, 'format': 'text'}
+        if self.api_key:
+            payload['api_key'] = self.api_key
+        response = self.session.post(self.endpoint, json=payload, timeout=self.timeout)
+        if response.status_code != 200:
+            try:
+                message = response.json().get('error', response.reason)
+            except ValueError:
+                message = response.reason
+            raise LibreTranslateError(response.status_code, message)
+        return response.json()['translatedText']
+
+    def translate(self, text):
+        return self._post(text)
+
+    def translate_batch(self, texts):
+        return self._post(list(texts))
+
+    def classify_error(self, error):
+        if isinstance(error, LibreTranslateError):
+            if error.status == 429:
+                return "rate_limit"
+            if error.status >= 500:
+                return "network"
+            return "api"
+        return super().classify_error(error)
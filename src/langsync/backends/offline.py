@@ -0,0 +1,80 @@
+"""Offline backend for benchmarks and load tests.
+
+Never touches the network: each request sleeps for `latency` ± `jitter`
+seconds, then fails with a simulated 429 or timeout at the configured rates
+(or after `timeout` seconds, when the drawn latency exceeds it)
+or returns a pseudo-translation (lowercase vowels accented, markers and
+packing separators untouched). Seed it for reproducible runs:
+
+    "backend": "offline",
+    "backends": {"offline": {"latency": 0.2, "jitter": 0.05, "rate_limit_rate": 0.02, "seed": 1}}
+"""
+
+import random
+import threading
+import time
+
+from .base import TranslationBackend
+
+_ACCENTS = str.maketrans("aeiou", "áéíóú")
+
+
+class SimulatedRateLimit(Exception):
+    pass
+
+
+class SimulatedTimeout(TimeoutError):
+    pass
+
+
+class OfflineBackend(TranslationBackend):
+    name = "offline"
+    native_batch = True
+    # Pseudo-translations must never end up in the translation memory.
+    cacheable = False
+    accepts_timeout = True
+
+    def __init__(self, source, target, latency=0.05, jitter=0.0, rate_limit_rate=0.0,
+                 timeout_rate=0.0, max_batch_items=None, seed=None, timeout=None, sleep=time.sleep):
+        super().__init__(source, target)
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_rate = rate_limit_rate
+        self.timeout_rate = timeout_rate
+        self.max_batch_items = max_batch_items
+        self.timeout = timeout
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._sleep = sleep
+
+    def _request(self):
+        with self._lock:
+            self.requests += 1
+            delay = max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+            roll = self._random.random()
+        if self.timeout is not None and delay > self.timeout:
+            self._sleep(self.timeout)
+            raise SimulatedTimeout(f"no response within {self.timeout}s (simulated)")
+        if delay:
+            self._sleep(delay)
+        if roll < self.rate_limit_rate:
+            raise SimulatedRateLimit("429 Too Many Requests (simulated)")
+        if roll < self.rate_limit_rate + self.timeout_rate:
+            raise SimulatedTimeout("request timed out (simulated)")
+
+    def _pseudo(self, text):
+        return text.translate(_ACCENTS) if isinstance(text, str) else text
+
+    def translate(self, text):
+        self._request()
+        return self._pseudo(text)
+
+    def translate_batch(self, texts):
+        self._request()
+        return [self._pseudo(text) for text in texts]
+
+    def classify_error(self, error):
+        if isinstance(error, SimulatedRateLimit):
+            return "rate_limit"
+        return super().classify_error(error)
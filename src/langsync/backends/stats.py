@@ -0,0 +1,52 @@
+"""Run-wide per-backend request accounting, shared by every TranslationService."""
+
+import threading
+from collections import Counter
+
+
+class BackendStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rows = {}
+
+    def _row(self, name):
+        row = self._rows.get(name)
+        if row is None:
+            row = self._rows[name] = {
+                "requests": 0, "items": 0, "seconds": 0.0, "errors": Counter(), "failovers": 0,
+            }
+        return row
+
+    def record(self, name, items, seconds, error_kind=None):
+        """One request to `name` carrying `items` strings, taking `seconds`."""
+        with self._lock:
+            row = self._row(name)
+            row["requests"] += 1
+            row["seconds"] += seconds
+            if error_kind is None:
+                row["items"] += items
+            else:
+                row["errors"][error_kind] += 1
+
+    def record_failover(self, name):
+        """A request that `name` could not serve was handed to the next backend."""
+        with self._lock:
+            self._row(name)["failovers"] += 1
+
+    def rows(self):
+        """[(name, requests, items, items_per_second, errors Counter, failovers)]."""
+        with self._lock:
+            return [
+                (
+                    name, row["requests"], row["items"],
+                    row["items"] / row["seconds"] if row["seconds"] else 0.0,
+                    Counter(row["errors"]), row["failovers"],
+                )
+                for name, row in self._rows.items()
+            ]
+
+    @property
+    def troubled(self):
+        """True when any backend saw errors or had to fail over."""
+        with self._lock:
+            return any(row["errors"] or row["failovers"] for row in self._rows.values())
@@ -0,0 +1,76 @@
+"""Adaptive batch sizing.
+
+A static `batch_size` fits neither long marketing paragraphs nor short button
+labels. `AdaptiveBatchSizer` shapes each batch when a worker takes it, capped
+both by item count and by total characters, and adjusts both limits AIMD-style
+from what the translation path observes:
+
+    clean and fast batch       -> additive increase
+    clean but slow batch       -> gentle multiplicative decrease
+    errors or misaligned items -> halve
+
+One sizer is shared by every worker in a run.
+"""
+
+import threading
+
+MIN_BATCH_CHARS = 200
+
+
+class AdaptiveBatchSizer:
+    def __init__(self, initial=25, maximum=100, max_chars=4500, target_latency=3.0, adaptive=True):
+        self.adaptive = adaptive
+        self.maximum = max(1, maximum if adaptive else initial)
+        self.max_chars = max(MIN_BATCH_CHARS, max_chars)
+        self.target_latency = target_latency
+        self.size = max(1, min(initial, self.maximum))
+        self.chars = self.max_chars
+        self._item_step = max(1, initial // 5)
+        self._char_step = max(1, self.max_chars // 10)
+        self._lock = threading.Lock()
+        self.peak_size = self.size
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(
+            initial=config.get('batch_size', 25),
+            maximum=config.get('max_batch_size', 100),
+            max_chars=config.get('max_batch_chars', 4500),
+            target_latency=config.get('batch_target_latency', 3.0),
+            adaptive=config.get('adaptive_batching', True),
+        )
+
+    def take(self, pending):
+        """Pop the next batch of (paths, value) items off the `pending` deque.
+        Always returns at least one item when `pending` is non-empty."""
+        with self._lock:
+            size, chars = self.size, self.chars
+        batch = []
+        used = 0
+        while pending and len(batch) < size:
+            cost = len(pending[0][1]) if isinstance(pending[0][1], str) else 0
+            if batch and self.adaptive and used + cost > chars:
+                break
+            batch.append(pending.popleft())
+            used += cost
+        return batch
+
+    def record(self, latency, items, chars, clean):
+        """Feed back one batch: time its first attempt spent in backend
+        calls, its item and character counts, and whether it succeeded
+        without errors or misaligned items."""
+        if not self.adaptive:
+            return
+        with self._lock:
+            if not clean:
+                self.size = max(1, self.size // 2)
+                self.chars = max(MIN_BATCH_CHARS, self.chars // 2)
+            elif latency > self.target_latency:
+                self.size = max(1, int(self.size * 0.75))
+                self.chars = max(MIN_BATCH_CHARS, int(self.chars * 0.75))
+            elif items >= self.size or chars >= self.chars * 0.8:
+                # Only grow when the batch actually hit a limit; a locale's
+                # short tail says nothing about larger batches.
+                self.size = min(self.maximum, self.size + self._item_step)
+                self.chars = min(self.max_chars, self.chars + self._char_step)
+            self.peak_size = max(self.peak_size, self.size)
@@ -0,0 +1,51 @@
+"""Cooperative cancellation for a sync run.
+
+One `CancelToken` is shared by the scheduler, every TranslationService and the
+retry loop. It trips on Ctrl+C or when the run-wide deadline (`run_timeout`)
+passes. Nothing is killed mid-request: requests already on the wire finish or
+hit their per-request timeout, no new requests go out, and every key that was
+not translated is recorded as failed so the snapshot keeps it pending.
+"""
+
+import threading
+import time
+
+from .errors import TranslationError
+
+CANCELLED = "cancelled"
+
+
+class CancelledError(TranslationError):
+    def __init__(self, reason):
+        super().__init__(f"run cancelled: {reason}", kind=CANCELLED)
+
+
+class CancelToken:
+    def __init__(self, timeout=None, clock=time.monotonic):
+        self._clock = clock
+        self._event = threading.Event()
+        self._deadline = clock() + timeout if timeout else None
+        self.reason = None
+
+    def cancel(self, reason="interrupted"):
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self):
+        if not self._event.is_set() and self._deadline is not None and self._clock() >= self._deadline:
+            self.cancel("run deadline reached")
+        return self._event.is_set()
+
+    def check(self):
+        """Raise CancelledError if the run has been cancelled."""
+        if self.cancelled:
+            raise CancelledError(self.reason)
+
+    def wait(self, seconds):
+        """Sleep up to `seconds`, waking early on cancellation. Returns True if cancelled."""
+        if self._deadline is not None:
+            seconds = min(seconds, max(0.0, self._deadline - self._clock()))
+        self._event.wait(seconds)
+        return self.cancelled
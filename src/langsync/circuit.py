@@ -0,0 +1,160 @@
+"""Cross-worker circuit breaker for translator outages and rate limits.
+
+Without it, every worker walks its own retry loop when the backend starts
+returning 429s or the network is down, so an offline run takes minutes to fail
+and a rate-limited run keeps digging itself deeper. One `CircuitBreaker` is
+shared by every request in the run:
+
+    closed     requests flow; consecutive rate-limit/network failures are counted
+    open       tripped after `threshold` consecutive failures; no requests go out
+    half-open  after `cooldown` seconds a single probe request is let through;
+               success closes the circuit, failure re-opens it with a longer cooldown
+
+While open, callers either *pause* (the circuit tripped on rate limits, which
+are transient) until the probe succeeds, or *fail fast* with CircuitOpenError
+(network outages, or rate limits that kept tripping for `max_trips` rounds).
+"""
+
+import threading
+import time
+
+from .errors import TranslationError
+
+CIRCUIT_OPEN = "circuit_open"
+
+# Only these failure kinds say something about backend health; API errors for a
+# single malformed string must not trip the breaker.
+TRIPPING_KINDS = ("rate_limit", "network")
+
+# Longest a paused caller sleeps before re-checking its CancelToken.
+CANCEL_POLL = 0.2
+
+
+class CircuitOpenError(TranslationError):
+    def __init__(self, message, cause_kind):
+        super().__init__(message, kind=CIRCUIT_OPEN)
+        self.cause_kind = cause_kind
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, threshold=5, cooldown=10.0, max_cooldown=60.0, max_trips=3,
+                 clock=time.monotonic):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.max_trips = max_trips
+        self._clock = clock
+        self._cond = threading.Condition()
+        self.state = self.CLOSED
+        self._failures = 0
+        self._trips = 0  # consecutive openings without an intervening success
+        self._cause = None
+        self._reopen_at = 0.0
+        self.total_trips = 0
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(
+            threshold=config.get('circuit_breaker_threshold', 5),
+            cooldown=config.get('circuit_breaker_cooldown', 10.0),
+        )
+
+    @property
+    def enabled(self):
+        return bool(self.threshold)
+
+    def _fail_fast(self):
+        return self._cause != "rate_limit" or self._trips >= self.max_trips
+
+    def _error(self):
+        return CircuitOpenError(
+            f"circuit open after repeated {self._cause} errors; request skipped",
+            cause_kind=self._cause,
+        )
+
+    def allows_request(self):
+        """Non-blocking check: would a request go out right now? Used to skip a
+        backend with an open circuit when a fallback is available."""
+        if not self.enabled:
+            return True
+        with self._cond:
+            if self.state == self.CLOSED:
+                return True
+            return self.state == self.OPEN and self._clock() >= self._reopen_at
+
+    def before_call(self, cancel=None):
+        """Block or raise CircuitOpenError if requests are not currently allowed.
+        Returns True when this caller is the half-open probe; it must then
+        report an outcome, or call `release_probe` if it never sends.
+
+        With a CancelToken, a paused caller wakes up at least every
+        CANCEL_POLL seconds and raises CancelledError once the run is cancelled."""
+        if not self.enabled:
+            return False
+        with self._cond:
+            while True:
+                if cancel is not None:
+                    cancel.check()
+                if self.state == self.CLOSED:
+                    return False
+                if self.state == self.OPEN:
+                    remaining = self._reopen_at - self._clock()
+                    if remaining <= 0:
+                        # This caller becomes the probe.
+                        self.state = self.HALF_OPEN
+                        return True
+                    if self._fail_fast():
+                        raise self._error()
+                    self._cond.wait(remaining if cancel is None else min(remaining, CANCEL_POLL))
+                    continue
+                # HALF_OPEN: a probe is in flight.
+                if self._fail_fast():
+                    raise self._error()
+                self._cond.wait(1.0 if cancel is None else CANCEL_POLL)
+
+    def release_probe(self):
+        """Hand back a probe that was never sent (e.g. the run was cancelled
+        while it waited for the rate limiter): the circuit re-opens with its
+        cooldown already elapsed, so the next caller probes instead."""
+        if not self.enabled:
+            return
+        with self._cond:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+                self._reopen_at = self._clock()
+                self._cond.notify_all()
+
+    def record_success(self):
+        if not self.enabled:
+            return
+        with self._cond:
+            self._failures = 0
+            self._trips = 0
+            if self.state != self.CLOSED:
+                self.state = self.CLOSED
+                self._cond.notify_all()
+
+    def record_failure(self, kind):
+        if not self.enabled:
+            return
+        if kind not in TRIPPING_KINDS:
+            # The backend answered, so it is reachable — as good as a success
+            # for the breaker (and it must release a half-open probe).
+            self.record_success()
+            return
+        with self._cond:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or (
+                self.state == self.CLOSED and self._failures >= self.threshold
+            ):
+                self._trips += 1
+                self.total_trips += 1
+                self._cause = kind
+                cooldown = min(self.cooldown * (2 ** (self._trips - 1)), self.max_cooldown)
+                self._reopen_at = self._clock() + cooldown
+                self.state = self.OPEN
+                self._cond.notify_all()
@@ -2,27 +2,44 @@ import os
 import sys
 import json
 import click
+import functools
 import time
 import signal
-from collections import Counter
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from rich.console import Console
+import threading
+from collections import Counter, deque
+from rich.console import Console, Group
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
 from rich.table import Table
 from rich.panel import Panel
 from rich.json import JSON
-
-from .translator import TranslationService, TranslationError, get_translator_code
-from .processor import LocaleProcessor
-from .config import load_config, GLOBAL_CONFIG_PATH, LOCAL_CONFIG_NAMES, get_default_config, save_config
+from rich.text import Text
+
+from .backends import DEFAULT_BACKEND, BackendCache, create_backend, get_backend
+from .backends.stats import BackendStats
+from .translator import ProtectionTable, TranslationService, TranslationError, get_translator_code
+from .processor import LocaleProcessor, SourceIndex
+from .matrix import CHANGED, MISSING, ORPHAN, StatusMatrix
+from .config import (
+    load_config, GLOBAL_CONFIG_PATH, LOCAL_CONFIG_NAMES, MAX_WORKERS_PER_LOCALE, get_default_config, save_config,
+)
 from .state import (
     STATE_FILENAME,
     compute_source_hashes,
     default_state_path,
-    load_state,
+    file_fingerprint,
+    fingerprint_matches,
     path_to_key,
+    read_state,
     save_state,
+    settle_fingerprint,
 )
+from .memory import TranslationMemory, default_memory_path
+from .batching import AdaptiveBatchSizer
+from .cancel import CANCELLED, CancelToken, CancelledError
+from .circuit import CIRCUIT_OPEN, CircuitBreaker
+from .ratelimit import RateLimiter
+from .scheduler import AdaptiveConcurrency, BatchScheduler
+from .singleflight import SingleFlight
 from .git_baseline import find_baseline_source, is_inside_git_repo
 from .update_check import start_update_check
 from . import __version__
@@ -30,9 +47,21 @@ from . import __version__
 console = Console()
 
 
-def handle_sigint(signum, frame):
-    """Gracefully handle Ctrl+C."""
+def handle_sigint(signum, frame, cancel=None):
+    """Gracefully handle Ctrl+C. During a sync the first one cancels the run
+    cooperatively (finished translations and the snapshot are still written);
+    a second one quits immediately."""
+    if cancel is not None and not cancel.cancelled:
+        cancel.cancel("interrupted")
+        console.print(
+            "\n[bold yellow]⏹ Cancelling — waiting for in-flight requests, then saving progress. "
+            "Press Ctrl+C again to quit now.[/bold yellow]"
+        )
+        return
     console.print("\n[bold red]✖ Interrupted by user. Exiting...[/bold red]")
+    if cancel is not None:
+        # Worker threads may be blocked on the network; don't wait for them.
+        os._exit(130)
     sys.exit(0)
 
 
@@ -42,7 +71,7 @@ class LocaleResult:
     __slots__ = (
         "locale", "translated", "copied", "failed", "pruned",
         "missing_count", "changed_count", "orphan_count", "unchanged_count",
-        "issues", "failed_paths",
+        "deduped", "misaligned", "issues", "failed_paths", "skipped", "unsent",
     )
 
     def __init__(self, locale):
@@ -55,16 +84,43 @@ class LocaleResult:
         self.changed_count = 0
         self.orphan_count = 0
         self.unchanged_count = 0
+        self.deduped = 0  # translator requests saved by collapsing identical source values
+        self.misaligned = 0  # packed segments that could not be split back and were retried alone
         self.issues = []  # list of (kind, message)
         self.failed_paths = set()  # dotted-path strings the run could not sync
+        self.skipped = False  # unchanged since the last sync; not parsed or classified
+        # kind -> [keys, reason, index of its line in `issues`] for keys never
+        # sent (open circuit, cancelled run): one issue line per kind.
+        self.unsent = {}
 
     def add_issue(self, kind, message):
         self.issues.append((kind, message))
 
+    def add_unsent(self, kind, keys, reason):
+        entry = self.unsent.get(kind)
+        if entry is None:
+            entry = self.unsent[kind] = [0, reason, len(self.issues)]
+            self.issues.append(None)
+        entry[0] += keys
+        self.issues[entry[2]] = (kind, f"{entry[0]} key(s) not sent ({entry[1]})")
+
     def mark_failed(self, path):
         self.failed += 1
         self.failed_paths.add(path_to_key(path))
 
+    def mark_group_failed(self, paths):
+        for path in paths:
+            self.mark_failed(path)
+
+    def merge(self, other):
+        """Fold a per-batch result into this one (failures and issues only)."""
+        self.failed += other.failed
+        self.failed_paths.update(other.failed_paths)
+        unsent_lines = {index for _, _, index in other.unsent.values()}
+        self.issues.extend(issue for i, issue in enumerate(other.issues) if i not in unsent_lines)
+        for kind, (keys, reason, _) in other.unsent.items():
+            self.add_unsent(kind, keys, reason)
+
     @property
     def status(self):
         if self.failed and self.translated == 0 and self.copied == 0 and self.pruned == 0:
@@ -80,121 +136,296 @@ def _format_path(path):
     return ".".join(str(p) for p in path)
 
 
-def _translate_with_fallback(translator_service, batch, retry_count, delay, result, progress, locale_task_id, verbose):
-    """Translate a batch. If batch fails, fall back to per-item translation.
-    Mutates `result` (counts + issues). Returns list of (path, translated_value)
-    for successfully translated items.
+def _format_group(paths):
+    """Label for a deduplicated item: its first path, plus how many share it."""
+    label = _format_path(paths[0])
+    if len(paths) > 1:
+        label += f" (+{len(paths) - 1})"
+    return label
+
+
+def _dedupe_translatable(translatable):
+    """Collapse identical source values into one translator request each.
+
+    Returns [(paths, value)] in first-seen order, where `paths` lists every
+    key that shares the value and receives the same translation.
     """
-    paths = [item[0] for item in batch]
-    values = [item[1] for item in batch]
+    groups = {}
+    for path, value in translatable:
+        groups.setdefault(value, []).append(path)
+    return [(paths, value) for value, paths in groups.items()]
+
+
+def _record_item_failure(result, paths, error):
+    result.mark_group_failed(paths)
+    # An open circuit or a cancelled run fails every pending item the same way;
+    # one line per kind is enough.
+    if error.kind in (CIRCUIT_OPEN, CANCELLED):
+        result.add_unsent(error.kind, len(paths), str(error))
+        return
+    result.add_issue(error.kind, f"'{_format_group(paths)}': {error}")
+
+
+def _backoff(translator_service, seconds):
+    """Sleep between retries, cut short if the run is cancelled."""
+    cancel = getattr(translator_service, "cancel", None)
+    if cancel is not None:
+        cancel.wait(seconds)
+    else:
+        time.sleep(seconds)
 
-    translated_values = None
-    last_batch_error = None
 
+def _attempt_batch(translator_service, values, attempts, delay):
+    """Send `values` as one batch, retrying up to `attempts` times.
+    Returns (translated_values or None, last_error). `last_error` is also set
+    when a retry eventually succeeded, so callers can see the batch was throttled."""
+    cool_down = getattr(translator_service, "cool_down", None)
     current_delay = delay
-    for attempt in range(retry_count):
+    last_error = None
+    for attempt in range(attempts):
         try:
             translated_values = translator_service.translate_batch(values, current_delay)
             if translated_values and len(translated_values) == len(values):
-                break
+                return translated_values, last_error
         except Exception as e:
-            last_batch_error = e
+            last_error = e
+            if getattr(e, "kind", None) in (CIRCUIT_OPEN, CANCELLED):
+                # The backend is down or throttling everyone, or the run is
+                # being cancelled; don't retry.
+                break
+            if attempt == attempts - 1:
+                break
             if "RATE_LIMIT_HIT" in str(e):
                 cooldown = 2 * (attempt + 1)
-                time.sleep(cooldown)
-                current_delay = min(current_delay * 2, 2.0)
+                # Back off as a whole run rather than per thread.
+                if not (cool_down is not None and cool_down(cooldown)):
+                    _backoff(translator_service, cooldown)
+                    current_delay = min(current_delay * 2, 2.0)
             else:
-                time.sleep(1 * (attempt + 1))
-            translated_values = None
-
-    succeeded = []
+                _backoff(translator_service, 1 * (attempt + 1))
+    return None, last_error
+
+
+def _describe_batch_error(error):
+    """(kind, message) for the issue recorded when a whole batch fails."""
+    if error and "RATE_LIMIT_HIT" in str(error):
+        return "rate_limit", "rate limit exceeded"
+    if isinstance(error, TranslationError):
+        return error.kind, str(error)
+    if error:
+        return "unknown", str(error)
+    return "unknown", "batch translation failed"
+
+
+class _BatchRun:
+    """State shared while translating one scheduled batch and its bisections."""
+
+    def __init__(self, translator_service, delay, progress, locale_task_id, verbose, parallel, slots=None):
+        self.service = translator_service
+        self.delay = delay
+        self.progress = progress
+        self.task_id = locale_task_id
+        self.verbose = verbose
+        self.parallel = parallel
+        # Extra threads parallel bisection may run at once; shared run-wide
+        # when given, so nested halves can't multiply threads per level.
+        if parallel and slots is None:
+            slots = threading.BoundedSemaphore(MAX_WORKERS_PER_LOCALE)
+        self.slots = slots
+        # Feedback for the batch sizer and concurrency controller, taken from
+        # the top-level attempt only.
+        self.first_latency = None
+        self.clean = True
+        self.error_kind = None
+
+    def report(self, result, paths, trans_val):
+        if self.verbose:
+            self.progress.console.print(
+                rf"[dim]\[{result.locale}][/dim] Translated [blue]{_format_group(paths)}[/blue] -> [italic]{trans_val}[/italic]"
+            )
 
-    if translated_values and len(translated_values) == len(values):
-        per_item_failures = []
-        for path, src_val, trans_val in zip(paths, values, translated_values):
-            if trans_val is None or trans_val == "":
-                per_item_failures.append((path, src_val))
-            else:
-                succeeded.append((path, trans_val))
-                progress.update(locale_task_id, advance=1)
-                if verbose:
-                    progress.console.print(
-                        rf"[dim]\[{result.locale}][/dim] Translated [blue]{_format_path(path)}[/blue] -> [italic]{trans_val}[/italic]"
-                    )
-
-        if per_item_failures:
-            for path, src_val in per_item_failures:
-                try:
-                    trans_val = translator_service.translate_one(src_val, delay=current_delay)
-                    if trans_val and trans_val != src_val:
-                        succeeded.append((path, trans_val))
-                        if verbose:
-                            progress.console.print(
-                                rf"[dim]\[{result.locale}][/dim] Translated [blue]{_format_path(path)}[/blue] -> [italic]{trans_val}[/italic]"
-                            )
-                    else:
-                        result.mark_failed(path)
-                        result.add_issue("empty", f"empty response for '{_format_path(path)}'")
-                except TranslationError as e:
-                    result.mark_failed(path)
-                    result.add_issue(e.kind, f"'{_format_path(path)}': {e}")
-                finally:
-                    progress.update(locale_task_id, advance=1)
-        return succeeded
-
-    # Batch failed entirely after retries — fall back to per-item.
-    err_kind = "unknown"
-    err_msg = "batch translation failed"
-    if isinstance(last_batch_error, TranslationError):
-        err_kind = last_batch_error.kind
-        err_msg = str(last_batch_error)
-    elif last_batch_error and "RATE_LIMIT_HIT" in str(last_batch_error):
-        err_kind = "rate_limit"
-        err_msg = "rate limit exceeded"
-    elif last_batch_error:
-        err_msg = str(last_batch_error)
-
-    result.add_issue(err_kind, f"batch of {len(values)} fell back to single-item ({err_msg})")
-
-    for path, src_val in zip(paths, values):
+    def leaf(self, item, result, succeeded):
+        """Last resort for a single item: one translate_one call."""
+        paths, src_val = item
         try:
-            trans_val = translator_service.translate_one(src_val, delay=current_delay)
+            trans_val = self.service.translate_one(src_val, delay=self.delay)
             if trans_val and trans_val != src_val:
-                succeeded.append((path, trans_val))
-                if verbose:
-                    progress.console.print(
-                        rf"[dim]\[{result.locale}][/dim] Translated [blue]{_format_path(path)}[/blue] -> [italic]{trans_val}[/italic]"
-                    )
+                succeeded.append((paths, trans_val))
+                self.report(result, paths, trans_val)
             else:
-                result.mark_failed(path)
-                result.add_issue("empty", f"empty response for '{_format_path(path)}'")
+                result.mark_group_failed(paths)
+                result.add_issue("empty", f"empty response for '{_format_group(paths)}'")
         except TranslationError as e:
-            result.mark_failed(path)
-            result.add_issue(e.kind, f"'{_format_path(path)}': {e}")
+            _record_item_failure(result, paths, e)
         finally:
-            progress.update(locale_task_id, advance=1)
+            self.progress.update(self.task_id, advance=len(paths))
+
+    def fail_all(self, items, result, error):
+        # Record the keys as failed so the snapshot keeps them pending.
+        for paths, _ in items:
+            result.mark_group_failed(paths)
+            self.progress.update(self.task_id, advance=len(paths))
+        kind, msg = _describe_batch_error(error)
+        if kind in (CIRCUIT_OPEN, CANCELLED):
+            result.add_unsent(kind, sum(len(paths) for paths, _ in items), msg)
+        else:
+            result.add_issue(kind, f"batch of {len(items)} skipped ({msg})")
+
+    def solve(self, items, attempts, result, succeeded):
+        values = [value for _, value in items]
+        # Time spent in backend calls only: limiter waits and retry backoff
+        # say nothing about how large a batch the backend handles well.
+        call_seconds = getattr(self.service, "call_seconds", time.monotonic)
+        started = call_seconds()
+        translated_values, error = _attempt_batch(self.service, values, attempts, self.delay)
+        if self.first_latency is None:
+            self.first_latency = call_seconds() - started
+            self.clean = translated_values is not None and all(translated_values)
+            if error is not None:
+                self.error_kind = _describe_batch_error(error)[0]
+
+        if getattr(error, "kind", None) in (CIRCUIT_OPEN, CANCELLED):
+            self.fail_all(items, result, error)
+            return
+
+        if translated_values is None:
+            if error is not None and _describe_batch_error(error)[0] != "api":
+                # Throttled or unreachable: smaller batches won't help and
+                # would only multiply requests. Keep the keys pending.
+                self.fail_all(items, result, error)
+                return
+            if len(items) == 1:
+                self.leaf(items[0], result, succeeded)
+                return
+            if attempts > 1:
+                kind, msg = _describe_batch_error(error)
+                result.add_issue(kind, f"batch of {len(items)} failed, bisecting to isolate bad items ({msg})")
+            self.bisect(items, result, succeeded)
+            return
+
+        retry = []
+        for item, trans_val in zip(items, translated_values):
+            paths = item[0]
+            if trans_val is None or trans_val == "":
+                retry.append(item)
+            else:
+                succeeded.append((paths, trans_val))
+                self.progress.update(self.task_id, advance=len(paths))
+                self.report(result, paths, trans_val)
+
+        if len(retry) == 1:
+            self.leaf(retry[0], result, succeeded)
+        elif retry:
+            self.bisect(retry, result, succeeded)
+
+    def bisect(self, items, result, succeeded):
+        """Retry each half as its own batch. Halves always shrink, so a poisoned
+        item is isolated in O(log n) batch requests before going per-item."""
+        mid = len(items) // 2
+        left, right = items[:mid], items[mid:]
+        if not self.parallel:
+            self.solve(left, 1, result, succeeded)
+            self.solve(right, 1, result, succeeded)
+            return
+
+        if not self.slots.acquire(blocking=False):
+            # Every spare thread is busy: solve this level inline.
+            self.solve(left, 1, result, succeeded)
+            self.solve(right, 1, result, succeeded)
+            return
 
+        left_result = LocaleResult(result.locale)
+        left_succeeded = []
+
+        def solve_left():
+            try:
+                self.solve(left, 1, left_result, left_succeeded)
+            finally:
+                self.slots.release()
+
+        worker = threading.Thread(target=solve_left, daemon=True)
+        worker.start()
+        self.solve(right, 1, result, succeeded)
+        worker.join()
+        result.merge(left_result)
+        succeeded.extend(left_succeeded)
+
+
+def _translate_with_fallback(translator_service, batch, retry_count, delay, result, progress, locale_task_id,
+                             verbose, parallel_bisection=False, sizer=None, concurrency=None,
+                             bisection_slots=None):
+    """Translate a batch. If it keeps failing, bisect it: retry each half as a
+    batch and only fall back to per-item calls at the leaves.
+    Each batch item is (paths, value): every path in `paths` shares the source
+    value and receives the same translation. Mutates `result` (counts + issues).
+    Returns list of (paths, translated_value) for successfully translated items.
+    When `sizer` or `concurrency` is given, the batch's latency and outcome are
+    fed back to it. `bisection_slots` is a semaphore bounding the extra threads
+    parallel bisection may start.
+    """
+    run = _BatchRun(translator_service, delay, progress, locale_task_id, verbose, parallel_bisection,
+                    bisection_slots)
+    succeeded = []
+    run.solve(list(batch), max(1, retry_count), result, succeeded)
+    # Batches failed fast behind an open circuit or a cancel never reached
+    # the backend, so they say nothing about the batch size.
+    if sizer is not None and run.first_latency is not None and run.error_kind not in (CIRCUIT_OPEN, CANCELLED):
+        chars = sum(len(value) for _, value in batch if isinstance(value, str))
+        sizer.record(run.first_latency, len(batch), chars, run.clean)
+    if concurrency is not None:
+        concurrency.record(len(batch), run.error_kind)
     return succeeded
 
 
-def process_locale(
+def _route_for(config, lang_code):
+    """Ordered backend names for a translator language code, primary first."""
+    return config.get('routes', {}).get(lang_code) or [config.get('backend', DEFAULT_BACKEND)]
+
+
+def prepare_locale(
     locale, source_data, messages_dir, progress, main_task_id, config,
     *, snapshot_hashes, rewrite=False, prune=False, update_changed=False,
-    dry_run=False, verbose=False,
+    dry_run=False, verbose=False, memory=None, flights=None, limiter=None, breaker=None,
+    protections=None, breakers=None, stats=None, backend_cache=None, cancel=None, limiters=None,
+    source_index=None, matrix=None, fingerprint=None,
 ):
+    """Load and classify one locale, apply copies and pruning, and package any
+    translation work as a LocaleJob for the scheduler.
+
+    Returns (result, job). `job` is None when the locale is already finished
+    (dry run, nothing to translate, or an error) — its file, if any, has been
+    written and the main progress bar advanced.
+
+    `fingerprint` is the locale's entry from the snapshot, passed only when the
+    source file is unchanged since it was recorded. If the locale file still
+    matches it too, the locale is reported as up to date without being read.
+    """
     result = LocaleResult(locale)
     target_file = os.path.join(messages_dir, f"{locale}.json")
 
+    if fingerprint is not None and not (prune and fingerprint.get("orphans")) \
+            and fingerprint_matches(target_file, fingerprint):
+        orphans = fingerprint.get("orphans") or []
+        result.skipped = True
+        result.unchanged_count = len(source_index) if source_index is not None else 0
+        result.orphan_count = len(orphans)
+        if matrix is not None:
+            matrix.record_unchanged(locale, orphans)
+        if verbose:
+            progress.console.print(rf"[dim]\[{locale}] unchanged since the last sync — skipped[/dim]")
+        progress.update(main_task_id, advance=1)
+        return result, None
+
     try:
         target_data = LocaleProcessor.load_json(target_file)
     except json.JSONDecodeError as e:
         result.add_issue("io", f"{target_file} is not valid JSON ({e.msg}); skipping locale")
         progress.update(main_task_id, advance=1)
-        return result
+        return result, None
     except OSError as e:
         result.add_issue("io", f"failed to read {target_file}: {e}")
         progress.update(main_task_id, advance=1)
-        return result
+        return result, None
 
     if not isinstance(target_data, dict):
         result.add_issue(
@@ -203,14 +434,16 @@ def process_locale(
             f"(found {type(target_data).__name__}); skipping locale",
         )
         progress.update(main_task_id, advance=1)
-        return result
+        return result, None
 
-    processor = LocaleProcessor(source_data)
+    processor = LocaleProcessor(source_data, index=source_index)
     classification = processor.classify_keys(
         target_data,
         snapshot_hashes=snapshot_hashes,
         force_rewrite=rewrite,
     )
+    if matrix is not None:
+        matrix.record(locale, classification)
 
     missing_translatable = classification["missing_translatable"]
     missing_passthrough = classification["missing_passthrough"]
@@ -252,7 +485,7 @@ def process_locale(
                     rf"[dim]\[{locale}][/dim] [bright_black]Orphan:[/bright_black] [blue]{_format_path(path)}[/blue]"
                 )
         progress.update(main_task_id, advance=1)
-        return result
+        return result, None
 
     # Apply pass-through copies — no API calls needed.
     for path, val in passthrough:
@@ -270,50 +503,214 @@ def process_locale(
         except Exception as e:
             result.add_issue("io", f"failed to write {target_file}: {e}")
         progress.update(main_task_id, advance=1)
-        return result
+        return result, None
 
     lang_code = get_translator_code(locale)
     try:
-        translator_service = TranslationService(target_lang=lang_code, whitelist=config.get('whitelist'))
+        # Reuse the run's instance (and its pooled connections) when another
+        # locale already maps to this language code.
+        backends = [
+            backend_cache.get(name, 'en', lang_code) if backend_cache is not None
+            else create_backend(name, 'en', lang_code, config.get('backends', {}).get(name))
+            for name in _route_for(config, lang_code)
+        ]
+        translator_service = TranslationService(
+            target_lang=lang_code, whitelist=config.get('whitelist'),
+            backends=backends, breakers=breakers, stats=stats,
+            memory=memory, flights=flights,
+            pack=config.get('pack_batches', True),
+            limiter=limiter, limiters=limiters, breaker=breaker, protections=protections, cancel=cancel,
+        )
     except Exception as e:
         for path, _ in translatable:
             result.failed_paths.add(path_to_key(path))
         result.failed = len(translatable)
         result.add_issue("init", f"could not init translator for '{lang_code}': {e}")
         progress.update(main_task_id, advance=1)
-        return result
+        return result, None
+
+    # Send each distinct source value once and fan the result out to every key.
+    unique = _dedupe_translatable(translatable)
+    result.deduped = len(translatable) - len(unique)
+    if protections is not None:
+        # Values already protected for an earlier locale are just table lookups.
+        protections.precompute(value for _, value in unique)
+
+    job = LocaleJob(result, target_file, target_data, translator_service, unique, total=len(translatable))
+    return result, job
+
+
+class LocaleJob:
+    """A locale with translation work queued in the BatchScheduler. Batches are
+    cut from `items` when a worker takes them, sized by the run's batch sizer."""
+
+    def __init__(self, result, target_file, target_data, service, items, total):
+        self.result = result
+        self.target_file = target_file
+        self.target_data = target_data
+        self.service = service
+        self.total = total  # keys to translate, for the progress bar
+        self.task_id = None
+        self.sizer = None  # AdaptiveBatchSizer, assigned by run_jobs
+        self.lock = threading.Lock()
+        self._pending = deque(items)
+        self._in_flight = 0
+
+    @property
+    def locale(self):
+        return self.result.locale
+
+    def next_batch(self):
+        with self.lock:
+            if not self._pending:
+                return None
+            self._in_flight += 1
+            cancel = getattr(self.service, "cancel", None)
+            if cancel is not None and cancel.cancelled:
+                # Hand out everything left as one unit; it is failed unsent.
+                batch = list(self._pending)
+                self._pending.clear()
+                return batch
+            return self.sizer.take(self._pending)
+
+    def finish_batch(self, batch_result, succeeded):
+        """Merge a finished batch. Returns True when it was the locale's last."""
+        with self.lock:
+            self.result.merge(batch_result)
+            for paths, trans_val in succeeded:
+                for path in paths:
+                    LocaleProcessor.set_value_by_path(self.target_data, path, trans_val)
+                    self.result.translated += 1
+            self._in_flight -= 1
+            return not self._pending and self._in_flight == 0
+
+
+def _finalize_locale(job, progress, main_task_id):
+    job.result.misaligned = getattr(job.service, "misaligned", 0)
+    try:
+        LocaleProcessor.save_json(job.target_file, job.target_data)
+    except Exception as e:
+        job.result.add_issue("io", f"failed to write {job.target_file}: {e}")
+    if job.task_id is not None:
+        progress.remove_task(job.task_id)
+    progress.update(main_task_id, advance=1)
+
 
-    batch_size = config.get('batch_size', 25)
+def run_jobs(jobs, workers, progress, main_task_id, config, verbose=False, sizer=None, concurrency=None):
+    """Translate every queued batch across `workers` shared threads. Each
+    locale's file is written as soon as its last batch completes. With an
+    AdaptiveConcurrency `concurrency`, it decides how many of the threads run."""
+    sizer = sizer or AdaptiveBatchSizer.from_config(config)
     delay = config.get('delay_between_requests', 0.2)
     retry_count = config.get('retry_count', 3)
+    parallel_bisection = config.get('parallel_bisection', False)
+    # Bisection threads share the run's thread budget instead of adding one per level.
+    bisection_slots = threading.BoundedSemaphore(workers) if parallel_bisection else None
+
+    def run_unit(job, batch):
+        with job.lock:
+            if job.task_id is None:
+                job.task_id = progress.add_task(f"[cyan]{job.locale}", total=job.total)
+        batch_result = LocaleResult(job.locale)
+        cancel = getattr(job.service, "cancel", None)
+        if cancel is not None and cancel.cancelled:
+            # Keep draining so every locale is finalized, but send nothing.
+            _BatchRun(job.service, delay, progress, job.task_id, verbose, False).fail_all(
+                batch, batch_result, CancelledError(cancel.reason),
+            )
+            if job.finish_batch(batch_result, []):
+                _finalize_locale(job, progress, main_task_id)
+            return
+        try:
+            succeeded = _translate_with_fallback(
+                job.service, batch, retry_count, delay, batch_result,
+                progress, job.task_id, verbose, parallel_bisection, sizer, concurrency,
+                bisection_slots,
+            )
+        except Exception as e:
+            succeeded = []
+            for paths, _ in batch:
+                batch_result.mark_group_failed(paths)
+            batch_result.add_issue("crash", f"batch worker crashed: {e}")
+        if job.finish_batch(batch_result, succeeded):
+            _finalize_locale(job, progress, main_task_id)
 
-    locale_task_id = progress.add_task(f"[cyan]{locale}", total=len(translatable))
+    scheduler = BatchScheduler(workers, gate=concurrency)
+    for job in jobs:
+        job.sizer = sizer
+        scheduler.add(job)
+    scheduler.run(run_unit)
 
-    batches = [translatable[i:i + batch_size] for i in range(0, len(translatable), batch_size)]
 
-    for batch in batches:
-        succeeded = _translate_with_fallback(
-            translator_service, batch, retry_count, delay, result,
-            progress, locale_task_id, verbose,
+def process_locale(
+    locale, source_data, messages_dir, progress, main_task_id, config, **kwargs
+):
+    """Sync a single locale end to end, running its batches on up to
+    `max_workers_per_locale` threads. Keyword arguments match prepare_locale."""
+    result, job = prepare_locale(
+        locale, source_data, messages_dir, progress, main_task_id, config, **kwargs
+    )
+    if job is not None:
+        run_jobs(
+            [job], config.get('max_workers_per_locale', 5), progress, main_task_id,
+            config, verbose=kwargs.get('verbose', False),
         )
-        for path, trans_val in succeeded:
-            LocaleProcessor.set_value_by_path(target_data, path, trans_val)
-            result.translated += 1
+    return result
 
-    try:
-        LocaleProcessor.save_json(target_file, target_data)
-    except Exception as e:
-        result.add_issue("io", f"failed to write {target_file}: {e}")
 
-    progress.remove_task(locale_task_id)
-    progress.update(main_task_id, advance=1)
-    return result
+def _locale_fingerprints(results, previous, messages_dir, matrix, *, prune, update_changed):
+    """Fingerprints to store for locales that are fully in sync after this run.
+    Skipped locales and ones outside this run keep their `previous` entry,
+    with a stable mtime filled in once one can be recorded."""
+    fingerprints = dict(previous)
+    for r in results:
+        if r.skipped:
+            settled = settle_fingerprint(os.path.join(messages_dir, f"{r.locale}.json"), previous[r.locale])
+            if settled is not None:
+                fingerprints[r.locale] = settled
+            continue
+        fingerprints.pop(r.locale, None)
+        # --update-changed leaves missing keys untranslated, so the file is not in sync.
+        if r.failed or r.issues or (update_changed and r.missing_count):
+            continue
+        try:
+            entry = file_fingerprint(os.path.join(messages_dir, f"{r.locale}.json"))
+        except OSError:
+            continue
+        entry['orphans'] = [] if prune else matrix.orphans.get(r.locale, [])
+        fingerprints[r.locale] = entry
+    return fingerprints
 
 
-def _render_issues_panel(results):
-    """Build a clean panel summarizing issues per locale, or return None if all clean."""
+def _render_backend_table(backend_stats, breakers=None):
+    breakers = breakers or {}
+    table = Table(box=None, header_style="bold underline white", expand=True)
+    table.add_column("Backend", style="cyan", no_wrap=True)
+    table.add_column("Requests", justify="right")
+    table.add_column("Items/s", justify="right")
+    table.add_column("Errors", style="yellow")
+    table.add_column("Failed over", style="magenta", justify="right")
+    table.add_column("Circuit trips", style="red", justify="right")
+    for name, requests, items, rate, errors, failovers in sorted(backend_stats.rows()):
+        trips = breakers[name].total_trips if name in breakers else 0
+        table.add_row(
+            name,
+            str(requests),
+            f"{rate:.1f}" if items else "—",
+            ", ".join(f"{k} x{v}" for k, v in errors.most_common()) or "—",
+            str(failovers) if failovers else "—",
+            str(trips) if trips else "—",
+        )
+    return table
+
+
+def _render_issues_panel(results, backend_stats=None, breakers=None):
+    """Build a clean panel summarizing issues per locale (and per backend, when
+    any backend errored or failed over, with how often each backend's circuit
+    breaker in `breakers` opened), or return None if all clean."""
     locales_with_issues = [r for r in results if r.issues or r.failed]
-    if not locales_with_issues:
+    show_backends = backend_stats is not None and backend_stats.troubled
+    if not locales_with_issues and not show_backends:
         return None
 
     table = Table(box=None, header_style="bold underline white", expand=True)
@@ -340,8 +737,20 @@ def _render_issues_panel(results):
 
     hints = []
     all_kinds = Counter(k for r in locales_with_issues for k, _ in r.issues)
-    if all_kinds.get("rate_limit"):
-        hints.append("• Rate-limited by Google Translate — increase `delay_between_requests` or lower `max_parallel_locales`.")
+    throttled = sorted(
+        name for name, _, _, _, errors, _ in (backend_stats.rows() if backend_stats is not None else ())
+        if errors.get("rate_limit")
+    )
+    if all_kinds.get("rate_limit") or throttled:
+        who = ", ".join(f"`{name}`" for name in throttled) or "the translation backend"
+        hints.append(
+            f"• Rate-limited by {who} — lower `requests_per_second` / `characters_per_second` "
+            "(or `rate_limits_per_language`), or add a fallback backend under `routes`."
+        )
+    if all_kinds.get(CIRCUIT_OPEN):
+        hints.append("• The circuit breaker opened after repeated rate-limit/network errors — pending keys were skipped and will be retried on the next run.")
+    if all_kinds.get(CANCELLED):
+        hints.append("• The run was cancelled (Ctrl+C or `run_timeout`) — untranslated keys were left pending and will be retried on the next run.")
     if all_kinds.get("network"):
         hints.append("• Network errors detected — check your connection and re-run; failed keys will be retried.")
     if all_kinds.get("api"):
@@ -352,10 +761,15 @@ def _render_issues_panel(results):
         hints.append("• File I/O issues — verify the locale file is writable and not held open elsewhere.")
     hint_text = "\n".join(hints)
 
-    panel_body = table
+    parts = [table] if locales_with_issues else []
+    if show_backends:
+        if parts:
+            parts.append(Text(""))
+        parts.append(_render_backend_table(backend_stats, breakers))
+    panel_body = Group(*parts)
     if hint_text:
         return Panel.fit(
-            table,
+            panel_body,
             title="[bold yellow]⚠ Issues encountered[/bold yellow]",
             border_style="yellow",
             subtitle=hint_text,
@@ -391,9 +805,12 @@ def _print_update_banner(update_info):
 @click.option('--prune', is_flag=True, help='Remove orphan keys (present in target locales but absent from source). Without it, orphans are reported but left in place.')
 @click.option('--dry-run', is_flag=True, help='Classify keys and print what would change, without writing files or calling the translator.')
 @click.option('--check', is_flag=True, help='Like --dry-run, but exit with code 1 if any locale has missing, changed, or orphan keys. Useful in CI.')
+@click.option('--backend', help='Translation backend to use for this run (overrides "backend" in langsync.json), e.g. "offline" for benchmarks.')
+@click.option('--report', type=click.Path(dir_okay=False), help='Write the key × locale status matrix (missing/changed/orphan per locale) to this file: JSON, or CSV if it ends in .csv. Works with --dry-run and --check.')
+@click.option('--no-memory', is_flag=True, help='Bypass the on-disk translation memory: always call the translator and do not record results.')
 @click.option('-v', '--verbose', is_flag=True, help='Print each translation, copy, and orphan path as it is processed.')
 @click.version_option(__version__, prog_name="langsync")
-def main(source, dir, locales, config, rewrite, update_changed, prune, dry_run, check, verbose):
+def main(source, dir, locales, config, rewrite, update_changed, prune, dry_run, check, backend, report, no_memory, verbose):
     """Modern I18N sync tool with parallel translation and source-drift detection.
 
     On each run, langsync compares the source JSON file against the per-locale
@@ -490,6 +907,18 @@ def main(source, dir, locales, config, rewrite, update_changed, prune, dry_run,
         source = source or config_data.get('source')
         dir = dir or config_data.get('dir')
         rewrite = rewrite or config_data.get('rewrite', False)
+        if backend:
+            config_data['backend'] = backend
+        # Every backend any language can be routed to, default first.
+        backend_names = list(dict.fromkeys(
+            [config_data.get('backend', DEFAULT_BACKEND)]
+            + [name for route in config_data.get('routes', {}).values() for name in route]
+        ))
+        try:
+            backend_classes = [get_backend(name) for name in backend_names]
+        except TranslationError as e:
+            console.print(f"[red]Error: {e}.[/red] [dim]Set 'backend' in langsync.json or pass --backend.[/dim]")
+            sys.exit(1)
 
         if not source:
             console.print("[red]Error: No source file configured. Provide it via --source or set 'source' in langsync.json.[/red]")
@@ -546,7 +975,12 @@ def main(source, dir, locales, config, rewrite, update_changed, prune, dry_run,
             )
 
         state_path = config_data.get('state_file') or default_state_path(dir)
-        snapshot_hashes, snapshot_existed = load_state(state_path)
+        snapshot_hashes, fingerprints, snapshot_existed = read_state(state_path)
+        # Taken before the run so an edit made mid-run is noticed next time.
+        source_fingerprint = file_fingerprint(source)
+        # Locale fingerprints only hold for the source they were recorded against.
+        source_unchanged = fingerprint_matches(source, fingerprints.get('source'))
+        locale_fingerprints = fingerprints.get('locales', {}) if source_unchanged and not rewrite else {}
         baseline_origin = "snapshot" if snapshot_existed else "bootstrap"
         in_git_repo = is_inside_git_repo()
 
@@ -630,12 +1064,51 @@ def main(source, dir, locales, config, rewrite, update_changed, prune, dry_run,
                 f"[dim](first run — bootstrapping from current source)[/dim]"
             )
         table.add_row("Snapshot", snapshot_state)
+
+        # The translation memory is only useful when we actually call the translator.
+        memory = None
+        if not dry_run and not no_memory and any(b.cacheable for b in backend_classes):
+            memory_path = config_data.get('memory_file') or default_memory_path(state_path)
+            try:
+                memory = TranslationMemory(memory_path, max_entries=config_data.get('memory_max_entries'))
+                table.add_row("Memory", f"[green]{memory_path}[/green]")
+            except Exception as e:
+                console.print(f"[yellow]⚠ Translation memory disabled ({memory_path}): {e}[/yellow]")
+
+        # One budget per backend, shared by every worker, so the aggregate rate
+        # doesn't scale with concurrency and a fallback doesn't spend the primary's.
+        limiters = {name: RateLimiter.from_config(config_data) for name in backend_names}
+        # One breaker per backend, shared by every request to it: trips on
+        # consecutive rate-limit/network errors, and routes fail over past it.
+        breakers = {name: CircuitBreaker.from_config(config_data) for name in backend_names}
+        backend_stats = BackendStats()
+        if not dry_run:
+            limiter = limiters[backend_names[0]]
+            budgets = []
+            if limiter.requests_per_second:
+                budgets.append(f"{limiter.requests_per_second:g} req/s")
+            if limiter.characters_per_second:
+                budgets.append(f"{limiter.characters_per_second:g} chars/s")
+            if limiter.enabled and not budgets:
+                budgets.append("per language")
+            table.add_row(
+                "Rate Limit",
+                ", ".join(budgets) + (" [dim]per backend[/dim]" if len(limiters) > 1 else "")
+                if budgets else "[dim]unlimited[/dim]",
+            )
+            backend_text = f"[cyan]{backend_names[0]}[/cyan]"
+            for lang, route in sorted(config_data.get('routes', {}).items()):
+                backend_text += f"\n[dim]{lang}:[/dim] " + " → ".join(route)
+            table.add_row("Backend", backend_text)
+            if config_data.get('max_parallel_locales') == 'auto':
+                table.add_row("Workers", f"auto [dim](up to {config_data.get('max_auto_workers', 32)})[/dim]")
         table.add_row("Locales", f"[yellow]{len(target_locales)}[/yellow] ({', '.join(target_locales[:5])}{'...' if len(target_locales) > 5 else ''})")
 
         status_flags = []
         if rewrite: status_flags.append("[bold red]Rewrite[/bold red]")
         if update_changed: status_flags.append("[bold yellow]Update-Changed[/bold yellow]")
         if prune: status_flags.append("[bold magenta]Prune[/bold magenta]")
+        if no_memory and not dry_run: status_flags.append("[bold yellow]No-Memory[/bold yellow]")
         if check: status_flags.append("[bold red]Check[/bold red]")
         elif dry_run: status_flags.append("[bold yellow]Dry-Run[/bold yellow]")
         if verbose: status_flags.append("[bold cyan]Verbose[/bold cyan]")
@@ -654,6 +1127,33 @@ def main(source, dir, locales, config, rewrite, update_changed, prune, dry_run,
 
         results = []
         max_parallel_locales = config_data.get('max_parallel_locales', 3)
+        workers_per_locale = config_data.get('max_workers_per_locale', 5)
+        concurrency = None
+        if max_parallel_locales == 'auto':
+            concurrency = AdaptiveConcurrency(
+                initial=workers_per_locale,
+                maximum=config_data.get('max_auto_workers', 32),
+            )
+        # Locales that map to the same translator code (es-ES, es-MX -> es) share requests.
+        flights = SingleFlight()
+        # Flatten and hash the source once; every locale classifies against it.
+        source_index = SourceIndex(source_data)
+        # Every locale's classification lands in one key × locale matrix.
+        matrix = StatusMatrix(source_index)
+        # Protection only depends on the text and whitelist: do it once per run.
+        protections = ProtectionTable(config_data.get('whitelist'))
+        sizer = AdaptiveBatchSizer.from_config(config_data)
+        workers = concurrency.maximum if concurrency else max_parallel_locales * workers_per_locale
+        # One backend instance per language code and one keep-alive connection
+        # pool per backend, sized so every worker can hold a connection.
+        backend_cache = BackendCache(
+            config_data.get('backends'), pool_size=workers, timeout=config_data.get('request_timeout'),
+        )
+        # Tripped by the first Ctrl+C or by `run_timeout`; either way finished
+        # work is written and the rest stays pending in the snapshot.
+        cancel = CancelToken(timeout=config_data.get('run_timeout'))
+        if not dry_run:
+            signal.signal(signal.SIGINT, functools.partial(handle_sigint, cancel=cancel))
 
         with Progress(
             SpinnerColumn(),
@@ -666,27 +1166,51 @@ def main(source, dir, locales, config, rewrite, update_changed, prune, dry_run,
         ) as progress:
             main_task_id = progress.add_task("[bold green]Total Progress", total=len(target_locales))
 
-            with ThreadPoolExecutor(max_workers=max_parallel_locales) as locale_executor:
-                futures = [
-                    locale_executor.submit(
-                        process_locale, locale, source_data, dir, progress, main_task_id, config_data,
-                        snapshot_hashes=snapshot_hashes,
-                        rewrite=rewrite,
-                        prune=prune,
-                        update_changed=update_changed,
-                        dry_run=dry_run,
-                        verbose=verbose,
-                    )
-                    for locale in target_locales
-                ]
-
-                for future in as_completed(futures):
+            try:
+                # Classify every locale up front, then hand all their batches
+                # to one shared scheduler so no worker idles while work remains.
+                jobs = []
+                for locale in target_locales:
                     try:
-                        results.append(future.result())
+                        result, job = prepare_locale(
+                            locale, source_data, dir, progress, main_task_id, config_data,
+                            snapshot_hashes=snapshot_hashes,
+                            rewrite=rewrite,
+                            prune=prune,
+                            update_changed=update_changed,
+                            dry_run=dry_run,
+                            verbose=verbose,
+                            memory=memory,
+                            flights=flights,
+                            limiters=limiters,
+                            breakers=breakers,
+                            stats=backend_stats,
+                            backend_cache=backend_cache,
+                            protections=protections,
+                            cancel=cancel,
+                            source_index=source_index,
+                            matrix=matrix,
+                            fingerprint=locale_fingerprints.get(locale),
+                        )
                     except Exception as e:
-                        crash = LocaleResult("<unknown>")
-                        crash.add_issue("crash", f"locale worker crashed: {e}")
-                        results.append(crash)
+                        result, job = LocaleResult(locale), None
+                        result.add_issue("crash", f"locale worker crashed: {e}")
+                        progress.update(main_task_id, advance=1)
+                    results.append(result)
+                    if job is not None:
+                        jobs.append(job)
+
+                run_jobs(
+                    jobs, workers, progress, main_task_id, config_data,
+                    verbose=verbose, sizer=sizer, concurrency=concurrency,
+                )
+            finally:
+                backend_cache.close()
+                if memory is not None:
+                    try:
+                        memory.close()
+                    except Exception as e:
+                        console.print(f"[yellow]⚠ Could not update translation memory: {e}[/yellow]")
 
         sorted_results = sorted(results, key=lambda x: x.locale)
 
@@ -695,9 +1219,12 @@ def main(source, dir, locales, config, rewrite, update_changed, prune, dry_run,
         total_copied = sum(r.copied for r in sorted_results)
         total_failed = sum(r.failed for r in sorted_results)
         total_pruned = sum(r.pruned for r in sorted_results)
-        total_missing = sum(r.missing_count for r in sorted_results)
-        total_changed = sum(r.changed_count for r in sorted_results)
-        total_orphans = sum(r.orphan_count for r in sorted_results)
+        total_deduped = sum(r.deduped for r in sorted_results)
+        total_misaligned = sum(r.misaligned for r in sorted_results)
+        matrix_totals = matrix.totals()
+        total_missing = matrix_totals[MISSING]
+        total_changed = matrix_totals[CHANGED]
+        total_orphans = matrix_totals[ORPHAN]
 
         # Decide which columns to render — drop ones that would be uniformly "—".
         show_missing = total_missing > 0
@@ -707,6 +1234,7 @@ def main(source, dir, locales, config, rewrite, update_changed, prune, dry_run,
         show_translated = (not dry_run) and total_translated > 0
         show_copied = (not dry_run) and total_copied > 0
         show_pruned = (not dry_run) and total_pruned > 0
+        show_deduped = (not dry_run) and verbose and total_deduped > 0
         show_failed = (not dry_run) and total_failed > 0
 
         if dry_run:
@@ -723,6 +1251,7 @@ def main(source, dir, locales, config, rewrite, update_changed, prune, dry_run,
         if show_translated:summary_table.add_column("Translated", justify="right", style="green")
         if show_copied:    summary_table.add_column("Copied",     justify="right", style="magenta")
         if show_pruned:    summary_table.add_column("Pruned",     justify="right", style="bright_magenta")
+        if show_deduped:   summary_table.add_column("Deduped",    justify="right", style="dim")
         if show_failed:    summary_table.add_column("Failed",     justify="right", style="red")
 
         for r in sorted_results:
@@ -755,6 +1284,7 @@ def main(source, dir, locales, config, rewrite, update_changed, prune, dry_run,
             if show_translated: row.append(_cell(r.translated))
             if show_copied:     row.append(_cell(r.copied))
             if show_pruned:     row.append(_cell(r.pruned))
+            if show_deduped:    row.append(_cell(r.deduped))
             if show_failed:     row.append(_cell(r.failed))
 
             summary_table.add_row(*row)
@@ -771,7 +1301,7 @@ def main(source, dir, locales, config, rewrite, update_changed, prune, dry_run,
         if not nothing_to_show:
             console.print(summary_table)
 
-        issues_panel = _render_issues_panel(results)
+        issues_panel = _render_issues_panel(results, backend_stats, breakers)
         if issues_panel:
             console.print()
             console.print(issues_panel)
@@ -786,13 +1316,27 @@ def main(source, dir, locales, config, rewrite, update_changed, prune, dry_run,
             console.print()
             console.print(Panel(orphan_msg, border_style="yellow", expand=False))
 
+        if report:
+            try:
+                matrix.write(report)
+                console.print(f"[dim]Status matrix written to[/dim] [cyan]{report}[/cyan]")
+            except OSError as e:
+                console.print(f"[yellow]⚠ Could not write report {report}: {e}[/yellow]")
+
         # Persist a fresh snapshot, but only advance entries that every locale
         # successfully synced. For keys some locale failed:
         #   - if we already had a previous hash, keep it (next run re-detects drift)
         #   - if it was brand-new, drop it entirely so next run treats it as missing
-        if not dry_run:
+        # When the source is unchanged and every locale was skipped, the
+        # snapshot on disk is already exact: leave it alone, unless it holds
+        # fingerprints recorded without an mtime that may now be filled in.
+        unsettled = source_unchanged and (
+            fingerprints['source'].get('mtime_ns') is None
+            or any(r.skipped and locale_fingerprints[r.locale].get('mtime_ns') is None for r in results)
+        )
+        if not dry_run and (not source_unchanged or unsettled or any(not r.skipped for r in results)):
             try:
-                current_hashes = compute_source_hashes(source_data)
+                current_hashes = source_index.hashes
                 failed_keys = set()
                 for r in results:
                     failed_keys.update(r.failed_paths)
@@ -806,7 +1350,16 @@ def main(source, dir, locales, config, rewrite, update_changed, prune, dry_run,
                     else:
                         new_hashes[key] = h
 
-                save_state(state_path, new_hashes)
+                new_fingerprints = None
+                if not failed_keys:
+                    new_fingerprints = {
+                        'source': source_fingerprint,
+                        'locales': _locale_fingerprints(
+                            results, locale_fingerprints, dir, matrix,
+                            prune=prune, update_changed=update_changed and not rewrite,
+                        ),
+                    }
+                save_state(state_path, new_hashes, new_fingerprints)
             except OSError as e:
                 console.print(f"[yellow]⚠ Could not write snapshot {state_path}: {e}[/yellow]")
             except Exception as e:
@@ -827,6 +1380,11 @@ def main(source, dir, locales, config, rewrite, update_changed, prune, dry_run,
             if total_orphans > 0:
                 next_steps.append("[cyan]langsync --prune[/cyan] removes the orphan keys.")
             next_steps_text = ("\n" + "\n".join(f"[dim]→[/dim] {s}" for s in next_steps)) if next_steps else ""
+            if total_missing or total_changed:
+                next_steps_text = (
+                    f"\n[dim]Keys affected:[/dim] [bold]{len(matrix.drifted_keys())}[/bold] of {matrix.size} "
+                    f"across {len(matrix.locales)} locale(s)"
+                ) + next_steps_text
 
             if check and has_drift:
                 headline = "[bold red]✖ Drift detected[/bold red]"
@@ -850,7 +1408,11 @@ def main(source, dir, locales, config, rewrite, update_changed, prune, dry_run,
                 f"{next_steps_text}"
             )
         else:
-            if total_failed > 0:
+            if cancel.cancelled:
+                headline = f"[bold yellow]⏹ Sync Cancelled ({cancel.reason})[/bold yellow]"
+                border_style = "yellow"
+                tail = f"\n[dim]Progress was saved. Re-run langsync to finish the [bold red]{total_failed}[/bold red] pending key(s).[/dim]"
+            elif total_failed > 0:
                 headline = "[bold yellow]⚠ Sync Completed With Issues[/bold yellow]"
                 border_style = "yellow"
                 tail = f"\n[dim]Re-run langsync to retry the [bold red]{total_failed}[/bold red] failed key(s).[/dim]"
@@ -859,6 +1421,48 @@ def main(source, dir, locales, config, rewrite, update_changed, prune, dry_run,
                 border_style = "green"
                 tail = ""
 
+            memory_text = ""
+            if memory is not None:
+                memory_text = (
+                    f"\n[dim]Memory:[/dim] [bold green]{memory.hits}[/bold green] hit(s)   "
+                    f"[bold yellow]{memory.misses}[/bold yellow] miss(es)"
+                )
+                if memory.evicted:
+                    memory_text += f"   [dim]{memory.evicted} evicted[/dim]"
+
+            if verbose and sizer.adaptive:
+                memory_text += (
+                    f"\n[dim]Batch size:[/dim] ended at [bold]{sizer.size}[/bold] item(s) / "
+                    f"{sizer.chars} chars (peak {sizer.peak_size})"
+                )
+
+            if concurrency is not None and jobs:
+                settled = concurrency.settled
+                memory_text += (
+                    f"\n[dim]Concurrency:[/dim] settled at [bold]{settled}[/bold] worker(s) "
+                    f"[dim](pin with max_parallel_locales: {-(-settled // workers_per_locale)})[/dim]"
+                )
+
+            throttled = [(name, l.waited) for name, l in limiters.items() if l.waited >= 0.05]
+            if throttled:
+                memory_text += (
+                    "\n[dim]Throttled:[/dim] "
+                    + "   ".join(f"{name} [bold]{waited:.1f}s[/bold]" for name, waited in throttled)
+                    + " [dim](rate limiter waits, summed across workers)[/dim]"
+                )
+
+            dedup_text = ""
+            if total_deduped or flights.shared:
+                dedup_text = (
+                    f"\n[dim]Requests saved:[/dim] [bold]{total_deduped}[/bold] deduplicated   "
+                    f"[bold]{flights.shared}[/bold] shared across locales"
+                )
+            if total_misaligned:
+                dedup_text += (
+                    f"\n[dim]Packing:[/dim] [bold yellow]{total_misaligned}[/bold yellow] segment(s) "
+                    "came back misaligned and were retried individually"
+                )
+
             footer_text = (
                 f"{headline}\n"
                 f"[dim]Time elapsed:[/dim] [bold cyan]{total_time:.2f}s[/bold cyan]\n"
@@ -866,6 +1470,8 @@ def main(source, dir, locales, config, rewrite, update_changed, prune, dry_run,
                 f"[dim]Copied:[/dim] [bold magenta]{total_copied}[/bold magenta]   "
                 f"[dim]Pruned:[/dim] [bold bright_magenta]{total_pruned}[/bold bright_magenta]   "
                 f"[dim]Failed:[/dim] [bold red]{total_failed}[/bold red]"
+                f"{memory_text}"
+                f"{dedup_text}"
                 f"{tail}"
             )
 
@@ -875,6 +1481,8 @@ def main(source, dir, locales, config, rewrite, update_changed, prune, dry_run,
 
         if check and (total_missing + total_changed + total_orphans) > 0:
             sys.exit(1)
+        if cancel.reason == "interrupted":
+            sys.exit(130)
 
     except KeyboardInterrupt:
         handle_sigint(None, None)
@@ -57,9 +57,47 @@ LANG_MAP = {
 # Concurrency settings
 MAX_WORKERS_PER_LOCALE = 5
 MAX_PARALLEL_LOCALES = 3
+# Ceiling for `max_parallel_locales: "auto"`, which scales the active worker
+# count at runtime from throughput and rate-limit/timeout errors.
+MAX_AUTO_WORKERS = 32
 DELAY_BETWEEN_REQUESTS = 0.2
+# Run-wide request budget. None derives it from DELAY_BETWEEN_REQUESTS (1 / delay).
+REQUESTS_PER_SECOND = None
+CHARACTERS_PER_SECOND = None
 BATCH_SIZE = 25
+# Adaptive batching: BATCH_SIZE is the starting point; batches grow towards
+# MAX_BATCH_SIZE items / MAX_BATCH_CHARS characters while they stay fast and
+# clean, and shrink on errors or misaligned responses.
+ADAPTIVE_BATCHING = True
+MAX_BATCH_SIZE = 100
+MAX_BATCH_CHARS = 4500
+BATCH_TARGET_LATENCY = 3.0
 RETRY_COUNT = 3
+# Run the two halves of a bisected failing batch concurrently.
+PARALLEL_BISECTION = False
+# Join each batch into as few translator requests as the character limit allows.
+PACK_BATCHES = True
+
+# Circuit breaker: open after this many consecutive rate-limit/network errors
+# across all workers (0 disables), then probe again after the cooldown.
+CIRCUIT_BREAKER_THRESHOLD = 5
+CIRCUIT_BREAKER_COOLDOWN = 10.0
+
+# Translation backend ("google", "libretranslate", "argos" or "offline");
+# per-backend options go under the `backends` config key, e.g.
+# {"offline": {"latency": 0.1}}.
+BACKEND = 'google'
+
+# Seconds before a single backend request is abandoned (HTTP and offline
+# backends; per-backend `backends.<name>.timeout` wins).
+REQUEST_TIMEOUT = 30.0
+# Optional wall-clock budget for the whole run, in seconds. When it passes the
+# run is cancelled like Ctrl+C: no new requests, finished work is saved and
+# untranslated keys stay pending. None means no deadline.
+RUN_TIMEOUT = None
+
+# Translation memory settings
+MEMORY_MAX_ENTRIES = 100000
 
 # File settings
 DEFAULT_SOURCE = 'messages/en-GB.json'
@@ -74,12 +112,38 @@ def get_default_config():
         'dir': DEFAULT_DIR,
         'max_workers_per_locale': MAX_WORKERS_PER_LOCALE,
         'max_parallel_locales': MAX_PARALLEL_LOCALES,
+        'max_auto_workers': MAX_AUTO_WORKERS,
         'delay_between_requests': DELAY_BETWEEN_REQUESTS,
+        'requests_per_second': REQUESTS_PER_SECOND,
+        'characters_per_second': CHARACTERS_PER_SECOND,
+        # Optional extra budgets per translator language code, e.g.
+        # {"ja": {"requests_per_second": 1}}.
+        'rate_limits_per_language': {},
         'batch_size': BATCH_SIZE,
+        'adaptive_batching': ADAPTIVE_BATCHING,
+        'max_batch_size': MAX_BATCH_SIZE,
+        'max_batch_chars': MAX_BATCH_CHARS,
+        'batch_target_latency': BATCH_TARGET_LATENCY,
         'retry_count': RETRY_COUNT,
+        'pack_batches': PACK_BATCHES,
+        'parallel_bisection': PARALLEL_BISECTION,
+        'circuit_breaker_threshold': CIRCUIT_BREAKER_THRESHOLD,
+        'circuit_breaker_cooldown': CIRCUIT_BREAKER_COOLDOWN,
+        'backend': BACKEND,
+        'backends': {},
+        # Optional per-language routes: translator language code -> ordered
+        # backend names, primary first, e.g. {"ja": ["google", "libretranslate"]}.
+        # Languages without a route use `backend` alone.
+        'routes': {},
+        'request_timeout': REQUEST_TIMEOUT,
+        'run_timeout': RUN_TIMEOUT,
         'whitelist': WHITELIST,
         # Optional: override snapshot location. Defaults to <dir>/.langsync-state.json.
         'state_file': None,
+        # Optional: override translation memory location. Defaults to
+        # .langsync-memory.sqlite next to the snapshot.
+        'memory_file': None,
+        'memory_max_entries': MEMORY_MAX_ENTRIES,
     }
 
 def save_config(path, config_dict):
@@ -125,11 +189,75 @@ def load_config(config_path=None):
                                     config['whitelist'] = list(set(WHITELIST + value))
                                 else:
                                     console.print(f"[yellow]Warning: 'whitelist' in {path} must be a list. Ignoring.[/yellow]")
-                            elif key in ['max_workers_per_locale', 'max_parallel_locales']:
+                            elif key == 'max_parallel_locales':
+                                if value == 'auto' or (isinstance(value, int) and not isinstance(value, bool) and value > 0):
+                                    config[key] = value
+                                else:
+                                    console.print(f"[yellow]Warning: 'max_parallel_locales' in {path} must be a positive integer or \"auto\". Ignoring.[/yellow]")
+                            elif key in ['max_workers_per_locale', 'memory_max_entries', 'max_auto_workers',
+                                         'batch_size', 'max_batch_size', 'max_batch_chars']:
                                 if isinstance(value, int) and value > 0:
                                     config[key] = value
                                 else:
                                     console.print(f"[yellow]Warning: '{key}' in {path} must be a positive integer. Ignoring.[/yellow]")
+                            elif key == 'circuit_breaker_threshold':
+                                if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+                                    config[key] = value
+                                else:
+                                    console.print(f"[yellow]Warning: 'circuit_breaker_threshold' in {path} must be a non-negative integer. Ignoring.[/yellow]")
+                            elif key == 'circuit_breaker_cooldown':
+                                if isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0:
+                                    config[key] = float(value)
+                                else:
+                                    console.print(f"[yellow]Warning: 'circuit_breaker_cooldown' in {path} must be a positive number. Ignoring.[/yellow]")
+                            elif key == 'batch_target_latency':
+                                if isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0:
+                                    config[key] = float(value)
+                                else:
+                                    console.print(f"[yellow]Warning: 'batch_target_latency' in {path} must be a positive number. Ignoring.[/yellow]")
+                            elif key in ['pack_batches', 'parallel_bisection', 'adaptive_batching']:
+                                if isinstance(value, bool):
+                                    config[key] = value
+                                else:
+                                    console.print(f"[yellow]Warning: '{key}' in {path} must be true or false. Ignoring.[/yellow]")
+                            elif key in ['requests_per_second', 'characters_per_second']:
+                                if value is None or (isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0):
+                                    config[key] = float(value) if value is not None else None
+                                else:
+                                    console.print(f"[yellow]Warning: '{key}' in {path} must be a positive number or null. Ignoring.[/yellow]")
+                            elif key == 'rate_limits_per_language':
+                                if isinstance(value, dict) and all(isinstance(v, dict) for v in value.values()):
+                                    config[key] = value
+                                else:
+                                    console.print(f"[yellow]Warning: 'rate_limits_per_language' in {path} must map language codes to objects. Ignoring.[/yellow]")
+                            elif key == 'backend':
+                                if isinstance(value, str) and value:
+                                    config[key] = value
+                                else:
+                                    console.print(f"[yellow]Warning: 'backend' in {path} must be a backend name. Ignoring.[/yellow]")
+                            elif key == 'backends':
+                                if isinstance(value, dict) and all(isinstance(v, dict) for v in value.values()):
+                                    config[key] = value
+                                else:
+                                    console.print(f"[yellow]Warning: 'backends' in {path} must map backend names to option objects. Ignoring.[/yellow]")
+                            elif key == 'routes':
+                                if isinstance(value, dict) and all(
+                                    isinstance(v, str) or (isinstance(v, list) and v and all(isinstance(n, str) for n in v))
+                                    for v in value.values()
+                                ):
+                                    config[key] = {lang: [v] if isinstance(v, str) else v for lang, v in value.items()}
+                                else:
+                                    console.print(f"[yellow]Warning: 'routes' in {path} must map language codes to lists of backend names. Ignoring.[/yellow]")
+                            elif key == 'request_timeout':
+                                if isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0:
+                                    config[key] = float(value)
+                                else:
+                                    console.print(f"[yellow]Warning: 'request_timeout' in {path} must be a positive number. Ignoring.[/yellow]")
+                            elif key == 'run_timeout':
+                                if value is None or (isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0):
+                                    config[key] = float(value) if value is not None else None
+                                else:
+                                    console.print(f"[yellow]Warning: 'run_timeout' in {path} must be a positive number or null. Ignoring.[/yellow]")
                             elif key == 'delay_between_requests':
                                 if isinstance(value, (int, float)) and value >= 0:
                                     config[key] = float(value)
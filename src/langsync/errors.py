@@ -0,0 +1,5 @@
+class TranslationError(Exception):
+    """Raised when a translation request fails (network, rate limit, API error)."""
+    def __init__(self, message, kind="unknown"):
+        super().__init__(message)
+        self.kind = kind  # "rate_limit", "network", "api", "unknown"
@@ -0,0 +1,52 @@
+"""Skip-unchanged, atomic file writes.
+
+Everything langsync writes (locale files, the snapshot, reports) is
+serialized in memory first. If the destination already holds exactly those
+bytes nothing is written, so re-runs don't touch mtimes or wake file watchers.
+Otherwise the bytes go to a temporary file in the same directory that is then
+renamed over the destination: a run killed mid-write leaves the old file
+intact, never a truncated one. Symlinked destinations are resolved first, so
+the link survives and its target gets the new content.
+"""
+
+import os
+import stat
+import tempfile
+
+# Read once at import: os.umask can only be queried by setting it, which is
+# not safe once worker threads are running.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def write_atomic(path, text, encoding="utf-8"):
+    """Write `text` to `path` unless it already has this content. Returns
+    True if the file was (re)written."""
+    data = text.encode(encoding)
+    # Replace the file a symlink points to, not the link itself.
+    path = os.path.realpath(path)
+    try:
+        current = os.stat(path)
+    except FileNotFoundError:
+        current = None
+    if current is not None and current.st_size == len(data):
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp creates the file 0600; keep the permissions the file had.
+        mode = stat.S_IMODE(current.st_mode) if current is not None else 0o666 & ~_UMASK
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return True
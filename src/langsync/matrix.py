@@ -0,0 +1,168 @@
+"""Key × locale sync status matrix.
+
+Filled from each locale's classification as it is computed, so the whole run
+is one pass over the targets. Source keys are the rows (in SourceIndex order)
+and each locale is a column stored as one bitset per status: bit `i` of
+`missing` is set when row `i` is missing in that locale. Unchanged is the
+complement of missing | changed. Counts are popcounts and cross-locale
+questions ("which keys are missing anywhere") are bitwise ORs, so the summary
+and `--report` never walk the trees again. Orphans are not source keys; they
+are kept per locale as dotted keys.
+"""
+
+import csv
+import io
+import json
+
+from .fileio import write_atomic
+from .state import path_to_key
+
+MISSING = "missing"
+CHANGED = "changed"
+ORPHAN = "orphan"
+UNCHANGED = "unchanged"
+STATUSES = (MISSING, CHANGED, ORPHAN, UNCHANGED)
+
+try:
+    _popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def _popcount(mask):
+        return bin(mask).count("1")
+
+
+def _bitset(rows, size):
+    bits = bytearray((size + 7) // 8)
+    for row in rows:
+        bits[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(bits, "little")
+
+
+def _rows(mask, size):
+    """Indices of the set bits in `mask`, ascending."""
+    rows = []
+    for offset, byte in enumerate(mask.to_bytes((size + 7) // 8, "little")):
+        while byte:
+            low = byte & -byte
+            rows.append(offset * 8 + low.bit_length() - 1)
+            byte ^= low
+    return rows
+
+
+class StatusMatrix:
+    def __init__(self, index):
+        self.index = index
+        self.size = len(index)
+        self._rows = {path: row for row, path in enumerate(index.paths)}
+        self._key_rows = None  # dotted key -> row, built on first lookup
+        self.locales = []
+        self._columns = {}  # locale -> {MISSING: bitset, CHANGED: bitset}
+        self.orphans = {}  # locale -> [dotted key, ...]
+
+    def record(self, locale, classification):
+        """Add `locale`'s column from a LocaleProcessor.classify_keys result."""
+        rows = self._rows
+        column = {}
+        for status in (MISSING, CHANGED):
+            column[status] = _bitset(
+                (rows[path] for bucket in (f"{status}_translatable", f"{status}_passthrough")
+                 for path, _ in classification[bucket]),
+                self.size,
+            )
+        if locale not in self._columns:
+            self.locales.append(locale)
+        self._columns[locale] = column
+        self.orphans[locale] = [path_to_key(path) for path in classification["orphans"]]
+
+    def record_unchanged(self, locale, orphans=()):
+        """Add a column for a locale known to be fully in sync (all keys
+        unchanged) without classifying it."""
+        if locale not in self._columns:
+            self.locales.append(locale)
+        self._columns[locale] = {MISSING: 0, CHANGED: 0}
+        self.orphans[locale] = list(orphans)
+
+    def count(self, locale, status):
+        if status == ORPHAN:
+            return len(self.orphans[locale])
+        column = self._columns[locale]
+        if status == UNCHANGED:
+            return self.size - _popcount(column[MISSING] | column[CHANGED])
+        return _popcount(column[status])
+
+    def totals(self):
+        return {status: sum(self.count(locale, status) for locale in self.locales) for status in STATUSES}
+
+    def keys_for(self, locale, status):
+        """Dotted keys with `status` in `locale`."""
+        if status == ORPHAN:
+            return list(self.orphans[locale])
+        column = self._columns[locale]
+        mask = column[status] if status != UNCHANGED else ~(column[MISSING] | column[CHANGED]) & ((1 << self.size) - 1)
+        keys = self.index.keys
+        return [keys[row] for row in _rows(mask, self.size)]
+
+    def locales_for(self, key, status):
+        """Locales where dotted `key` has `status`."""
+        if status == ORPHAN:
+            return [locale for locale in self.locales if key in self.orphans[locale]]
+        if self._key_rows is None:
+            self._key_rows = {key: row for row, key in enumerate(self.index.keys)}
+        row = self._key_rows.get(key)
+        if row is None:
+            return []
+        bit = 1 << row
+        return [locale for locale in self.locales if self._has(locale, status, bit)]
+
+    def _has(self, locale, status, bit):
+        column = self._columns[locale]
+        if status == UNCHANGED:
+            return not (column[MISSING] | column[CHANGED]) & bit
+        return bool(column[status] & bit)
+
+    def drifted_keys(self):
+        """Source keys missing or changed in at least one locale."""
+        mask = 0
+        for column in self._columns.values():
+            mask |= column[MISSING] | column[CHANGED]
+        keys = self.index.keys
+        return [keys[row] for row in _rows(mask, self.size)]
+
+    def by_key(self, status):
+        """{dotted key: [locales]} for every key with `status` somewhere."""
+        out = {}
+        for locale in self.locales:
+            for key in self.keys_for(locale, status):
+                out.setdefault(key, []).append(locale)
+        return out
+
+    def to_dict(self):
+        return {
+            "version": 1,
+            "keys": self.size,
+            "locales": list(self.locales),
+            "summary": {
+                locale: {status: self.count(locale, status) for status in STATUSES}
+                for locale in self.locales
+            },
+            MISSING: self.by_key(MISSING),
+            CHANGED: self.by_key(CHANGED),
+            ORPHAN: self.by_key(ORPHAN),
+        }
+
+    def write(self, path):
+        """Export the non-unchanged cells: JSON by default, or a key × locale
+        CSV grid when `path` ends in .csv."""
+        if path.lower().endswith(".csv"):
+            cells = {}
+            for status in (MISSING, CHANGED, ORPHAN):
+                for key, locales in self.by_key(status).items():
+                    row = cells.setdefault(key, {})
+                    for locale in locales:
+                        row[locale] = status
+            buffer = io.StringIO(newline="")
+            writer = csv.writer(buffer)
+            writer.writerow(["key"] + self.locales)
+            for key in sorted(cells):
+                writer.writerow([key] + [cells[key].get(locale, "") for locale in self.locales])
+            return write_atomic(path, buffer.getvalue())
+        return write_atomic(path, json.dumps(self.to_dict(), indent=2, ensure_ascii=False) + "\n")
@@ -0,0 +1,156 @@
+"""Persistent translation memory.
+
+Caches backend responses on disk so `--rewrite`, re-runs after a failed batch
+and fresh CI clones reuse strings that were already translated instead of
+paying network latency again.
+
+Entries are keyed by the backend that produced them, the *protected* source
+text (placeholders and whitelist terms already swapped for markers), the
+translator language code and a fingerprint of the active whitelist. Keying by
+backend means a fallback's output is never served in place of the primary's,
+and switching engines does not keep returning the old engine's strings. The
+raw backend output is stored, so marker restoration still happens per call
+and one entry serves every source string that protects to the same text.
+
+Storage is a single SQLite file next to the snapshot. The table is capped at
+`max_entries`; once exceeded, the least-recently-used rows are evicted when the
+memory is closed at the end of a run.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+MEMORY_FILENAME = ".langsync-memory.sqlite"
+DEFAULT_MAX_ENTRIES = 100000
+
+# Bumped whenever the table layout changes. Older tables are dropped rather
+# than migrated: it is a cache, and version 1 rows don't say which backend
+# produced them.
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    backend   TEXT NOT NULL,
+    lang      TEXT NOT NULL,
+    whitelist TEXT NOT NULL,
+    source    TEXT NOT NULL,
+    target    TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (backend, lang, whitelist, source)
+);
+CREATE INDEX IF NOT EXISTS translations_last_used ON translations (last_used);
+"""
+
+# SQLite caps the number of bound parameters per statement (999 on old builds).
+_LOOKUP_CHUNK = 500
+
+
+def default_memory_path(state_path):
+    """The memory lives next to the snapshot file."""
+    return os.path.join(os.path.dirname(state_path) or ".", MEMORY_FILENAME)
+
+
+def whitelist_fingerprint(whitelist):
+    """Short, order-independent digest of a whitelist. Changing the whitelist
+    changes which terms get protected, so it must invalidate cached entries."""
+    terms = sorted({w for w in (whitelist or []) if w})
+    return hashlib.sha256("\n".join(terms).encode("utf-8")).hexdigest()[:16]
+
+
+class TranslationMemory:
+    """Thread-safe SQLite-backed cache of protected source text -> translation."""
+
+    def __init__(self, path, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._touched = {}  # (backend, lang, whitelist, source) -> last_used, flushed on close
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS translations")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def get_many(self, backend, lang, whitelist_fp, texts):
+        """Return {text: translation} for every text found in the memory.
+        Updates the hit/miss counters for each distinct text requested."""
+        wanted = list(dict.fromkeys(texts))
+        found = {}
+        if not wanted:
+            return found
+        now = time.time()
+        with self._lock:
+            for i in range(0, len(wanted), _LOOKUP_CHUNK):
+                chunk = wanted[i:i + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT source, target FROM translations "
+                    f"WHERE backend = ? AND lang = ? AND whitelist = ? AND source IN ({placeholders})",
+                    [backend, lang, whitelist_fp] + chunk,
+                ).fetchall()
+                for source, target in rows:
+                    found[source] = target
+                    self._touched[(backend, lang, whitelist_fp, source)] = now
+            self.hits += len(found)
+            self.misses += len(wanted) - len(found)
+        return found
+
+    def get(self, backend, lang, whitelist_fp, text):
+        return self.get_many(backend, lang, whitelist_fp, [text]).get(text)
+
+    def put_many(self, backend, lang, whitelist_fp, pairs):
+        """Store (source, translation) pairs `backend` produced. Empty
+        translations are skipped."""
+        now = time.time()
+        rows = [(backend, lang, whitelist_fp, src, tgt, now) for src, tgt in pairs if tgt]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations (backend, lang, whitelist, source, target, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def put(self, backend, lang, whitelist_fp, text, translation):
+        self.put_many(backend, lang, whitelist_fp, [(text, translation)])
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def close(self):
+        """Flush LRU timestamps, evict down to `max_entries`, and close the file."""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                if self._touched:
+                    self._conn.executemany(
+                        "UPDATE translations SET last_used = ? "
+                        "WHERE backend = ? AND lang = ? AND whitelist = ? AND source = ?",
+                        [(ts, *key) for key, ts in self._touched.items()],
+                    )
+                    self._touched.clear()
+                count = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+                overflow = count - self.max_entries
+                if overflow > 0:
+                    self._conn.execute(
+                        "DELETE FROM translations WHERE rowid IN ("
+                        "SELECT rowid FROM translations ORDER BY last_used ASC LIMIT ?)",
+                        (overflow,),
+                    )
+                    self.evicted += overflow
+                self._conn.commit()
+            finally:
+                self._conn.close()
+                self._conn = None
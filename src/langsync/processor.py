@@ -1,18 +1,82 @@
 import json
 import os
+import sys
 
-from .state import path_to_key, value_hash
+from .fileio import write_atomic
+from .state import hash_matches, path_to_key, value_hash
 
 
-class LocaleProcessor:
+class SourceIndex:
+    """Every leaf of the source file, flattened once per run and shared by all
+    locales: tuple paths (with interned keys), dotted snapshot keys, value
+    hashes and the translatable flag, in source order. Classifying a locale is
+    then dictionary lookups against its flattened target instead of another
+    recursive walk of the source."""
+
     def __init__(self, source_data):
+        self.paths = []
+        self.keys = []
+        self.values = []
+        self.leaf_hashes = []
+        self.translatable = []
+        self.branches = []  # paths of nested objects, parents first
+        self.hashes = {}  # dotted key -> value hash, as stored in the snapshot
+        if isinstance(source_data, dict):
+            self._walk(source_data, ())
+        # Every source path, leaf or object; anything else in a target is an orphan.
+        self.nodes = set(self.paths).union(self.branches)
+
+    def _walk(self, node, path):
+        for key, value in node.items():
+            current_path = path + (sys.intern(key),)
+            if isinstance(value, dict):
+                self.branches.append(current_path)
+                self._walk(value, current_path)
+                continue
+            dotted = path_to_key(current_path)
+            digest = value_hash(value)
+            self.paths.append(current_path)
+            self.keys.append(dotted)
+            self.values.append(value)
+            self.leaf_hashes.append(digest)
+            self.translatable.append(bool(isinstance(value, str) and value.strip()))
+            self.hashes[dotted] = digest
+
+    def __len__(self):
+        return len(self.paths)
+
+
+def flatten_target(target):
+    """Return (leaves, nodes) for a locale dict: {tuple path: leaf value} and
+    every path (objects included) in document order."""
+    leaves = {}
+    nodes = []
+
+    def walk(node, path):
+        for key, value in node.items():
+            current_path = path + (sys.intern(key),)
+            nodes.append(current_path)
+            if isinstance(value, dict):
+                walk(value, current_path)
+            else:
+                leaves[current_path] = value
+
+    if isinstance(target, dict):
+        walk(target, ())
+    return leaves, nodes
+
+
+class LocaleProcessor:
+    def __init__(self, source_data, index=None):
         self.source_data = source_data
+        # Pass the run's shared SourceIndex to avoid re-flattening per locale.
+        self.index = index if index is not None else SourceIndex(source_data)
 
     def classify_keys(self, target_data, snapshot_hashes=None, *, force_rewrite=False):
         """Classify every leaf in the source against the target locale and the
         last-known source-state snapshot.
 
-        Returns a dict with these buckets (paths are lists):
+        Returns a dict with these buckets (paths are tuples, in source order):
             missing_translatable: [(path, value)]  - string source, absent in target
             missing_passthrough:  [(path, value)]  - non-string/empty source, absent in target
             changed_translatable: [(path, value)]  - string source whose hash differs from snapshot
@@ -21,8 +85,10 @@ class LocaleProcessor:
             orphans:              [path, ...]      - present in target but not in source
 
         force_rewrite=True treats every source key as `changed_*`, regardless of
-        what the target or snapshot say.
+        what the target or snapshot say. Source objects missing from the target
+        (or shadowed by a non-object value) are created as empty objects.
         """
+        index = self.index
         result = {
             "missing_translatable": [],
             "missing_passthrough": [],
@@ -32,58 +98,46 @@ class LocaleProcessor:
             "orphans": [],
         }
         snapshot_hashes = snapshot_hashes or {}
-        self._classify(self.source_data, target_data, [], snapshot_hashes, result, force_rewrite)
-        self._collect_orphans(self.source_data, target_data, [], result["orphans"])
-        return result
-
-    def _classify(self, source, target, path, snapshot_hashes, result, force_rewrite):
-        if not isinstance(source, dict):
-            return
-        for key, value in source.items():
-            current_path = path + [key]
-            if isinstance(value, dict):
-                if key not in target or not isinstance(target[key], dict):
-                    target[key] = {}
-                self._classify(value, target[key], current_path, snapshot_hashes, result, force_rewrite)
-                continue
-
-            is_translatable = isinstance(value, str) and value.strip()
-            target_has_value = (
-                isinstance(target, dict)
-                and key in target
-                and target[key] not in (None, "")
-                and not isinstance(target[key], dict)
-            )
-
+        self._ensure_branches(target_data)
+        leaves, nodes = flatten_target(target_data)
+
+        missing_translatable = result["missing_translatable"].append
+        missing_passthrough = result["missing_passthrough"].append
+        changed_translatable = result["changed_translatable"].append
+        changed_passthrough = result["changed_passthrough"].append
+        unchanged = result["unchanged"].append
+        for path, key, value, digest, is_translatable in zip(
+            index.paths, index.keys, index.values, index.leaf_hashes, index.translatable,
+        ):
             if force_rewrite:
-                bucket = "changed_translatable" if is_translatable else "changed_passthrough"
-                result[bucket].append((current_path, value))
+                (changed_translatable if is_translatable else changed_passthrough)((path, value))
                 continue
-
-            if not target_has_value:
-                bucket = "missing_translatable" if is_translatable else "missing_passthrough"
-                result[bucket].append((current_path, value))
+            target_value = leaves.get(path)
+            if target_value is None or target_value == "":
+                (missing_translatable if is_translatable else missing_passthrough)((path, value))
                 continue
-
-            prior_hash = snapshot_hashes.get(path_to_key(current_path))
-            if prior_hash is not None and prior_hash != value_hash(value):
-                bucket = "changed_translatable" if is_translatable else "changed_passthrough"
-                result[bucket].append((current_path, value))
+            prior_hash = snapshot_hashes.get(key)
+            if prior_hash is not None and not hash_matches(prior_hash, value, digest):
+                (changed_translatable if is_translatable else changed_passthrough)((path, value))
             else:
-                result["unchanged"].append(current_path)
+                unchanged(path)
+
+        # Report the outermost unknown path only: an orphan object's children
+        # are not listed separately.
+        source_nodes = index.nodes
+        result["orphans"] = [
+            path for path in nodes
+            if path not in source_nodes and (len(path) == 1 or path[:-1] in source_nodes)
+        ]
+        return result
 
-    def _collect_orphans(self, source, target, path, out):
-        if not isinstance(target, dict):
-            return
-        source_keys = source if isinstance(source, dict) else {}
-        for key, tval in target.items():
-            current_path = path + [key]
-            if key not in source_keys:
-                out.append(current_path)
-                continue
-            if isinstance(tval, dict):
-                child_source = source_keys[key] if isinstance(source_keys.get(key), dict) else {}
-                self._collect_orphans(child_source, tval, current_path, out)
+    def _ensure_branches(self, target_data):
+        for path in self.index.branches:
+            node = target_data
+            for key in path[:-1]:
+                node = node[key]
+            if not isinstance(node.get(path[-1]), dict):
+                node[path[-1]] = {}
 
     def get_missing_keys(self, target_data, rewrite=False):
         """Legacy entrypoint. Returns (translatable, passthrough) for keys that
@@ -92,8 +146,9 @@ class LocaleProcessor:
         classify_keys for that.
         """
         c = self.classify_keys(target_data, snapshot_hashes=None, force_rewrite=rewrite)
-        translatable = c["missing_translatable"] + c["changed_translatable"]
-        passthrough = c["missing_passthrough"] + c["changed_passthrough"]
+        # Paths are returned as lists, as before the source index existed.
+        translatable = [(list(p), v) for p, v in c["missing_translatable"] + c["changed_translatable"]]
+        passthrough = [(list(p), v) for p, v in c["missing_passthrough"] + c["changed_passthrough"]]
         return translatable, passthrough
 
     @staticmethod
@@ -145,6 +200,6 @@ class LocaleProcessor:
 
     @staticmethod
     def save_json(file_path, data):
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.write("\n")
+        """Write `data` as indented JSON. Returns False when the file already
+        had exactly this content and was left untouched."""
+        return write_atomic(file_path, json.dumps(data, indent=2, ensure_ascii=False) + "\n")
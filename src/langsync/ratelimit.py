@@ -0,0 +1,126 @@
+"""Process-wide rate limiting for translator requests.
+
+Every backend request acquires from one shared `RateLimiter` before it goes out,
+so the aggregate request and character rates stay inside the configured budget
+no matter how many workers are running. This replaces the fixed per-thread
+`time.sleep(delay)` pacing, whose effective rate scaled with concurrency.
+
+Budgets are token buckets. Acquisition is reservation-based: a caller takes its
+tokens immediately (the bucket may go into debt) and sleeps until the debt it
+created is repaid, so waiting callers are served in arrival order without
+polling. `cool_down()` pauses every caller at once, e.g. after a 429.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """`rate` tokens per second, bursting up to `capacity`."""
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, self.rate))
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def reserve(self, amount, now=None):
+        """Take `amount` tokens and return how long the caller must wait before
+        using them. Callers must serialize access (RateLimiter holds a lock)."""
+        now = self._clock() if now is None else now
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= amount
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+    def refund(self, amount):
+        """Give back tokens reserved for a request that was never sent."""
+        self._tokens = min(self.capacity, self._tokens + amount)
+
+
+class RateLimiter:
+    def __init__(self, requests_per_second=None, characters_per_second=None,
+                 per_language=None, clock=time.monotonic, sleep=time.sleep):
+        """`per_language` maps a translator language code to its own
+        {"requests_per_second", "characters_per_second"} budget, enforced in
+        addition to the global one."""
+        self.requests_per_second = requests_per_second
+        self.characters_per_second = characters_per_second
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self.waited = 0.0  # total seconds callers spent throttled
+        self._buckets = self._make_buckets(requests_per_second, characters_per_second)
+        self._language_buckets = {
+            lang: self._make_buckets(
+                budget.get("requests_per_second"), budget.get("characters_per_second"),
+            )
+            for lang, budget in (per_language or {}).items()
+        }
+
+    def _make_buckets(self, requests_per_second, characters_per_second):
+        requests = TokenBucket(requests_per_second, clock=self._clock) if requests_per_second else None
+        # Allow one second's worth of characters as burst so single large
+        # requests don't always start in debt.
+        characters = TokenBucket(characters_per_second, clock=self._clock) if characters_per_second else None
+        return requests, characters
+
+    @classmethod
+    def from_config(cls, config):
+        """Build the limiter for a run. Without an explicit `requests_per_second`,
+        the legacy `delay_between_requests` becomes a run-wide request rate."""
+        rps = config.get('requests_per_second')
+        if rps is None:
+            delay = config.get('delay_between_requests') or 0
+            rps = 1.0 / delay if delay > 0 else None
+        return cls(
+            requests_per_second=rps,
+            characters_per_second=config.get('characters_per_second'),
+            per_language=config.get('rate_limits_per_language'),
+        )
+
+    @property
+    def enabled(self):
+        return bool(
+            self._buckets[0] or self._buckets[1] or self._language_buckets
+        )
+
+    def acquire(self, characters=0, lang=None, cancel=None):
+        """Block until one request of `characters` characters may be sent.
+        With a CancelToken the wait ends as soon as it trips: the reservation
+        is given back and CancelledError is raised."""
+        with self._lock:
+            now = self._clock()
+            wait = max(0.0, self._paused_until - now)
+            bucket_sets = [self._buckets]
+            if lang in self._language_buckets:
+                bucket_sets.append(self._language_buckets[lang])
+            reserved = []
+            for requests, chars in bucket_sets:
+                if requests is not None:
+                    wait = max(wait, requests.reserve(1, now))
+                    reserved.append((requests, 1))
+                if chars is not None and characters:
+                    wait = max(wait, chars.reserve(characters, now))
+                    reserved.append((chars, characters))
+            self.waited += wait
+        if wait <= 0:
+            return
+        if cancel is None:
+            self._sleep(wait)
+        elif cancel.wait(wait):
+            with self._lock:
+                # Don't leave debt behind for callers that are still sending.
+                for bucket, amount in reserved:
+                    bucket.refund(amount)
+                self.waited -= max(0.0, now + wait - self._clock())
+            cancel.check()
+
+    def cool_down(self, seconds):
+        """Pause every caller for `seconds` (extends, never shortens, a pause)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
@@ -0,0 +1,159 @@
+"""Global batch scheduler.
+
+Flattens every locale's pending batches into one shared FIFO queue drained by
+a fixed pool of workers. A locale with thousands of missing keys no longer
+pins a single thread while locales with three keys finish instantly and the
+rest of the pool sits idle: every worker keeps pulling (locale, batch) units
+until the whole run is done, so wall-clock time is bounded by total work over
+workers rather than by the largest locale.
+
+Jobs are plain objects exposing `next_batch()`, which returns the next batch
+or None once the job has nothing left to hand out. Completion accounting
+(e.g. writing a locale file after its last batch) is the job owner's concern.
+
+With an `AdaptiveConcurrency` gate the pool is sized to the gate's maximum and
+only `gate.limit` workers run at once; the gate moves that limit at runtime.
+"""
+
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Failure kinds that mean "too many concurrent requests" rather than bad input.
+THROTTLING_KINDS = ("rate_limit", "network", "circuit_open")
+
+
+class AdaptiveConcurrency:
+    """Scales the number of active workers from measured throughput.
+
+    Completed units are grouped into windows. After each window:
+
+        any rate-limit/timeout errors         -> halve the limit
+        throughput improved on the best so far -> one more worker
+        throughput fell well below the best    -> one fewer worker
+        otherwise                              -> hold (plateau)
+
+    `settled` is the limit the run spent the most time at, which is the value
+    worth pinning in config.
+    """
+
+    def __init__(self, initial=2, minimum=1, maximum=16, window=8, clock=time.monotonic):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.window = window
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._active = 0
+        self._best = None
+        self._time_at = Counter()
+        self._reset_window(clock())
+        self._limit_since = self._window_start
+
+    def _reset_window(self, now):
+        self._window_start = now
+        self._units = 0
+        self._items = 0
+        self._errors = 0
+
+    def acquire(self):
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+
+    def release(self):
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    def record(self, items, error_kind=None):
+        """Feed back one completed unit of `items` translated keys."""
+        with self._cond:
+            self._units += 1
+            self._items += items
+            if error_kind in THROTTLING_KINDS:
+                self._errors += 1
+            if self._errors or self._units >= max(self.window, self.limit * 2):
+                self._adjust()
+
+    def _adjust(self):
+        now = self._clock()
+        elapsed = max(now - self._window_start, 1e-6)
+        throughput = self._items / elapsed
+        new_limit = self.limit
+        if self._errors:
+            new_limit = max(self.minimum, self.limit // 2)
+            self._best = None
+        elif self._best is None or throughput > self._best * 1.1:
+            self._best = throughput if self._best is None else max(self._best, throughput)
+            new_limit = min(self.maximum, self.limit + 1)
+        elif throughput < self._best * 0.8:
+            new_limit = max(self.minimum, self.limit - 1)
+        self._set_limit(new_limit, now)
+        self._reset_window(now)
+
+    def _set_limit(self, new_limit, now):
+        if new_limit == self.limit:
+            return
+        self._time_at[self.limit] += now - self._limit_since
+        self._limit_since = now
+        self.limit = new_limit
+        self._cond.notify_all()
+
+    @property
+    def settled(self):
+        with self._cond:
+            time_at = Counter(self._time_at)
+            time_at[self.limit] += self._clock() - self._limit_since
+        return time_at.most_common(1)[0][0]
+
+
+class BatchScheduler:
+    def __init__(self, workers, gate=None):
+        self.gate = gate
+        self.workers = max(1, gate.maximum if gate is not None else workers)
+        self._queue = deque()
+        self._lock = threading.Lock()
+
+    def add(self, job):
+        with self._lock:
+            self._queue.append(job)
+
+    def _next_unit(self):
+        # FIFO over jobs: drain the head job before moving on, so locales
+        # complete (and get written) one after another instead of all at the end.
+        with self._lock:
+            while self._queue:
+                job = self._queue[0]
+                batch = job.next_batch()
+                if batch is not None:
+                    return job, batch
+                self._queue.popleft()
+            return None
+
+    def run(self, run_unit):
+        """Drain the queue. `run_unit(job, batch)` is called on worker threads
+        and is expected to handle its own errors."""
+        def worker():
+            while True:
+                if self.gate is not None:
+                    self.gate.acquire()
+                try:
+                    unit = self._next_unit()
+                    if unit is None:
+                        return
+                    run_unit(*unit)
+                finally:
+                    if self.gate is not None:
+                        self.gate.release()
+
+        with self._lock:
+            pending = len(self._queue)
+        if not pending:
+            return
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(worker) for _ in range(self.workers)]
+            for future in futures:
+                future.result()
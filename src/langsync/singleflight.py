@@ -0,0 +1,91 @@
+"""Run-wide single-flight table for translator requests.
+
+Several locales often resolve to the same translator language code (`es-ES`,
+`es-MX` and `es-419` all become `es`). Each locale still gets its own
+`TranslationService`, but they all share one `SingleFlight` so a given
+(language code, whitelist, protected text) is sent to the backend at most once
+per run: the first caller *owns* the request, concurrent callers wait for its
+result, and later callers reuse the completed value.
+
+Failed or empty results are not retained — the entry is dropped, waiters are
+told about the failure, and the next caller becomes the new owner and retries.
+"""
+
+import threading
+
+from .errors import TranslationError
+
+
+class _Flight:
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+    def result(self):
+        """Block until the owner resolves this flight. Raises TranslationError
+        if the owner's request failed."""
+        self.event.wait()
+        if self.error is not None:
+            kind = getattr(self.error, "kind", "api")
+            raise TranslationError(str(self.error), kind=kind) from self.error
+        return self.value
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+        self.shared = 0  # texts served from another caller's request
+
+    def claim(self, lang, whitelist_fp, texts):
+        """Split `texts` into (owned, waiting).
+
+        `owned` is the list of texts this caller must translate and then hand
+        to `resolve`/`fail`; `waiting` maps every other text to the flight that
+        will (or already did) produce it.
+        """
+        owned = []
+        waiting = {}
+        with self._lock:
+            for text in dict.fromkeys(texts):
+                key = (lang, whitelist_fp, text)
+                flight = self._flights.get(key)
+                if flight is None:
+                    self._flights[key] = _Flight()
+                    owned.append(text)
+                else:
+                    waiting[text] = flight
+            self.shared += len(waiting)
+        return owned, waiting
+
+    def resolve(self, lang, whitelist_fp, results):
+        """Publish {text: translation} for texts this caller owns."""
+        with self._lock:
+            flights = []
+            for text, value in results.items():
+                key = (lang, whitelist_fp, text)
+                flight = self._flights.get(key)
+                if flight is None:
+                    continue
+                if not value:
+                    # Don't pin an empty answer for the rest of the run.
+                    del self._flights[key]
+                flights.append((flight, value))
+        for flight, value in flights:
+            flight.value = value or None
+            flight.event.set()
+
+    def fail(self, lang, whitelist_fp, texts, error):
+        """Release owned texts after a failed request so another caller retries."""
+        with self._lock:
+            flights = []
+            for text in texts:
+                flight = self._flights.pop((lang, whitelist_fp, text), None)
+                if flight is not None:
+                    flights.append(flight)
+        for flight in flights:
+            flight.error = error
+            flight.event.set()
@@ -5,23 +5,45 @@ value at the time of the last successful sync. Compared against the live source
 on each run, this lets langsync tell apart keys that are genuinely missing in a
 target locale from keys whose source value has changed since the last sync.
 
-Schema:
+Schema (one entry per line, sorted, so the file diffs cleanly):
     {
-      "version": 1,
+      "version": 2,
       "hashes": {
-        "dotted.path.to.key": "<sha256-hex>",
+        "dotted.path.to.key": "<16-hex blake2b>",
         ...
+      },
+      "fingerprints": {
+        "source": {"size": ..., "mtime_ns": ..., "digest": ...},
+        "locales": {"fr-FR": {"size": ..., "mtime_ns": ..., "digest": ..., "orphans": [...]}}
       }
     }
+
+`fingerprints` (optional) describe the source file and every locale file that
+was fully in sync at the end of the last run. While both still match, a
+locale can be reported as up to date without parsing or classifying it. A
+file fingerprinted within RACY_WINDOW_NS of its last write gets a null
+`mtime_ns`; a later run fills it in with `settle_fingerprint`.
+
+Version 1 stored 64-hex SHA-256 digests of each value's JSON serialization.
+Those files still load: a digest's length tells the two schemes apart, so a
+v1 digest is compared with `legacy_value_hash` until the next save rewrites
+the file as v2.
 """
 
 import hashlib
 import json
 import os
-from collections import OrderedDict
+import time
+from json.encoder import encode_basestring
+
+from .fileio import write_atomic
 
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 2
 STATE_FILENAME = ".langsync-state.json"
+LEGACY_DIGEST_LENGTH = 64
+# A file modified this recently may change again within the same mtime tick,
+# so its fingerprint stores no mtime and is always checked by digest.
+RACY_WINDOW_NS = 2 * 10**9
 
 
 def path_to_key(path):
@@ -30,11 +52,30 @@ def path_to_key(path):
 
 
 def value_hash(value):
-    """Stable SHA-256 over the JSON serialization of any leaf value."""
+    """Stable 64-bit BLAKE2b digest of a leaf value. Strings are hashed from
+    their UTF-8 bytes; anything else from its canonical JSON. The one-byte
+    prefix keeps "1" and 1 apart."""
+    if isinstance(value, str):
+        payload = b"s" + value.encode("utf-8")
+    else:
+        payload = b"j" + json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+def legacy_value_hash(value):
+    """The schema v1 digest: SHA-256 over the JSON serialization."""
     payload = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
+def hash_matches(prior_hash, value, digest):
+    """True if a snapshot digest (v1 or v2) matches `value`, whose current
+    digest is `digest`."""
+    if prior_hash == digest:
+        return True
+    return len(prior_hash) == LEGACY_DIGEST_LENGTH and prior_hash == legacy_value_hash(value)
+
+
 def compute_source_hashes(source_data):
     """Walk every leaf in the source dict and return {path_key: hash}."""
     hashes = {}
@@ -54,29 +95,112 @@ def default_state_path(messages_dir):
     return os.path.join(messages_dir, STATE_FILENAME)
 
 
-def load_state(path):
-    """Return (hashes_dict, exists_bool). Missing/invalid files yield ({}, False)."""
+def _content_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+
+
+def file_fingerprint(path):
+    """Return {"size", "mtime_ns", "digest"} for the file at `path`."""
+    stat = os.stat(path)
+    recent = time.time_ns() - stat.st_mtime_ns < RACY_WINDOW_NS
+    return {
+        "size": stat.st_size,
+        "mtime_ns": None if recent else stat.st_mtime_ns,
+        "digest": _content_digest(path),
+    }
+
+
+def fingerprint_matches(path, recorded):
+    """True if the file at `path` still has the content `recorded` describes.
+    Size and mtime answer without reading the file; a different mtime (touch,
+    checkout, fresh clone) falls back to comparing the content digest."""
+    if not isinstance(recorded, dict):
+        return False
+    try:
+        stat = os.stat(path)
+        if stat.st_size != recorded.get("size"):
+            return False
+        if recorded.get("mtime_ns") is not None and stat.st_mtime_ns == recorded["mtime_ns"]:
+            return True
+        return _content_digest(path) == recorded.get("digest")
+    except OSError:
+        return False
+
+
+def settle_fingerprint(path, recorded):
+    """`recorded` with the file's mtime filled in, or None if there is
+    nothing to fill in: it already has one, or the file is still inside the
+    racy window. Call only once `recorded` is known to match the file."""
+    if recorded.get("mtime_ns") is not None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if time.time_ns() - stat.st_mtime_ns < RACY_WINDOW_NS:
+        return None
+    return dict(recorded, mtime_ns=stat.st_mtime_ns)
+
+
+def _valid_fingerprint(entry):
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("orphans", []), list)
+        and all(isinstance(key, str) for key in entry.get("orphans", []))
+    )
+
+
+def read_state(path):
+    """Return (hashes_dict, fingerprints_dict, exists_bool). Missing/invalid
+    files yield ({}, {}, False)."""
     if not path or not os.path.exists(path):
-        return {}, False
+        return {}, {}, False
     try:
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
     except (json.JSONDecodeError, OSError):
-        return {}, False
+        return {}, {}, False
     if not isinstance(data, dict):
-        return {}, False
+        return {}, {}, False
     hashes = data.get("hashes", {})
     if not isinstance(hashes, dict):
-        return {}, False
-    return {str(k): str(v) for k, v in hashes.items() if isinstance(v, str)}, True
+        return {}, {}, False
+    fingerprints = data.get("fingerprints")
+    if not isinstance(fingerprints, dict) or not isinstance(fingerprints.get("locales", {}), dict):
+        fingerprints = {}
+    elif fingerprints:
+        # A malformed entry (hand edits, merge conflicts) counts as no fingerprint.
+        fingerprints = {
+            "source": fingerprints.get("source") if _valid_fingerprint(fingerprints.get("source")) else None,
+            "locales": {
+                locale: entry for locale, entry in fingerprints.get("locales", {}).items()
+                if _valid_fingerprint(entry)
+            },
+        }
+    return {str(k): str(v) for k, v in hashes.items() if isinstance(v, str)}, fingerprints, True
 
 
-def save_state(path, hashes):
-    """Write the snapshot deterministically (sorted keys, trailing newline)."""
-    payload = OrderedDict()
-    payload["version"] = SCHEMA_VERSION
-    payload["hashes"] = OrderedDict(sorted(hashes.items()))
+def load_state(path):
+    """Return (hashes_dict, exists_bool). Missing/invalid files yield ({}, False)."""
+    hashes, _, exists = read_state(path)
+    return hashes, exists
+
+
+def save_state(path, hashes, fingerprints=None):
+    """Write the snapshot deterministically (sorted keys, trailing newline).
+    Returns False when the file already had this content.
+
+    Serialized by hand: json.dump with `indent` falls back to the pure-Python
+    encoder, which dominated save time on large sources."""
+    entries = ",\n".join(
+        f"    {encode_basestring(key)}: {encode_basestring(digest)}" for key, digest in sorted(hashes.items())
+    )
+    hashes_body = f"{{\n{entries}\n  }}" if entries else "{}"
+    body = f'{{\n  "version": {SCHEMA_VERSION},\n  "hashes": {hashes_body}'
+    if fingerprints:
+        nested = json.dumps(fingerprints, indent=2, sort_keys=True, ensure_ascii=False).replace("\n", "\n  ")
+        body += f',\n  "fingerprints": {nested}'
+    body += "\n}\n"
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    return write_atomic(path, body)
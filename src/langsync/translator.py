@@ -1,14 +1,32 @@
+import functools
 import time
 import re
-from deep_translator import GoogleTranslator
+import threading
 from .config import PLACEHOLDER_REGEX, LANG_MAP, WHITELIST as DEFAULT_WHITELIST
+from .backends import DEFAULT_BACKEND, create_backend
+from .circuit import CIRCUIT_OPEN
+from .errors import TranslationError
+from .memory import whitelist_fingerprint
 
 
-class TranslationError(Exception):
-    """Raised when a translation request fails (network, rate limit, API error)."""
-    def __init__(self, message, kind="unknown"):
-        super().__init__(message)
-        self.kind = kind  # "rate_limit", "network", "api", "unknown"
+# Any PH<n>X / WL<n>X marker, tolerating the case changes and spaces (but not
+# line breaks) translators introduce, e.g. "wl 3 X".
+MARKER_REGEX = re.compile(r'(PH|WL)[^\S\n]*(\d+)[^\S\n]*X', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_matcher(words):
+    """One regex that finds placeholders and whitelist terms in a single pass.
+
+    Placeholders come first in the alternation; whitelist terms follow longest
+    first, so at any position the longest matching term wins. Terms keep their
+    word boundaries and case-insensitive matching. Compiled once per whitelist.
+    """
+    terms = sorted((word for word in dict.fromkeys(words) if word), key=len, reverse=True)
+    pattern = f"(?P<ph>{PLACEHOLDER_REGEX.pattern})"
+    if terms:
+        pattern += r"|\b(?i:" + "|".join(re.escape(word) for word in terms) + r")\b"
+    return re.compile(pattern)
 
 
 class TextProtector:
@@ -19,28 +37,16 @@ class TextProtector:
             return text, {}
 
         markers = {}
+        active_whitelist = whitelist if whitelist is not None else DEFAULT_WHITELIST
+        matcher = _compile_matcher(tuple(active_whitelist))
 
-        def placeholder_replacer(match):
-            marker = f"PH{len(markers)}X"
+        def replacer(match):
+            prefix = "PH" if match.group("ph") is not None else "WL"
+            marker = f"{prefix}{len(markers)}X"
             markers[marker] = match.group(0)
             return marker
 
-        protected_text = PLACEHOLDER_REGEX.sub(placeholder_replacer, text)
-
-        active_whitelist = whitelist if whitelist is not None else DEFAULT_WHITELIST
-
-        for word in sorted(active_whitelist, key=len, reverse=True):
-            if not word:
-                continue
-            pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
-
-            def word_replacer(match):
-                marker = f"WL{len(markers)}X"
-                markers[marker] = match.group(0)
-                return marker
-
-            protected_text = pattern.sub(word_replacer, protected_text)
-
+        protected_text = matcher.sub(replacer, text)
         return protected_text, markers
 
     @staticmethod
@@ -49,42 +55,388 @@ class TextProtector:
         if not text or not markers:
             return text
 
-        restored_text = text
-        for marker, original in sorted(markers.items(), key=lambda x: len(x[0]), reverse=True):
-            if marker == '_meta':
+        def marker_replacer(match):
+            marker = f"{match.group(1).upper()}{match.group(2)}X"
+            return markers.get(marker, match.group(0))
+
+        return MARKER_REGEX.sub(marker_replacer, text)
+
+
+class ProtectionTable:
+    """Run-wide cache of TextProtector output.
+
+    Protection depends only on the source text and the whitelist, never on the
+    target language, so every locale's TranslationService shares one table and
+    each distinct source string is protected once per run. Each entry is
+    (protected_text, markers) with the trailing-dot flag under `markers['_meta']`;
+    entries are shared between threads and must not be mutated.
+    """
+
+    def __init__(self, whitelist=None):
+        self.whitelist = whitelist
+        self.fingerprint = whitelist_fingerprint(
+            whitelist if whitelist is not None else DEFAULT_WHITELIST
+        )
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def protect(self, text):
+        if not isinstance(text, str):
+            return text, {'_meta': {'has_trailing_dot': False}}
+        entry = self._entries.get(text)
+        if entry is None:
+            protected_text, markers = TextProtector.protect(text, self.whitelist)
+            markers['_meta'] = {'has_trailing_dot': text.strip().endswith('.')}
+            # setdefault keeps the first entry if two workers race on a new text.
+            entry = self._entries.setdefault(text, (protected_text, markers))
+        return entry
+
+    def precompute(self, texts):
+        """Protect every string in `texts` ahead of the workers."""
+        for text in texts:
+            self.protect(text)
+
+
+class BatchPacker:
+    """Joins many protected strings into one request and splits the answer.
+
+    Segments are separated by `SEG<n>X` tokens on their own line — the same
+    letters-digits-X shape as the protection markers, which translators leave
+    alone. Splitting tolerates the spacing/case mangling translators introduce
+    and validates alignment per segment, so one mangled separator only costs
+    the two segments around it.
+    """
+
+    SEPARATOR = "\nSEG{}X\n"
+    SEPARATOR_REGEX = re.compile(r'S\s*E\s*G\s*(\d+)\s*X', re.IGNORECASE)
+
+    @staticmethod
+    def plan(texts, max_chars, max_items=None):
+        """Group consecutive indices into packs whose joined length fits
+        `max_chars` (and of at most `max_items` items). An item longer than
+        the limit gets a pack of its own."""
+        packs = []
+        current = []
+        size = 0
+        for i, text in enumerate(texts):
+            cost = len(text) + (len(BatchPacker.SEPARATOR.format(len(current))) if current else 0)
+            if current and (size + cost > max_chars or (max_items and len(current) >= max_items)):
+                packs.append(current)
+                current, size = [], 0
+                cost = len(text)
+            current.append(i)
+            size += cost
+        if current:
+            packs.append(current)
+        return packs
+
+    @staticmethod
+    def join(texts):
+        parts = [texts[0]]
+        for i, text in enumerate(texts[1:], start=1):
+            parts.append(BatchPacker.SEPARATOR.format(i))
+            parts.append(text)
+        return "".join(parts)
+
+    @staticmethod
+    def split(text, count):
+        """Split a translated pack back into `count` segments. Segments whose
+        boundaries are missing, duplicated or out of order come back as None."""
+        if count == 1:
+            return [text.strip() or None] if text else [None]
+        if not text:
+            return [None] * count
+
+        tokens = [(int(m.group(1)), m.start(), m.end()) for m in BatchPacker.SEPARATOR_REGEX.finditer(text)]
+        seen = {}
+        duplicated = set()
+        for idx, start, end in tokens:
+            if idx in seen:
+                duplicated.add(idx)
+            seen[idx] = (start, end)
+
+        results = []
+        for i in range(count):
+            if i == 0:
+                left = (0, 0)
+            elif i in seen and i not in duplicated:
+                left = seen[i]
+            else:
+                left = None
+            if i == count - 1:
+                right = (len(text), len(text))
+            elif (i + 1) in seen and (i + 1) not in duplicated:
+                right = seen[i + 1]
+            else:
+                right = None
+
+            if left is None or right is None or left[1] > right[0]:
+                results.append(None)
                 continue
-            pattern = re.compile(re.escape(marker), re.IGNORECASE)
-            restored_text = pattern.sub(original, restored_text)
+            # Any other separator inside the segment means the order was scrambled.
+            if any(left[1] <= start < right[0] for _, start, _ in tokens):
+                results.append(None)
+                continue
+            segment = text[left[1]:right[0]].strip()
+            results.append(segment or None)
+        return results
+
 
-        return restored_text
+# Google rejects payloads over 5000 characters; leave headroom for separators.
+PACK_MAX_CHARS = 4500
 
 
-def _classify_error(exc):
-    msg = str(exc)
-    if "429" in msg or "Too Many Requests" in msg.lower() or "rate" in msg.lower():
-        return "rate_limit"
-    if "timeout" in msg.lower() or "connection" in msg.lower() or "network" in msg.lower():
-        return "network"
-    return "api"
+# Failures that say a backend is throttled or unreachable, not that the text is
+# bad: with a fallback configured, the request moves on to the next backend.
+FAILOVER_KINDS = ("rate_limit", "network", CIRCUIT_OPEN)
 
 
 class TranslationService:
-    def __init__(self, source_lang='en', target_lang='en', whitelist=None):
+    def __init__(self, source_lang='en', target_lang='en', whitelist=None, memory=None, flights=None,
+                 pack=False, pack_max_chars=PACK_MAX_CHARS, limiter=None, breaker=None,
+                 protections=None, backend=DEFAULT_BACKEND, backend_options=None,
+                 backends=None, breakers=None, stats=None, cancel=None, limiters=None):
+        """`backends` is an optional ordered route of backend instances (primary
+        first, then fallbacks); without it a single `backend` is created by name
+        with `backend_options`."""
         self.source_lang = source_lang
         self.target_lang = target_lang
         self.whitelist = whitelist
-        self.translator = None
-        if source_lang != target_lang:
-            self.translator = GoogleTranslator(source=source_lang, target=target_lang)
+        self._enabled = source_lang != target_lang
+        if not self._enabled:
+            self.backends = []
+        elif backends:
+            self.backends = list(backends)
+        else:
+            # Built eagerly so unknown backends and unsupported language codes fail here.
+            self.backends = [create_backend(backend, source_lang, target_lang, backend_options)]
+        # Pack a batch into as few backend requests as the character limit
+        # allows; backends with a native batch request don't need it.
+        self.pack = pack
+        self.pack_max_chars = pack_max_chars
+        self.misaligned = 0  # packed segments that could not be split back reliably
+        # Optional shared RateLimiter for every backend, or per-backend ones in
+        # `limiters` ({backend name: RateLimiter}) so a local fallback doesn't
+        # spend a remote primary's budget. When set it paces every request to
+        # that backend and the per-call `delay` arguments are ignored.
+        self.limiter = limiter
+        self.limiters = limiters or {}
+        # Optional shared CircuitBreaker for every backend, or per-backend ones in
+        # `breakers` ({backend name: CircuitBreaker}); an open circuit raises
+        # CircuitOpenError instead of sending, or skips to the next backend.
+        self.breaker = breaker
+        self.breakers = breakers or {}
+        # Optional run-wide BackendStats.
+        self.stats = stats
+        # Optional run-wide CancelToken: once tripped, no further requests are
+        # sent and calls raise CancelledError.
+        self.cancel = cancel
+        self._lock = threading.Lock()
+        self._timing = threading.local()  # per-thread backend call time, see call_seconds
+        # Optional TranslationMemory consulted before every backend call.
+        self.memory = memory if any(b.cacheable for b in self.backends) or not self.backends else None
+        # Optional run-wide SingleFlight shared by every locale with this language code.
+        self.flights = flights
+        # Protected source strings; pass the run's shared ProtectionTable (built
+        # for the same whitelist) so locales don't protect the same text again.
+        self.protections = protections if protections is not None else ProtectionTable(whitelist)
+        self.whitelist_fp = self.protections.fingerprint
+
+    @property
+    def backend(self):
+        """The primary backend, or None when no translation is needed."""
+        return self.backends[0] if self.backends else None
 
     def _needs_translation(self, text):
         return (
-            self.translator is not None
+            self.backend is not None
             and isinstance(text, str)
             and text.strip()
             and len(text) >= 2
         )
 
+    def _breaker_for(self, backend):
+        return self.breakers.get(backend.name, self.breaker)
+
+    def _limiter_for(self, backend):
+        return self.limiters.get(backend.name, self.limiter)
+
+    def cool_down(self, seconds):
+        """Pause every rate limiter on this route for `seconds`, e.g. after a
+        rate limit made it all the way through the route. Returns False if
+        the route has no limiter, so the caller should back off itself."""
+        limiters = {id(l): l for l in map(self._limiter_for, self.backends) if l is not None}
+        for limiter in limiters.values():
+            limiter.cool_down(seconds)
+        return bool(limiters)
+
+    def _send(self, backend, call, texts):
+        """Issue one backend call for `texts`: check the circuit breaker,
+        acquire from the rate limiter, then report the outcome back."""
+        if self.cancel is not None:
+            self.cancel.check()
+        breaker = self._breaker_for(backend)
+        probe = breaker.before_call(self.cancel) if breaker is not None else False
+        limiter = self._limiter_for(backend)
+        if limiter is not None:
+            try:
+                limiter.acquire(sum(len(t) for t in texts), lang=self.target_lang, cancel=self.cancel)
+                # The limiter may have waited a while; don't send after a cancel.
+                if self.cancel is not None:
+                    self.cancel.check()
+            except BaseException:
+                if probe:
+                    # Nothing was sent, so there is no outcome to report; let
+                    # another caller probe instead of leaving the circuit half-open.
+                    breaker.release_probe()
+                raise
+        started = time.monotonic()
+        try:
+            result = call()
+        except Exception as e:
+            elapsed = self._timed(started)
+            kind = backend.classify_error(e)
+            if breaker is not None:
+                breaker.record_failure(kind)
+            if self.stats is not None:
+                self.stats.record(backend.name, len(texts), elapsed, kind)
+            raise
+        elapsed = self._timed(started)
+        if breaker is not None:
+            breaker.record_success()
+        if self.stats is not None:
+            self.stats.record(backend.name, len(texts), elapsed)
+        return result
+
+    def _timed(self, started):
+        elapsed = time.monotonic() - started
+        self._timing.seconds = self.call_seconds() + elapsed
+        return elapsed
+
+    def call_seconds(self):
+        """Seconds the calling thread has spent inside backend calls so far,
+        not counting circuit, rate limiter or retry waits."""
+        return getattr(self._timing, "seconds", 0.0)
+
+    def _call_backend(self, texts, delay, single):
+        """One round trip along the route. Returns {text: raw translation}.
+        A backend that is rate-limited, unreachable or behind an open circuit
+        hands the request to the next one in the route. Each backend first
+        answers from its own entries in the translation memory and stores what
+        it translates there, so one engine's output is never served as another's."""
+        lang, fp = self.target_lang, self.whitelist_fp
+        results = {}
+        pending = texts
+        last = len(self.backends) - 1
+        for i, backend in enumerate(self.backends):
+            remember = self.memory is not None and backend.cacheable
+            if remember:
+                results.update(self.memory.get_many(backend.name, lang, fp, pending))
+                pending = [t for t in pending if t not in results]
+                if not pending:
+                    return results
+            breaker = self._breaker_for(backend)
+            if i < last and breaker is not None and not breaker.allows_request():
+                if self.stats is not None:
+                    self.stats.record_failover(backend.name)
+                continue
+            try:
+                fetched = self._call_one(backend, pending, single)
+            except TranslationError as e:
+                if i == last or e.kind not in FAILOVER_KINDS:
+                    raise
+                if self.stats is not None:
+                    self.stats.record_failover(backend.name)
+                continue
+            if remember:
+                self.memory.put_many(backend.name, lang, fp, zip(pending, fetched))
+            if delay > 0 and self._limiter_for(backend) is None:
+                if self.cancel is not None:
+                    self.cancel.wait(delay)
+                else:
+                    time.sleep(delay)
+            results.update(zip(pending, fetched))
+            return results
+
+    def _call_one(self, backend, texts, single):
+        try:
+            if single:
+                fetched = [self._send(backend, lambda: backend.translate(texts[0]), texts)]
+            elif self.pack and not backend.native_batch:
+                fetched = self._translate_packed(backend, texts)
+            elif not backend.native_batch:
+                # One request per item, so pace and report each one on its own.
+                fetched = [self._send(backend, lambda: backend.translate(t), [t]) for t in texts]
+            else:
+                fetched = []
+                # Respect the backend's declared per-request item and character limits.
+                for chunk in BatchPacker.plan(texts, backend.max_chars, backend.max_batch_items):
+                    chunk_texts = [texts[i] for i in chunk]
+                    fetched.extend(self._send(backend, lambda: backend.translate_batch(chunk_texts), chunk_texts) or [])
+        except TranslationError:
+            raise
+        except Exception as e:
+            kind = backend.classify_error(e)
+            if kind == "rate_limit" and not single:
+                # Preserve legacy message so cli rate-limit branch keeps matching.
+                raise TranslationError("RATE_LIMIT_HIT", kind=kind) from e
+            raise TranslationError(str(e), kind=kind) from e
+
+        if not fetched or len(fetched) != len(texts):
+            raise TranslationError(
+                f"Batch returned {len(fetched) if fetched else 0} items, expected {len(texts)}",
+                kind="api",
+            )
+        return fetched
+
+    def _translate_packed(self, backend, texts):
+        """Send `texts` as few joined requests as possible. Misaligned segments
+        come back as None so callers retry just those items on their own."""
+        fetched = [None] * len(texts)
+        for pack in BatchPacker.plan(texts, min(self.pack_max_chars, backend.max_chars)):
+            if len(pack) == 1:
+                text = texts[pack[0]]
+                fetched[pack[0]] = self._send(backend, lambda: backend.translate(text), [text])
+                continue
+            joined = BatchPacker.join([texts[i] for i in pack])
+            segments = BatchPacker.split(
+                self._send(backend, lambda: backend.translate(joined), [joined]), len(pack),
+            )
+            for i, segment in zip(pack, segments):
+                fetched[i] = segment
+            with self._lock:
+                self.misaligned += sum(1 for seg in segments if seg is None)
+        return fetched
+
+    def _fetch(self, protected_texts, delay, single=False):
+        """Raw backend output aligned with `protected_texts` (None for empty
+        answers). Identical texts are requested once; the run-wide single-flight
+        table and the translation memory are consulted before the backend."""
+        lang, fp = self.target_lang, self.whitelist_fp
+        unique = list(dict.fromkeys(protected_texts))
+        if self.flights is not None:
+            owned, waiting = self.flights.claim(lang, fp, unique)
+        else:
+            owned, waiting = unique, {}
+
+        results = {}
+        try:
+            if owned:
+                results = self._call_backend(owned, delay, single)
+        except BaseException as e:
+            if self.flights is not None:
+                self.flights.fail(lang, fp, owned, e)
+            raise
+
+        if self.flights is not None:
+            self.flights.resolve(lang, fp, {t: results.get(t) for t in owned})
+        for text, flight in waiting.items():
+            results[text] = flight.result()
+
+        return [results.get(t) or None for t in protected_texts]
+
     def translate_one(self, text, delay=0.0):
         """Translate a single string. Raises TranslationError on failure.
         Returns the original text if translation is not applicable (empty / too short / same lang).
@@ -92,14 +444,8 @@ class TranslationService:
         if not self._needs_translation(text):
             return text
 
-        protected_text, markers = TextProtector.protect(text, self.whitelist)
-        try:
-            translated = self.translator.translate(protected_text)
-        except Exception as e:
-            raise TranslationError(str(e), kind=_classify_error(e)) from e
-
-        if delay > 0:
-            time.sleep(delay)
+        protected_text, markers = self.protections.protect(text)
+        translated = self._fetch([protected_text], delay, single=True)[0]
 
         restored = TextProtector.restore(translated, markers)
         if not restored:
@@ -118,36 +464,14 @@ class TranslationService:
         Returns a list aligned with the input where each entry is either the translated
         string or None for items that came back empty/invalid.
         """
-        if not self.translator or not texts:
+        if not self.backend or not texts:
             return texts
 
-        protected_batch = []
-        batch_markers = []
-
-        for text in texts:
-            has_trailing_dot = text.strip().endswith('.') if isinstance(text, str) else False
-            protected_text, markers = TextProtector.protect(text, self.whitelist)
-            protected_batch.append(protected_text)
-            markers['_meta'] = {'has_trailing_dot': has_trailing_dot}
-            batch_markers.append(markers)
-
-        try:
-            translated_batch = self.translator.translate_batch(protected_batch)
-        except Exception as e:
-            kind = _classify_error(e)
-            if kind == "rate_limit":
-                # Preserve legacy message so cli rate-limit branch keeps matching.
-                raise Exception("RATE_LIMIT_HIT") from e
-            raise TranslationError(str(e), kind=kind) from e
+        protected = [self.protections.protect(text) for text in texts]
+        protected_batch = [protected_text for protected_text, _ in protected]
+        batch_markers = [markers for _, markers in protected]
 
-        if delay > 0:
-            time.sleep(delay)
-
-        if not translated_batch or len(translated_batch) != len(texts):
-            raise TranslationError(
-                f"Batch returned {len(translated_batch) if translated_batch else 0} items, expected {len(texts)}",
-                kind="api",
-            )
+        translated_batch = self._fetch(protected_batch, delay)
 
         results = []
         for translated, markers in zip(translated_batch, batch_markers):
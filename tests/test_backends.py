@@ -0,0 +1,252 @@
+import pytest
+
+from langsync.backends import BACKENDS, OfflineBackend, create_backend, get_backend
+from langsync.backends.google import GoogleBackend
+from langsync.errors import TranslationError
+from langsync.translator import TranslationService
+
+
+def _offline(**options):
+    return OfflineBackend("en", "fr", latency=0, sleep=lambda s: None, **options)
+
+
+def test_registry_and_unknown_backend():
+    assert set(BACKENDS) >= {"google", "offline"}
+    assert isinstance(create_backend("offline", "en", "fr", {"latency": 0}), OfflineBackend)
+    with pytest.raises(TranslationError) as exc:
+        get_backend("nope")
+    assert exc.value.kind == "init"
+
+
+def test_unknown_backend_option_is_rejected():
+    with pytest.raises(TypeError, match="bogus"):
+        create_backend("google", "en", "fr", {"bogus": 1})
+
+
+def test_offline_backend_keeps_markers_and_separators():
+    backend = _offline()
+    assert backend.translate("Hello PH0X\nSEG1X\nWL2X there") == "Hélló PH0X\nSEG1X\nWL2X théré"
+    assert backend.translate_batch(["one", "two"]) == ["óné", "twó"]
+    assert backend.requests == 2
+
+
+def test_offline_backend_injects_classified_failures():
+    sleeps = []
+    backend = OfflineBackend("en", "fr", latency=0.5, jitter=0.1, rate_limit_rate=0.5,
+                             timeout_rate=0.5, seed=1, sleep=sleeps.append)
+    kinds = set()
+    for _ in range(20):
+        try:
+            backend.translate("hello")
+        except Exception as e:
+            kinds.add(backend.classify_error(e))
+    assert kinds == {"rate_limit", "network"}
+    assert all(0.4 <= s <= 0.6 for s in sleeps)
+
+
+def test_google_backend_classifies_errors(mocker):
+    mocker.patch("langsync.backends.google.GoogleTranslator")
+    from deep_translator.exceptions import RequestError, TooManyRequests
+
+    backend = GoogleBackend("en", "fr")
+    assert backend.classify_error(TooManyRequests()) == "rate_limit"
+    assert backend.classify_error(Exception("Connection reset")) == "network"
+    assert backend.classify_error(TimeoutError()) == "network"
+    assert backend.classify_error(ValueError("bad payload")) == "api"
+    assert backend.classify_error(RequestError()) == "network"
+
+
+def test_service_respects_backend_batch_limit_and_skips_memory(tmp_path):
+    from langsync.memory import TranslationMemory
+
+    memory = TranslationMemory(str(tmp_path / "memory.sqlite"))
+    service = TranslationService(
+        target_lang="fr", backend="offline", pack=True, memory=memory,
+        backend_options={"latency": 0, "max_batch_items": 2},
+    )
+    assert service.memory is None
+
+    assert service.translate_batch(["one", "two", "three"], delay=0) == ["óné", "twó", "thréé"]
+    assert service.backend.requests == 2
+    memory.close()
+
+
+def test_argos_backend_requires_optional_dependency(mocker):
+    mocker.patch.dict("sys.modules", {"argostranslate": None, "argostranslate.package": None})
+    with pytest.raises(TranslationError, match="argostranslate") as exc:
+        create_backend("argos", "en", "fr")
+    assert exc.value.kind == "init"
+
+
+def test_argos_backend_runs_one_batched_inference(mocker):
+    from types import SimpleNamespace
+    from langsync.backends import argos
+
+    calls = []
+
+    class _Tokenizer:
+        def encode(self, texts, out_type):
+            return [text.split() for text in texts]
+
+        def decode(self, tokens):
+            return " ".join(tokens)
+
+    class _Translator:
+        def translate_batch(self, tokens, **kwargs):
+            calls.append(tokens)
+            return [SimpleNamespace(hypotheses=[[t.upper() for t in sent]]) for sent in tokens]
+
+    mocker.patch.object(argos, "_require_argos")
+    mocker.patch.object(argos, "_find_package")
+    mocker.patch.object(argos, "_load_model", return_value=(_Tokenizer(), _Translator()))
+
+    service = TranslationService(
+        target_lang="iw", backend="argos", backend_options={"processes": 0},
+    )
+    assert service.backend.target == "he"
+    assert service.translate_batch(["hello PH0X", "good day"], delay=0) == ["HELLO PH0X", "GOOD DAY"]
+    assert calls == [[["hello", "PH0X"], ["good", "day"]]]
+
+
+class _Backup(OfflineBackend):
+    name = "backup"
+
+
+def test_route_fails_over_on_rate_limit_and_reports_stats():
+    from langsync.backends.stats import BackendStats
+    from langsync.circuit import CircuitBreaker
+
+    primary = OfflineBackend("en", "ja", latency=0, rate_limit_rate=1.0)
+    backup = _Backup("en", "ja", latency=0)
+    breakers = {"offline": CircuitBreaker(threshold=2, cooldown=60), "backup": CircuitBreaker(threshold=2)}
+    stats = BackendStats()
+    service = TranslationService(target_lang="ja", backends=[primary, backup], breakers=breakers, stats=stats)
+
+    for _ in range(4):
+        assert service.translate_batch(["hello"], delay=0) == ["hélló"]
+
+    # The primary's circuit opened after two 429s; later batches skip it.
+    assert primary.requests == 2
+    assert backup.requests == 4
+    rows = {row[0]: row for row in stats.rows()}
+    assert rows["offline"][4] == {"rate_limit": 2}
+    assert rows["offline"][5] == 4
+    assert rows["backup"][2] == 4
+    assert stats.troubled
+
+
+def test_memory_is_kept_per_backend_across_failover(tmp_path):
+    from langsync.memory import TranslationMemory
+
+    class Primary(OfflineBackend):
+        name = "primary"
+        cacheable = True
+
+    class Fallback(OfflineBackend):
+        name = "fallback"
+        cacheable = True
+
+        def _pseudo(self, text):
+            return f"fallback {text}"
+
+    memory = TranslationMemory(str(tmp_path / "mem.sqlite"))
+    down = Primary("en", "ja", latency=0, timeout_rate=1.0)
+    service = TranslationService(target_lang="ja", memory=memory,
+                                 backends=[down, Fallback("en", "ja", latency=0)])
+    assert service.translate_batch(["hello"], delay=0) == ["fallback hello"]
+
+    # The primary is healthy again: the fallback's entry is not served for it.
+    healthy = Primary("en", "ja", latency=0)
+    service = TranslationService(target_lang="ja", memory=memory,
+                                 backends=[healthy, Fallback("en", "ja", latency=0)])
+    assert service.translate_batch(["hello"], delay=0) == ["hélló"]
+    assert healthy.requests == 1
+    assert service.translate_batch(["hello"], delay=0) == ["hélló"]
+    assert healthy.requests == 1  # now answered from the primary's own entry
+    memory.close()
+
+
+def test_each_backend_on_a_route_has_its_own_limiter():
+    from langsync.ratelimit import RateLimiter
+
+    class CountingLimiter(RateLimiter):
+        def __init__(self):
+            super().__init__()
+            self.acquired = 0
+            self.cooled = 0
+
+        def acquire(self, characters=0, lang=None, cancel=None):
+            self.acquired += 1
+
+        def cool_down(self, seconds):
+            self.cooled += 1
+
+    primary = OfflineBackend("en", "ja", latency=0, timeout_rate=1.0)
+    backup = _Backup("en", "ja", latency=0)
+    limiters = {"offline": CountingLimiter(), "backup": CountingLimiter()}
+    service = TranslationService(target_lang="ja", backends=[primary, backup], limiters=limiters)
+    for _ in range(3):
+        assert service.translate_batch(["hello"], delay=0) == ["hélló"]
+
+    # Each request is charged to the backend it went to, not to one shared budget.
+    assert limiters["offline"].acquired == primary.requests == 3
+    assert limiters["backup"].acquired == backup.requests == 3
+
+    assert service.cool_down(2) is True
+    assert [limiter.cooled for limiter in limiters.values()] == [1, 1]
+    assert TranslationService(target_lang="ja", backends=[backup]).cool_down(2) is False
+
+
+def test_last_backend_errors_are_raised():
+    backup = _Backup("en", "ja", latency=0, rate_limit_rate=1.0)
+    service = TranslationService(target_lang="ja", backends=[OfflineBackend("en", "ja", latency=0, timeout_rate=1.0), backup])
+    with pytest.raises(TranslationError) as exc:
+        service.translate_batch(["hello"], delay=0)
+    assert exc.value.kind == "rate_limit"
+
+
+def test_backend_cache_reuses_instances_and_sessions(mocker):
+    from langsync.backends import BackendCache
+
+    mocker.patch("langsync.backends.google.GoogleTranslator")
+    cache = BackendCache({"offline": {"latency": 0}}, pool_size=3)
+    es = cache.get("google", "en", "es")
+    assert cache.get("google", "en", "es") is es
+    fr = cache.get("google", "en", "fr")
+    assert fr is not es and fr.session is es.session
+    assert es.session.get_adapter("https://translate.google.com")._pool_maxsize == 3
+    assert cache.get("offline", "en", "es").latency == 0
+    assert len(cache) == 3
+    cache.close()
+
+
+def test_google_backend_uses_its_session(mocker):
+    mocker.patch("langsync.backends.google.GoogleTranslator").return_value.configure_mock(source="en", target="es")
+    session = mocker.MagicMock()
+    session.get.return_value.status_code = 200
+    session.get.return_value.text = '<html><div class="result-container"> Hola </div></html>'
+
+    backend = GoogleBackend("en", "es", session=session)
+    assert backend.translate_batch([" Hello ", "Bye"]) == ["Hola", "Hola"]
+    assert session.get.call_args_list[0].kwargs["params"] == {"sl": "en", "tl": "es", "q": "Hello"}
+
+    for status, kind in [(429, "rate_limit"), (400, "api"), (403, "api"), (503, "network")]:
+        session.get.return_value.status_code = status
+        with pytest.raises(Exception) as exc:
+            backend.translate("Hello")
+        assert backend.classify_error(exc.value) == kind
+
+
+def test_offline_timeout_and_cache_default_timeout():
+    slept = []
+    backend = OfflineBackend("en", "fr", latency=5, timeout=0.5, sleep=slept.append)
+    with pytest.raises(TimeoutError) as exc:
+        backend.translate("hello")
+    assert slept == [0.5]
+    assert backend.classify_error(exc.value) == "network"
+
+    from langsync.backends import BackendCache
+    cache = BackendCache({"libretranslate": {"timeout": 2.0}}, timeout=7.0)
+    assert cache.get("offline", "en", "fr").timeout == 7.0
+    assert cache.get("libretranslate", "en", "fr").timeout == 2.0
+    cache.close()
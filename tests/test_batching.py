@@ -0,0 +1,55 @@
+from collections import deque
+
+from langsync.batching import MIN_BATCH_CHARS, AdaptiveBatchSizer
+
+
+def _items(*values):
+    return deque(([[f"k{i}"]], v) for i, v in enumerate(values))
+
+
+def test_take_respects_item_limit():
+    sizer = AdaptiveBatchSizer(initial=2)
+    pending = _items("a", "b", "c")
+    assert [v for _, v in sizer.take(pending)] == ["a", "b"]
+    assert len(pending) == 1
+
+
+def test_take_caps_by_characters_but_always_returns_one_item():
+    sizer = AdaptiveBatchSizer(initial=10, max_chars=MIN_BATCH_CHARS)
+    long_text = "x" * (MIN_BATCH_CHARS + 50)
+    pending = _items("short", "y" * 150, long_text)
+
+    assert [v for _, v in sizer.take(pending)] == ["short", "y" * 150]
+    # An item bigger than the whole budget still goes out on its own.
+    assert [v for _, v in sizer.take(pending)] == [long_text]
+
+
+def test_grows_additively_on_fast_clean_full_batches():
+    sizer = AdaptiveBatchSizer(initial=10, maximum=14, target_latency=1.0)
+    sizer.record(latency=0.2, items=10, chars=50, clean=True)
+    assert sizer.size == 12
+    sizer.record(latency=0.2, items=12, chars=50, clean=True)
+    sizer.record(latency=0.2, items=14, chars=50, clean=True)
+    assert sizer.size == 14
+
+
+def test_does_not_grow_on_short_tail_batches():
+    sizer = AdaptiveBatchSizer(initial=10, target_latency=1.0)
+    sizer.record(latency=0.2, items=3, chars=10, clean=True)
+    assert sizer.size == 10
+
+
+def test_halves_on_errors_and_shrinks_on_slow_batches():
+    sizer = AdaptiveBatchSizer(initial=20, max_chars=4000, target_latency=1.0)
+    sizer.record(latency=0.5, items=20, chars=100, clean=False)
+    assert (sizer.size, sizer.chars) == (10, 2000)
+    sizer.record(latency=5.0, items=10, chars=100, clean=True)
+    assert (sizer.size, sizer.chars) == (7, 1500)
+
+
+def test_non_adaptive_mode_is_a_fixed_item_count():
+    sizer = AdaptiveBatchSizer(initial=2, max_chars=MIN_BATCH_CHARS, adaptive=False)
+    pending = _items("a" * 300, "b" * 300, "c")
+    assert len(sizer.take(pending)) == 2
+    sizer.record(latency=10, items=2, chars=600, clean=False)
+    assert sizer.size == 2
@@ -0,0 +1,35 @@
+import pytest
+
+from langsync.cancel import CANCELLED, CancelledError, CancelToken
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cancel_token_trips_on_request_and_on_deadline():
+    token = CancelToken()
+    token.check()
+    token.cancel("interrupted")
+    token.cancel("again")
+    assert token.cancelled and token.reason == "interrupted"
+
+    clock = _Clock()
+    timed = CancelToken(timeout=10, clock=clock)
+    clock.now = 9.9
+    assert not timed.cancelled
+    clock.now = 10.0
+    with pytest.raises(CancelledError) as exc:
+        timed.check()
+    assert exc.value.kind == CANCELLED
+    assert timed.reason == "run deadline reached"
+
+
+def test_wait_returns_early_once_cancelled():
+    token = CancelToken()
+    token.cancel()
+    assert token.wait(60) is True
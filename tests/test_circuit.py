@@ -0,0 +1,135 @@
+import threading
+import time
+
+import pytest
+
+from langsync.circuit import CIRCUIT_OPEN, CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_opens_after_consecutive_network_errors_and_fails_fast():
+    breaker = CircuitBreaker(threshold=3, cooldown=10, clock=FakeClock())
+    for _ in range(2):
+        breaker.record_failure("network")
+    breaker.before_call()  # still closed
+
+    breaker.record_failure("network")
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError) as exc:
+        breaker.before_call()
+    assert exc.value.kind == CIRCUIT_OPEN
+    assert exc.value.cause_kind == "network"
+
+
+def test_api_errors_do_not_trip_and_reset_the_count():
+    breaker = CircuitBreaker(threshold=2, clock=FakeClock())
+    breaker.record_failure("network")
+    breaker.record_failure("api")
+    breaker.record_failure("network")
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_probe_success_closes():
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=1, cooldown=5, clock=clock)
+    breaker.record_failure("network")
+
+    clock.now = 5
+    breaker.before_call()  # this caller is the probe
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # others fail fast while the probe is out
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_call()
+
+
+def test_failed_probe_reopens_with_longer_cooldown():
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=1, cooldown=5, clock=clock)
+    breaker.record_failure("network")
+    clock.now = 5
+    breaker.before_call()
+    breaker.record_failure("network")
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock.now = 14  # 5 + doubled cooldown of 10 hasn't elapsed yet
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    clock.now = 15
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+
+def test_rate_limit_trip_pauses_callers_until_probe_succeeds():
+    breaker = CircuitBreaker(threshold=1, cooldown=0.05)
+    breaker.record_failure("rate_limit")
+
+    released = []
+
+    def waiter():
+        breaker.before_call()
+        released.append(time.monotonic())
+
+    t = threading.Thread(target=waiter)
+    t.start()
+    t.join(timeout=2)
+    # The first caller after the cooldown becomes the probe and is let through.
+    assert released
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.record_success()
+    breaker.before_call()
+
+
+def test_threshold_zero_disables():
+    breaker = CircuitBreaker(threshold=0, clock=FakeClock())
+    for _ in range(10):
+        breaker.record_failure("network")
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_cancel_releases_a_paused_circuit():
+    from langsync.backends import OfflineBackend
+    from langsync.cancel import CancelToken
+    from langsync.errors import TranslationError
+    from langsync.translator import TranslationService
+
+    class SlowLimiter:
+        def acquire(self, chars, lang=None, cancel=None):
+            time.sleep(0.5)
+
+    cancel = CancelToken()
+    breaker = CircuitBreaker(threshold=1, cooldown=0.3)
+    breaker.record_failure("rate_limit")  # paused, not failing fast
+    service = TranslationService(
+        target_lang="fr", backends=[OfflineBackend("en", "fr", latency=0)],
+        breaker=breaker, limiter=SlowLimiter(), cancel=cancel,
+    )
+    errors = []
+
+    def call():
+        try:
+            service.translate_batch(["Hello"], delay=0)
+        except TranslationError as e:
+            errors.append(e.kind)
+
+    threads = [threading.Thread(target=call, daemon=True) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.4)  # one caller is now the probe, waiting on the limiter
+    cancel.cancel()
+    for thread in threads:
+        thread.join(timeout=2)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert errors == ["cancelled"] * 3
+    assert breaker.state == CircuitBreaker.OPEN
@@ -0,0 +1,401 @@
+import pytest
+
+from langsync.cli import LocaleResult, _dedupe_translatable
+
+
+def test_dedupe_translatable_groups_identical_values():
+    translatable = [
+        (["a"], "Save"),
+        (["b"], "Cancel"),
+        (["c", "d"], "Save"),
+    ]
+    unique = _dedupe_translatable(translatable)
+
+    assert unique == [
+        ([["a"], ["c", "d"]], "Save"),
+        ([["b"]], "Cancel"),
+    ]
+
+
+def test_mark_group_failed_records_every_path():
+    result = LocaleResult("es-ES")
+    result.mark_group_failed([["a"], ["c", "d"]])
+
+    assert result.failed == 2
+    assert result.failed_paths == {"a", "c.d"}
+
+
+def _quiet_progress():
+    import io
+    from rich.console import Console
+    from rich.progress import Progress
+    return Progress(console=Console(file=io.StringIO()))
+
+
+def test_process_locale_runs_batches_concurrently(mocker, tmp_path):
+    import json
+    import threading
+    import time
+    from langsync import cli
+
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    class FakeService:
+        limiter = None
+
+        def __init__(self, **kwargs):
+            pass
+
+        def translate_batch(self, values, delay=0):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.05)
+            with lock:
+                active["now"] -= 1
+            return [v.upper() for v in values]
+
+    mocker.patch.object(cli, "TranslationService", FakeService)
+    source = {f"k{i}": f"value {i}" for i in range(8)}
+    (tmp_path / "de-DE.json").write_text("{}")
+    config = {"batch_size": 2, "max_workers_per_locale": 4, "delay_between_requests": 0}
+
+    with _quiet_progress() as progress:
+        main_task = progress.add_task("total", total=1)
+        result = cli.process_locale(
+            "de-DE", source, str(tmp_path), progress, main_task, config, snapshot_hashes={},
+        )
+
+    assert result.translated == 8
+    assert active["peak"] > 1
+    written = json.loads((tmp_path / "de-DE.json").read_text())
+    assert written["k3"] == "VALUE 3"
+
+
+class _PoisonService:
+    """Fails any batch containing 'POISON'; translates everything else."""
+
+    limiter = None
+
+    def __init__(self):
+        self.batch_calls = 0
+        self.single_calls = 0
+
+    def translate_batch(self, values, delay=0):
+        self.batch_calls += 1
+        if "POISON" in values:
+            from langsync.errors import TranslationError
+            raise TranslationError("bad input", kind="api")
+        return [v.upper() for v in values]
+
+    def translate_one(self, value, delay=0):
+        from langsync.errors import TranslationError
+        self.single_calls += 1
+        if value == "POISON":
+            raise TranslationError("bad input", kind="api")
+        return value.upper()
+
+
+def _poisoned_batch(size, poison_at):
+    batch = [([[f"k{i}"]], f"value {i}") for i in range(size)]
+    batch[poison_at] = ([[f"k{poison_at}"]], "POISON")
+    return batch
+
+
+def test_failed_batch_bisects_instead_of_going_per_item(mocker):
+    from langsync.cli import _translate_with_fallback
+
+    mocker.patch("langsync.cli.time.sleep")
+
+    service = _PoisonService()
+    result = LocaleResult("de-DE")
+    with _quiet_progress() as progress:
+        task = progress.add_task("de-DE", total=16)
+        succeeded = _translate_with_fallback(
+            service, _poisoned_batch(16, poison_at=5), 2, 0, result, progress, task, False,
+        )
+
+    assert len(succeeded) == 15
+    assert result.failed_paths == {"k5"}
+    # 2 top-level attempts, then one batch per half down a log2(16) = 4 level tree.
+    assert service.batch_calls == 2 + 2 * 4
+    # Only the poisoned leaf goes per-item.
+    assert service.single_calls == 1
+
+
+def test_sizer_sees_backend_time_not_limiter_waits(mocker):
+    import time
+    from langsync.cli import _translate_with_fallback
+    from langsync.translator import TranslationService
+    from langsync.backends.offline import OfflineBackend
+
+    class SlowLimiter:
+        def acquire(self, cost, lang=None, cancel=None):
+            time.sleep(0.3)
+
+    service = TranslationService(source_lang="en", target_lang="de", limiter=SlowLimiter(),
+                                 backends=[OfflineBackend("en", "de", latency=0)])
+    sizer = mocker.Mock()
+    result = LocaleResult("de-DE")
+    with _quiet_progress() as progress:
+        task = progress.add_task("de-DE", total=2)
+        _translate_with_fallback(
+            service, [(["a"], "Hello"), (["b"], "World")], 1, 0, result, progress, task, False, sizer=sizer,
+        )
+
+    latency, items, _, clean = sizer.record.call_args.args
+    assert (items, clean) == (2, True)
+    assert latency < 0.1
+
+
+@pytest.mark.parametrize("error", ["circuit_open", "cancelled"])
+def test_unsent_batches_do_not_shrink_the_sizer(mocker, error):
+    from langsync.cancel import CancelledError
+    from langsync.circuit import CircuitOpenError
+    from langsync.cli import _translate_with_fallback
+
+    service = _PoisonService()
+    service.translate_batch = mocker.Mock(side_effect=(
+        CircuitOpenError("circuit open", "network") if error == "circuit_open" else CancelledError("interrupted")
+    ))
+    sizer = mocker.Mock()
+    result = LocaleResult("de-DE")
+    with _quiet_progress() as progress:
+        task = progress.add_task("de-DE", total=4)
+        _translate_with_fallback(
+            service, _poisoned_batch(4, poison_at=0), 3, 0, result, progress, task, False, sizer=sizer,
+        )
+
+    sizer.record.assert_not_called()
+    assert result.failed_paths == {f"k{i}" for i in range(4)}
+
+
+def test_fail_fast_batches_share_one_issue_line_per_kind(mocker):
+    from langsync.circuit import CircuitOpenError
+    from langsync.cli import _translate_with_fallback
+
+    service = _PoisonService()
+    service.translate_batch = mocker.Mock(side_effect=CircuitOpenError("circuit open", "network"))
+    locale_result = LocaleResult("de-DE")
+    with _quiet_progress() as progress:
+        task = progress.add_task("de-DE", total=9)
+        for batch in (_poisoned_batch(4, poison_at=0), _poisoned_batch(1, poison_at=0)):
+            batch_result = LocaleResult("de-DE")
+            _translate_with_fallback(service, batch, 1, 0, batch_result, progress, task, False)
+            locale_result.merge(batch_result)
+    locale_result.add_issue("api", "something else")
+
+    assert locale_result.failed == 5
+    assert locale_result.issues == [("circuit_open", "5 key(s) not sent (circuit open)"), ("api", "something else")]
+
+
+def test_parallel_bisection_gives_the_same_result():
+    from langsync.cli import _translate_with_fallback
+
+    service = _PoisonService()
+    result = LocaleResult("de-DE")
+    with _quiet_progress() as progress:
+        task = progress.add_task("de-DE", total=10)
+        succeeded = _translate_with_fallback(
+            service, _poisoned_batch(10, poison_at=9), 1, 0, result, progress, task, False,
+            parallel_bisection=True,
+        )
+
+    assert sorted(paths[0][0] for paths, _ in succeeded) == sorted(f"k{i}" for i in range(9))
+    assert result.failed_paths == {"k9"}
+    assert result.failed == 1
+
+
+@pytest.mark.parametrize("kind", ["rate_limit", "network"])
+def test_throttled_or_unreachable_batch_is_not_bisected(mocker, kind):
+    from langsync.cli import _translate_with_fallback
+    from langsync.errors import TranslationError
+
+    mocker.patch("langsync.cli.time.sleep")
+    service = _PoisonService()
+    service.translate_batch = mocker.Mock(side_effect=TranslationError("try later", kind=kind))
+    result = LocaleResult("de-DE")
+    with _quiet_progress() as progress:
+        task = progress.add_task("de-DE", total=8)
+        succeeded = _translate_with_fallback(
+            service, _poisoned_batch(8, poison_at=0), 2, 0, result, progress, task, False,
+        )
+
+    assert succeeded == []
+    assert service.translate_batch.call_count == 2
+    assert service.single_calls == 0
+    assert result.failed_paths == {f"k{i}" for i in range(8)}
+    assert [issue_kind for issue_kind, _ in result.issues] == [kind]
+
+
+def test_parallel_bisection_threads_are_bounded():
+    import threading
+    import time
+    from langsync.cli import _translate_with_fallback
+
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    class SlowPoisonService(_PoisonService):
+        def translate_batch(self, values, delay=0):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.01)
+            with lock:
+                active["now"] -= 1
+            return super().translate_batch(values, delay)
+
+    service = SlowPoisonService()
+    result = LocaleResult("de-DE")
+    with _quiet_progress() as progress:
+        task = progress.add_task("de-DE", total=32)
+        succeeded = _translate_with_fallback(
+            service, _poisoned_batch(32, poison_at=31), 1, 0, result, progress, task, False,
+            parallel_bisection=True, bisection_slots=threading.BoundedSemaphore(1),
+        )
+
+    assert len(succeeded) == 31
+    assert result.failed_paths == {"k31"}
+    # The calling thread plus at most one spare.
+    assert active["peak"] <= 2
+
+
+def test_cancel_saves_finished_batches_and_fails_the_rest(mocker, tmp_path):
+    import json
+    from langsync import cli
+    from langsync.cancel import CancelToken
+
+    calls = []
+
+    class FakeService:
+        limiter = None
+
+        def __init__(self, cancel=None, **kwargs):
+            self.cancel = cancel
+
+        def translate_batch(self, values, delay=0):
+            self.cancel.check()
+            calls.append(values)
+            self.cancel.cancel("interrupted")  # Ctrl+C while this batch was in flight
+            return [v.upper() for v in values]
+
+    mocker.patch.object(cli, "TranslationService", FakeService)
+    source = {f"k{i}": f"value {i}" for i in range(6)}
+    (tmp_path / "de-DE.json").write_text("{}")
+    config = {"batch_size": 2, "adaptive_batching": False, "max_workers_per_locale": 1,
+              "delay_between_requests": 0}
+
+    with _quiet_progress() as progress:
+        main_task = progress.add_task("total", total=1)
+        result = cli.process_locale(
+            "de-DE", source, str(tmp_path), progress, main_task, config,
+            snapshot_hashes={}, cancel=CancelToken(),
+        )
+
+    assert len(calls) == 1
+    assert result.translated == 2
+    assert result.failed_paths == {"k2", "k3", "k4", "k5"}
+    assert [kind for kind, _ in result.issues] == ["cancelled"]
+    # The in-flight batch's translations are still written.
+    assert json.loads((tmp_path / "de-DE.json").read_text()) == {"k0": "VALUE 0", "k1": "VALUE 1"}
+
+
+def test_unchanged_locale_is_skipped_without_reading_it(tmp_path):
+    from langsync import cli
+    from langsync.matrix import ORPHAN, StatusMatrix
+    from langsync.processor import SourceIndex
+    from langsync.state import file_fingerprint
+
+    source = {"a": "Hello", "b": "World"}
+    target = tmp_path / "de-DE.json"
+    target.write_text("not json, so parsing it would fail")
+    fingerprint = dict(file_fingerprint(str(target)), orphans=["old"])
+    index = SourceIndex(source)
+    matrix = StatusMatrix(index)
+
+    with _quiet_progress() as progress:
+        main_task = progress.add_task("total", total=1)
+        result, job = cli.prepare_locale(
+            "de-DE", source, str(tmp_path), progress, main_task, {}, snapshot_hashes={},
+            source_index=index, matrix=matrix, fingerprint=fingerprint,
+        )
+
+    assert job is None and result.skipped and not result.issues
+    assert result.unchanged_count == 2 and result.orphan_count == 1
+    assert matrix.keys_for("de-DE", ORPHAN) == ["old"]
+
+    # A changed file goes through the normal path again.
+    target.write_text('{"a": "Hallo"}')
+    with _quiet_progress() as progress:
+        main_task = progress.add_task("total", total=1)
+        result, _ = cli.prepare_locale(
+            "de-DE", source, str(tmp_path), progress, main_task, {}, snapshot_hashes={},
+            source_index=index, dry_run=True, fingerprint=fingerprint,
+        )
+    assert not result.skipped and result.missing_count == 1
+
+
+def test_rate_limit_hint_names_the_throttled_backend():
+    from langsync.backends.stats import BackendStats
+    from langsync.cli import _render_issues_panel
+
+    stats = BackendStats()
+    stats.record("libretranslate", 5, 0.1, "rate_limit")
+    stats.record("google", 5, 0.1)
+    result = LocaleResult("ja-JP")
+    result.add_issue("rate_limit", "batch of 5 skipped (rate limit exceeded)")
+
+    text = str(_render_issues_panel([result], stats).subtitle)
+    assert "Rate-limited by `libretranslate`" in text
+    assert "requests_per_second" in text and "routes" in text
+    assert "Google Translate" not in text
+
+
+def test_backend_table_reports_circuit_trips():
+    from rich.console import Console
+    from langsync.backends.stats import BackendStats
+    from langsync.circuit import CircuitBreaker
+    from langsync.cli import _render_backend_table
+
+    breaker = CircuitBreaker(threshold=1)
+    breaker.record_failure("network")
+    stats = BackendStats()
+    stats.record("google", 1, 0.1, "network")
+
+    console = Console(width=120, record=True)
+    console.print(_render_backend_table(stats, {"google": breaker}))
+    text = console.export_text()
+    assert "Circuit trips" in text
+    assert breaker.total_trips == 1
+    assert text.splitlines()[-1].rstrip().endswith("1")
+
+
+def test_locale_result_reports_misaligned_segments(mocker, tmp_path):
+    from langsync import cli
+
+    class FakeService:
+        limiter = None
+
+        def __init__(self, **kwargs):
+            self.misaligned = 0
+
+        def translate_batch(self, values, delay=0):
+            self.misaligned += 1  # one packed segment had to be retried alone
+            return [v.upper() for v in values]
+
+    mocker.patch.object(cli, "TranslationService", FakeService)
+    (tmp_path / "de-DE.json").write_text("{}")
+    config = {"batch_size": 2, "adaptive_batching": False, "max_workers_per_locale": 1,
+              "delay_between_requests": 0}
+
+    with _quiet_progress() as progress:
+        main_task = progress.add_task("total", total=1)
+        result = cli.process_locale(
+            "de-DE", {f"k{i}": f"value {i}" for i in range(6)}, str(tmp_path), progress, main_task, config,
+            snapshot_hashes={},
+        )
+
+    assert result.translated == 6
+    assert result.misaligned == 3
@@ -39,3 +39,19 @@ def test_load_config_invalid_json(tmp_path):
     loaded, loaded_path = load_config(str(config_file))
     # Should return default config if invalid
     assert loaded == get_default_config()
+
+def test_max_parallel_locales_accepts_auto(tmp_path):
+    config_file = tmp_path / "langsync.json"
+    save_config(str(config_file), {"max_parallel_locales": "auto"})
+    loaded, _ = load_config(str(config_file))
+    assert loaded['max_parallel_locales'] == "auto"
+
+    save_config(str(config_file), {"max_parallel_locales": "fast"})
+    loaded, _ = load_config(str(config_file))
+    assert loaded['max_parallel_locales'] == get_default_config()['max_parallel_locales']
+
+def test_routes_accept_a_name_or_ordered_list(tmp_path):
+    config_file = tmp_path / "langsync.json"
+    save_config(str(config_file), {"routes": {"ja": ["google", "libretranslate"], "de": "offline"}})
+    loaded, _ = load_config(str(config_file))
+    assert loaded['routes'] == {"ja": ["google", "libretranslate"], "de": ["offline"]}
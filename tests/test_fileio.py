@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+from langsync.fileio import write_atomic
+from langsync.processor import LocaleProcessor
+
+
+def test_identical_content_is_not_rewritten(tmp_path):
+    path = tmp_path / "fr-FR.json"
+    assert LocaleProcessor.save_json(str(path), {"a": "b"}) is True
+    os.utime(path, ns=(10**18, 10**18))
+
+    assert LocaleProcessor.save_json(str(path), {"a": "b"}) is False
+    assert path.stat().st_mtime_ns == 10**18
+
+    assert LocaleProcessor.save_json(str(path), {"a": "c"}) is True
+    assert LocaleProcessor.load_json(str(path)) == {"a": "c"}
+
+
+def test_replace_keeps_permissions_and_leaves_no_temp_files(tmp_path):
+    path = tmp_path / "fr-FR.json"
+    path.write_text("old")
+    os.chmod(path, 0o640)
+    write_atomic(str(path), "new")
+    assert path.read_text() == "new"
+    assert path.stat().st_mode & 0o777 == 0o640
+    assert os.listdir(tmp_path) == ["fr-FR.json"]
+
+
+def test_failed_write_leaves_the_original_intact(tmp_path, mocker):
+    path = tmp_path / "fr-FR.json"
+    path.write_text('{"a": "b"}\n')
+    mocker.patch("langsync.fileio.os.replace", side_effect=KeyboardInterrupt)
+
+    with pytest.raises(KeyboardInterrupt):
+        write_atomic(str(path), '{"a": "c"}\n')
+    assert path.read_text() == '{"a": "b"}\n'
+    assert os.listdir(tmp_path) == ["fr-FR.json"]
+
+
+def test_symlinked_file_keeps_its_link(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    target = shared / "fr-FR.json"
+    target.write_text("old")
+    messages = tmp_path / "messages"
+    messages.mkdir()
+    link = messages / "fr-FR.json"
+    link.symlink_to(target)
+
+    assert write_atomic(str(link), "new") is True
+    assert link.is_symlink()
+    assert target.read_text() == "new"
+    assert os.listdir(messages) == ["fr-FR.json"]
+    assert os.listdir(shared) == ["fr-FR.json"]
@@ -0,0 +1,87 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from langsync.backends.libretranslate import LibreTranslateBackend
+from langsync.errors import TranslationError
+from langsync.translator import TranslationService
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        with server.lock:
+            server.requests.append(body)
+            server.clients.add(self.client_address)
+        if server.status != 200:
+            self._reply(server.status, {"error": "Slowdown: too many requests"})
+            return
+        q = body["q"]
+        translate = lambda text: f"{body['target']}:{text}"
+        self._reply(200, {"translatedText": [translate(t) for t in q] if isinstance(q, list) else translate(q)})
+
+    def _reply(self, status, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.lock = threading.Lock()
+    httpd.requests = []
+    httpd.clients = set()
+    httpd.status = 200
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_batch_is_one_bulk_request_over_a_kept_alive_connection(server):
+    service = TranslationService(
+        target_lang="zh-CN", backend="libretranslate", backend_options={"url": _url(server)},
+    )
+    assert service.translate_batch(["Hello", "World"], delay=0) == ["zh:Hello", "zh:World"]
+    assert service.translate_one("Again") == "zh:Again"
+
+    assert server.requests[0] == {"q": ["Hello", "World"], "source": "en", "target": "zh", "format": "text"}
+    assert server.requests[1]["q"] == "Again"
+    # Both requests reused the same pooled connection.
+    assert len(server.clients) == 1
+
+
+def test_http_429_is_a_rate_limit(server):
+    server.status = 429
+    service = TranslationService(
+        target_lang="fr", backend="libretranslate", backend_options={"url": _url(server)},
+    )
+    with pytest.raises(TranslationError) as exc:
+        service.translate_batch(["Hello"], delay=0)
+    assert exc.value.kind == "rate_limit"
+    assert str(exc.value) == "RATE_LIMIT_HIT"
+
+
+def test_language_codes_and_errors():
+    backend = LibreTranslateBackend("en", "iw", url="http://127.0.0.1:9")
+    assert backend.target == "he"
+    with pytest.raises(Exception) as exc:
+        backend.translate("Hello")
+    assert backend.classify_error(exc.value) == "network"
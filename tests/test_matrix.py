@@ -0,0 +1,49 @@
+import csv
+import json
+
+from langsync.matrix import CHANGED, MISSING, ORPHAN, UNCHANGED, StatusMatrix
+from langsync.processor import LocaleProcessor, SourceIndex
+from langsync.state import value_hash
+
+
+def _matrix(source, targets, snapshot=None):
+    index = SourceIndex(source)
+    matrix = StatusMatrix(index)
+    for locale, target in targets.items():
+        classification = LocaleProcessor(source, index=index).classify_keys(target, snapshot or {})
+        matrix.record(locale, classification)
+    return matrix
+
+
+def test_matrix_counts_and_queries():
+    source = {"a": "Hello", "n": {"b": "World", "c": ""}, "d": "Bye"}
+    snapshot = {"a": value_hash("Hi")}
+    matrix = _matrix(source, {
+        "de-DE": {"a": "Hallo", "n": {"b": "Welt"}, "d": "Tschüss"},
+        "fr-FR": {"a": "Bonjour", "old": "x"},
+    }, snapshot)
+
+    assert matrix.count("de-DE", MISSING) == 1  # n.c
+    assert matrix.count("de-DE", CHANGED) == 1  # a drifted since the snapshot
+    assert matrix.count("fr-FR", UNCHANGED) == 0
+    assert matrix.totals() == {MISSING: 4, CHANGED: 2, ORPHAN: 1, UNCHANGED: 2}
+    assert matrix.keys_for("fr-FR", MISSING) == ["n.b", "n.c", "d"]
+    assert matrix.locales_for("n.c", MISSING) == ["de-DE", "fr-FR"]
+    assert matrix.locales_for("d", UNCHANGED) == ["de-DE"]
+    assert matrix.locales_for("old", ORPHAN) == ["fr-FR"]
+    assert matrix.drifted_keys() == ["a", "n.b", "n.c", "d"]
+
+
+def test_matrix_export_json_and_csv(tmp_path):
+    matrix = _matrix({"a": "Hello", "b": "World"}, {"de-DE": {"a": "Hallo"}, "fr-FR": {"x": "y"}})
+
+    matrix.write(str(tmp_path / "report.json"))
+    report = json.loads((tmp_path / "report.json").read_text())
+    assert report["missing"] == {"a": ["fr-FR"], "b": ["de-DE", "fr-FR"]}
+    assert report["orphan"] == {"x": ["fr-FR"]}
+    assert report["summary"]["de-DE"] == {"missing": 1, "changed": 0, "orphan": 0, "unchanged": 1}
+
+    matrix.write(str(tmp_path / "report.csv"))
+    with open(tmp_path / "report.csv", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows == [["key", "de-DE", "fr-FR"], ["a", "", "missing"], ["b", "missing", "missing"], ["x", "", "orphan"]]
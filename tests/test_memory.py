@@ -0,0 +1,90 @@
+import os
+
+from langsync.memory import (
+    MEMORY_FILENAME,
+    TranslationMemory,
+    default_memory_path,
+    whitelist_fingerprint,
+)
+
+
+def test_default_memory_path_sits_next_to_snapshot():
+    path = default_memory_path(os.path.join("messages", ".langsync-state.json"))
+    assert path == os.path.join("messages", MEMORY_FILENAME)
+
+
+def test_whitelist_fingerprint_is_order_independent():
+    assert whitelist_fingerprint(["a", "b"]) == whitelist_fingerprint(["b", "a", "a"])
+    assert whitelist_fingerprint(["a"]) != whitelist_fingerprint(["a", "b"])
+
+
+def test_round_trip_and_counters(tmp_path):
+    memory = TranslationMemory(str(tmp_path / "mem.sqlite"))
+    memory.put_many("google", "es", "fp", [("Hello", "Hola"), ("World", "Mundo")])
+
+    found = memory.get_many("google", "es", "fp", ["Hello", "World", "Missing"])
+    assert found == {"Hello": "Hola", "World": "Mundo"}
+    assert memory.hits == 2
+    assert memory.misses == 1
+
+    # Backend, language and whitelist fingerprint are part of the key.
+    assert memory.get("libretranslate", "es", "fp", "Hello") is None
+    assert memory.get("google", "fr", "fp", "Hello") is None
+    assert memory.get("google", "es", "other", "Hello") is None
+    memory.close()
+
+
+def test_persists_across_instances(tmp_path):
+    path = str(tmp_path / "mem.sqlite")
+    first = TranslationMemory(path)
+    first.put("google", "de", "fp", "Save", "Speichern")
+    first.close()
+
+    second = TranslationMemory(path)
+    assert second.get("google", "de", "fp", "Save") == "Speichern"
+    second.close()
+
+
+def test_empty_translations_are_not_stored(tmp_path):
+    memory = TranslationMemory(str(tmp_path / "mem.sqlite"))
+    memory.put_many("google", "es", "fp", [("Hello", ""), ("World", None)])
+    assert len(memory) == 0
+    memory.close()
+
+
+def test_close_evicts_least_recently_used(tmp_path):
+    path = str(tmp_path / "mem.sqlite")
+    memory = TranslationMemory(path, max_entries=2)
+    memory.put("google", "es", "fp", "old", "viejo")
+    memory.put("google", "es", "fp", "mid", "medio")
+    memory.put("google", "es", "fp", "new", "nuevo")
+    # Reading `old` refreshes it, so `mid` becomes the LRU entry.
+    memory.get("google", "es", "fp", "old")
+    memory.close()
+    assert memory.evicted == 1
+
+    reopened = TranslationMemory(path)
+    assert reopened.get("google", "es", "fp", "mid") is None
+    assert reopened.get("google", "es", "fp", "old") == "viejo"
+    assert reopened.get("google", "es", "fp", "new") == "nuevo"
+    reopened.close()
+
+
+def test_version_1_table_is_replaced(tmp_path):
+    import sqlite3
+
+    path = str(tmp_path / "mem.sqlite")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE translations (lang TEXT, whitelist TEXT, source TEXT, target TEXT, "
+                 "last_used REAL, PRIMARY KEY (lang, whitelist, source))")
+    conn.execute("INSERT INTO translations VALUES ('es', 'fp', 'Hello', 'Hola', 0)")
+    conn.commit()
+    conn.close()
+
+    memory = TranslationMemory(path)
+    assert len(memory) == 0
+    memory.put("google", "es", "fp", "Hello", "Hola")
+    memory.close()
+    reopened = TranslationMemory(path)
+    assert reopened.get("google", "es", "fp", "Hello") == "Hola"
+    reopened.close()
@@ -1,7 +1,7 @@
 import pytest
 import os
 import json
-from langsync.processor import LocaleProcessor
+from langsync.processor import LocaleProcessor, SourceIndex
 from langsync.state import compute_source_hashes, value_hash
 
 def test_get_missing_keys():
@@ -82,9 +82,9 @@ def test_classify_missing_only():
     target = {"a": "Hola"}
     c = LocaleProcessor(source).classify_keys(target, snapshot_hashes={})
 
-    assert c["missing_translatable"] == [(["b"], "World")]
+    assert c["missing_translatable"] == [(("b",), "World")]
     assert c["changed_translatable"] == []
-    assert c["unchanged"] == [["a"]]
+    assert c["unchanged"] == [("a",)]
     assert c["orphans"] == []
 
 
@@ -96,9 +96,9 @@ def test_classify_detects_source_drift():
 
     c = LocaleProcessor(source).classify_keys(target, snapshot_hashes=snapshot)
 
-    assert c["changed_translatable"] == [(["a"], "Hi")]
+    assert c["changed_translatable"] == [(("a",), "Hi")]
     assert c["missing_translatable"] == []
-    assert c["unchanged"] == [["b"]]
+    assert c["unchanged"] == [("b",)]
 
 
 def test_classify_first_run_bootstrap_treats_filled_targets_as_unchanged():
@@ -147,3 +147,27 @@ def test_remove_by_path_keeps_parent_dict():
     data = {"a": {"only": "x"}}
     LocaleProcessor.remove_by_path(data, ["a", "only"])
     assert data == {"a": {}}
+
+
+def test_classify_nested_structure_and_orphans():
+    source = {"a": {"b": "Hi", "c": {"d": ""}}, "e": "Bye", "f": {}}
+    target = {"a": "flat", "e": {"x": "y", "z": {"w": 1}}, "g": {"h": "old"}}
+    c = LocaleProcessor(source).classify_keys(target, snapshot_hashes={})
+
+    # Source objects are (re)created in the target so values can be set into them.
+    assert target["a"] == {"c": {}} and target["f"] == {}
+    assert c["missing_translatable"] == [(("a", "b"), "Hi"), (("e",), "Bye")]
+    assert c["missing_passthrough"] == [(("a", "c", "d"), "")]
+    # Only the outermost unknown path is reported.
+    assert c["orphans"] == [("e", "x"), ("e", "z"), ("g",)]
+
+
+def test_source_index_is_shared_and_matches_snapshot_hashes():
+    source = {"a": "Hello", "n": {"b": 2}}
+    index = SourceIndex(source)
+    assert index.paths == [("a",), ("n", "b")]
+    assert index.hashes == compute_source_hashes(source)
+
+    one = LocaleProcessor(source, index=index).classify_keys({"a": "Hola"}, snapshot_hashes={})
+    two = LocaleProcessor(source, index=index).classify_keys({}, snapshot_hashes={})
+    assert one["unchanged"][0] is two["missing_translatable"][0][0]
@@ -0,0 +1,101 @@
+from langsync.ratelimit import RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(round(seconds, 6))
+        self.now += seconds
+
+
+def test_token_bucket_bursts_then_charges_debt():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, clock=clock)
+    assert bucket.reserve(1) == 0
+    assert bucket.reserve(1) == 0
+    # Bucket is empty: the third token is half a second away at 2 tokens/s.
+    assert bucket.reserve(1) == 0.5
+    assert bucket.reserve(1) == 1.0
+
+
+def test_limiter_paces_requests_across_callers():
+    clock = FakeClock()
+    limiter = RateLimiter(requests_per_second=1, clock=clock, sleep=clock.sleep)
+    for _ in range(3):
+        limiter.acquire()
+    assert clock.slept == [1.0, 1.0]
+
+
+def test_limiter_character_budget():
+    clock = FakeClock()
+    limiter = RateLimiter(characters_per_second=100, clock=clock, sleep=clock.sleep)
+    limiter.acquire(characters=100)
+    limiter.acquire(characters=50)
+    assert clock.slept == [0.5]
+
+
+def test_per_language_budget_applies_only_to_that_language():
+    clock = FakeClock()
+    limiter = RateLimiter(
+        per_language={"ja": {"requests_per_second": 1}}, clock=clock, sleep=clock.sleep,
+    )
+    limiter.acquire(lang="es")
+    limiter.acquire(lang="es")
+    assert clock.slept == []
+    limiter.acquire(lang="ja")
+    limiter.acquire(lang="ja")
+    assert clock.slept == [1.0]
+
+
+def test_cool_down_pauses_every_caller():
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    limiter.cool_down(4)
+    limiter.acquire()
+    assert clock.slept == [4.0]
+
+
+def test_from_config_derives_rate_from_legacy_delay():
+    assert RateLimiter.from_config({"delay_between_requests": 0.2}).requests_per_second == 5.0
+    assert RateLimiter.from_config({"delay_between_requests": 0}).enabled is False
+    explicit = RateLimiter.from_config({"delay_between_requests": 0.2, "requests_per_second": 12})
+    assert explicit.requests_per_second == 12
+
+
+def test_cancel_interrupts_a_throttled_wait_and_refunds_it():
+    import time
+
+    import pytest
+    from langsync.cancel import CancelToken, CancelledError
+    from langsync.backends.offline import OfflineBackend
+    from langsync.translator import TranslationService
+
+    cancel = CancelToken(timeout=0.3)
+    service = TranslationService(
+        source_lang="en", target_lang="fr", cancel=cancel,
+        limiter=RateLimiter(requests_per_second=0.2),
+        backends=[OfflineBackend("en", "fr", latency=0)],
+    )
+    service.translate_batch(["Hello"], delay=0)
+    started = time.monotonic()
+    with pytest.raises(CancelledError):
+        service.translate_batch(["World"], delay=0)  # 5 s away at 0.2 req/s
+    assert time.monotonic() - started < 1.0
+
+    # The abandoned reservation is given back: the next caller waits for one
+    # request's worth, not two.
+    clock = FakeClock()
+    limiter = RateLimiter(requests_per_second=1, clock=clock, sleep=clock.sleep)
+    limiter.acquire()
+    cancelled = CancelToken()
+    cancelled.cancel()
+    with pytest.raises(CancelledError):
+        limiter.acquire(cancel=cancelled)
+    limiter.acquire()
+    assert clock.slept == [1.0]
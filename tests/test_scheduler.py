@@ -0,0 +1,110 @@
+import threading
+import time
+from collections import deque
+
+from langsync.scheduler import AdaptiveConcurrency, BatchScheduler
+
+
+class _Job:
+    def __init__(self, name, batches):
+        self.name = name
+        self._pending = deque(batches)
+        self._lock = threading.Lock()
+
+    def next_batch(self):
+        with self._lock:
+            return self._pending.popleft() if self._pending else None
+
+
+def test_runs_every_unit_once():
+    jobs = [_Job("big", list(range(20))), _Job("small", [100])]
+    seen = []
+    lock = threading.Lock()
+
+    def run_unit(job, batch):
+        with lock:
+            seen.append((job.name, batch))
+
+    scheduler = BatchScheduler(workers=4)
+    for job in jobs:
+        scheduler.add(job)
+    scheduler.run(run_unit)
+
+    assert sorted(seen) == sorted([("big", i) for i in range(20)] + [("small", 100)])
+
+
+def test_single_large_job_keeps_all_workers_busy():
+    threads = set()
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def run_unit(job, batch):
+        with lock:
+            threads.add(threading.get_ident())
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+
+    scheduler = BatchScheduler(workers=4)
+    scheduler.add(_Job("de-DE", list(range(12))))
+    scheduler.run(run_unit)
+
+    assert active["peak"] == 4
+    assert len(threads) == 4
+
+
+def test_run_without_jobs_is_a_no_op():
+    BatchScheduler(workers=2).run(lambda job, batch: None)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_adaptive_concurrency_grows_while_throughput_improves():
+    clock = _Clock()
+    gate = AdaptiveConcurrency(initial=2, maximum=4, window=2, clock=clock)
+    for _ in range(20):
+        clock.now += 1.0
+        gate.record(items=gate.limit * 10)
+    assert gate.limit == 4
+
+
+def test_adaptive_concurrency_holds_on_plateau_and_halves_on_errors():
+    clock = _Clock()
+    gate = AdaptiveConcurrency(initial=4, maximum=8, window=1, clock=clock)
+    for _ in range(8):
+        clock.now += 1.0
+        gate.record(items=5)
+    assert gate.limit == 5  # first window set the baseline, then flat throughput
+    gate.record(items=5, error_kind="rate_limit")
+    assert gate.limit == 2
+    clock.now += 100.0
+    assert gate.settled == 2
+
+
+def test_gate_caps_active_workers():
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def run_unit(job, batch):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.01)
+        with lock:
+            active["now"] -= 1
+
+    gate = AdaptiveConcurrency(initial=2, maximum=6, window=1000)
+    scheduler = BatchScheduler(workers=1, gate=gate)
+    scheduler.add(_Job("de-DE", list(range(12))))
+    scheduler.run(run_unit)
+
+    assert scheduler.workers == 6
+    assert active["peak"] == 2
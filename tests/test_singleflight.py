@@ -0,0 +1,65 @@
+import threading
+
+import pytest
+
+from langsync.errors import TranslationError
+from langsync.singleflight import SingleFlight
+
+
+def test_first_caller_owns_later_callers_wait():
+    flights = SingleFlight()
+    owned, waiting = flights.claim("es", "fp", ["Save", "Cancel", "Save"])
+    assert owned == ["Save", "Cancel"]
+    assert waiting == {}
+
+    owned2, waiting2 = flights.claim("es", "fp", ["Save", "Learn more"])
+    assert owned2 == ["Learn more"]
+    assert set(waiting2) == {"Save"}
+    assert flights.shared == 1
+
+    flights.resolve("es", "fp", {"Save": "Guardar", "Cancel": "Cancelar"})
+    assert waiting2["Save"].result() == "Guardar"
+
+
+def test_language_code_is_part_of_the_key():
+    flights = SingleFlight()
+    flights.claim("es", "fp", ["Save"])
+    owned, waiting = flights.claim("fr", "fp", ["Save"])
+    assert owned == ["Save"]
+    assert waiting == {}
+
+
+def test_failure_propagates_and_releases_ownership():
+    flights = SingleFlight()
+    flights.claim("es", "fp", ["Save"])
+    _, waiting = flights.claim("es", "fp", ["Save"])
+
+    flights.fail("es", "fp", ["Save"], TranslationError("boom", kind="network"))
+    with pytest.raises(TranslationError) as exc:
+        waiting["Save"].result()
+    assert exc.value.kind == "network"
+
+    # The next caller becomes the owner and retries.
+    owned, _ = flights.claim("es", "fp", ["Save"])
+    assert owned == ["Save"]
+
+
+def test_empty_results_are_not_retained():
+    flights = SingleFlight()
+    flights.claim("es", "fp", ["Save"])
+    flights.resolve("es", "fp", {"Save": None})
+    owned, _ = flights.claim("es", "fp", ["Save"])
+    assert owned == ["Save"]
+
+
+def test_waiter_blocks_until_owner_resolves():
+    flights = SingleFlight()
+    flights.claim("es", "fp", ["Save"])
+    _, waiting = flights.claim("es", "fp", ["Save"])
+
+    out = []
+    t = threading.Thread(target=lambda: out.append(waiting["Save"].result()))
+    t.start()
+    flights.resolve("es", "fp", {"Save": "Guardar"})
+    t.join(timeout=2)
+    assert out == ["Guardar"]
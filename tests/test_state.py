@@ -73,3 +73,101 @@ def test_default_state_path_is_inside_dir():
 
 def test_path_to_key_joins_with_dot():
     assert path_to_key(["a", "b", "c"]) == "a.b.c"
+
+
+def test_value_hash_is_short_and_type_aware():
+    assert len(value_hash("hello")) == 16
+    assert value_hash(["a", 1]) == value_hash(["a", 1])
+    assert value_hash(None) != value_hash("null")
+
+
+def test_v1_snapshot_still_matches_until_rewritten(tmp_path):
+    from langsync.processor import LocaleProcessor
+    from langsync.state import legacy_value_hash
+
+    path = tmp_path / "state.json"
+    path.write_text(json.dumps({"version": 1, "hashes": {"a": legacy_value_hash("Hello"), "b": legacy_value_hash("Old")}}))
+    hashes, exists = load_state(str(path))
+    assert exists
+
+    c = LocaleProcessor({"a": "Hello", "b": "New"}).classify_keys({"a": "Hallo", "b": "Alt"}, hashes)
+    assert c["unchanged"] == [("a",)]
+    assert c["changed_translatable"] == [(("b",), "New")]
+
+    save_state(str(path), compute_source_hashes({"a": "Hello"}))
+    raw = path.read_text()
+    assert json.loads(raw) == {"version": 2, "hashes": {"a": value_hash("Hello")}}
+    assert raw == json.dumps(json.loads(raw), indent=2, ensure_ascii=False) + "\n"
+
+
+def test_fingerprint_matches_by_mtime_then_digest(tmp_path):
+    from langsync.state import file_fingerprint, fingerprint_matches
+
+    path = tmp_path / "fr-FR.json"
+    path.write_text('{"a": "b"}')
+    os.utime(path, ns=(10**18, 10**18))
+    recorded = file_fingerprint(str(path))
+    assert recorded["mtime_ns"] == 10**18
+    assert fingerprint_matches(str(path), recorded)
+
+    # Touched (or freshly checked out) but identical: the digest decides.
+    os.utime(path, ns=(2 * 10**18, 2 * 10**18))
+    assert fingerprint_matches(str(path), recorded)
+
+    path.write_text('{"a": "c"}')  # same size, new content
+    assert not fingerprint_matches(str(path), recorded)
+    assert not fingerprint_matches(str(tmp_path / "missing.json"), recorded)
+    assert not fingerprint_matches(str(path), None)
+
+
+def test_recently_modified_files_are_not_trusted_by_mtime(tmp_path):
+    from langsync.state import file_fingerprint
+
+    path = tmp_path / "fr-FR.json"
+    path.write_text("{}")
+    assert file_fingerprint(str(path))["mtime_ns"] is None
+
+
+def test_settle_fingerprint_fills_in_the_mtime_once_stable(tmp_path):
+    from langsync.state import file_fingerprint, settle_fingerprint
+
+    path = tmp_path / "fr-FR.json"
+    path.write_text("{}")
+    recorded = dict(file_fingerprint(str(path)), orphans=["x"])
+    assert recorded["mtime_ns"] is None
+    assert settle_fingerprint(str(path), recorded) is None  # still racy
+
+    os.utime(path, ns=(10**18, 10**18))
+    settled = settle_fingerprint(str(path), recorded)
+    assert settled == dict(recorded, mtime_ns=10**18)
+    assert settle_fingerprint(str(path), settled) is None  # nothing left to fill in
+
+
+def test_fingerprints_round_trip(tmp_path):
+    from langsync.state import read_state
+
+    path = tmp_path / "state.json"
+    fingerprints = {"source": {"size": 1, "mtime_ns": None, "digest": "ab"},
+                    "locales": {"fr-FR": {"size": 2, "mtime_ns": 5, "digest": "cd", "orphans": ["x"]}}}
+    save_state(str(path), {"a": value_hash("x")}, fingerprints)
+    hashes, loaded, exists = read_state(str(path))
+    assert exists and loaded == fingerprints and hashes == {"a": value_hash("x")}
+    assert load_state(str(path)) == (hashes, True)
+
+
+def test_malformed_fingerprints_are_dropped(tmp_path):
+    from langsync.state import read_state
+
+    path = tmp_path / "state.json"
+    good = {"size": 2, "mtime_ns": 5, "digest": "cd", "orphans": ["x"]}
+    path.write_text(json.dumps({
+        "version": 2,
+        "hashes": {},
+        "fingerprints": {
+            "source": "corrupt",
+            "locales": {"fr-FR": good, "de-DE": [1, 2], "es-ES": {"orphans": "x"}},
+        },
+    }))
+    _, fingerprints, exists = read_state(str(path))
+    assert exists
+    assert fingerprints == {"source": None, "locales": {"fr-FR": good}}
@@ -1,6 +1,18 @@
 import pytest
 from langsync.translator import TextProtector
 
+
+def _mock_google(mocker):
+    """Stub the Google backend's HTTP calls; returns the mock standing in for
+    its translate/translate_batch."""
+    from langsync.backends.google import GoogleBackend
+    mocker.patch("langsync.backends.google.GoogleTranslator")
+    google = mocker.MagicMock()
+    mocker.patch.object(GoogleBackend, "translate", google.translate)
+    mocker.patch.object(GoogleBackend, "translate_batch", google.translate_batch)
+    return google
+
+
 def test_protect_placeholders():
     text = "Hello {name}, welcome to <tag>our site</tag>."
     protected_text, markers = TextProtector.protect(text, whitelist=[])
@@ -55,6 +67,20 @@ def test_protect_nested_overlap():
     restored = TextProtector.restore(protected_text, markers)
     assert restored == text
 
+def test_protect_whitelist_single_pass_semantics():
+    from langsync.translator import _compile_matcher
+
+    whitelist = ["Virgin", "Virgin Atlantic", "Pro"]
+    text = "virgin atlantic and Virgin {n} ProMode Pro"
+    protected_text, markers = TextProtector.protect(text, whitelist=whitelist)
+
+    # Longest term wins, case-insensitively; "ProMode" is not a word-bounded "Pro".
+    assert sorted(markers.values()) == ["Pro", "Virgin", "virgin atlantic", "{n}"]
+    assert "ProMode" in protected_text
+    assert TextProtector.restore(protected_text, markers) == text
+    # The matcher is built once per whitelist.
+    assert _compile_matcher(tuple(whitelist)) is _compile_matcher(tuple(whitelist))
+
 def test_restore_robustness():
     text = "PH0X is a marker."
     markers = {"PH0X": "{name}"}
@@ -64,6 +90,14 @@ def test_restore_robustness():
     restored = TextProtector.restore(translated, markers)
     assert restored == " {name}  is a marker."
 
+def test_restore_single_pass_tolerates_mangled_markers():
+    markers = {"PH0X": r"{path\d}", "WL1X": "Lascade", "WL10X": "Arch Linux", "_meta": {}}
+    translated = "ph 0 x, wl1X und WL 10X; WL7X bleibt"
+    restored = TextProtector.restore(translated, markers)
+    # Originals are inserted literally (no backreference expansion), WL1X does
+    # not eat the prefix of WL10X, and unknown markers are left alone.
+    assert restored == r"{path\d}, Lascade und Arch Linux; WL7X bleibt"
+
 def test_get_translator_code():
     from langsync.translator import get_translator_code
     assert get_translator_code("zh-CN") == "zh-CN"
@@ -77,29 +111,198 @@ def test_translation_service_init():
     service = TranslationService(source_lang="en", target_lang="es")
     assert service.source_lang == "en"
     assert service.target_lang == "es"
-    assert service.translator is not None
+    assert service.backend is not None
 
     service_same = TranslationService(source_lang="en", target_lang="en")
-    assert service_same.translator is None
+    assert service_same.backend is None
 
 def test_translate_batch(mocker):
     from langsync.translator import TranslationService
-    mock_translator_class = mocker.patch("langsync.translator.GoogleTranslator")
-    mock_instance = mock_translator_class.return_value
-    mock_instance.translate_batch.return_value = ["Hola", "Mundo"]
+    mock_instance = _mock_google(mocker)
+    mock_instance.translate.side_effect = ["Hola", "Mundo"]
 
     service = TranslationService(source_lang="en", target_lang="es")
     results = service.translate_batch(["Hello", "World"], delay=0)
     
     assert results == ["Hola", "Mundo"]
-    mock_instance.translate_batch.assert_called_once()
+    # Google has no batch endpoint: one request per item.
+    assert mock_instance.translate.call_count == 2
+    mock_instance.translate_batch.assert_not_called()
 
 def test_translate_batch_rate_limit(mocker):
     from langsync.translator import TranslationService
-    mock_translator_class = mocker.patch("langsync.translator.GoogleTranslator")
-    mock_instance = mock_translator_class.return_value
-    mock_instance.translate_batch.side_effect = Exception("429 Too Many Requests")
+    mock_instance = _mock_google(mocker)
+    mock_instance.translate.side_effect = Exception("429 Too Many Requests")
 
     service = TranslationService(source_lang="en", target_lang="es")
     with pytest.raises(Exception, match="RATE_LIMIT_HIT"):
         service.translate_batch(["Hello"], delay=0)
+
+def test_translate_batch_uses_memory(mocker, tmp_path):
+    from langsync.translator import TranslationService
+    from langsync.memory import TranslationMemory
+    mock_instance = _mock_google(mocker)
+    mock_instance.translate.return_value = "Mundo"
+
+    memory = TranslationMemory(str(tmp_path / "mem.sqlite"))
+    service = TranslationService(source_lang="en", target_lang="es", memory=memory)
+    memory.put("google", "es", service.whitelist_fp, "Hello", "Hola")
+
+    results = service.translate_batch(["Hello", "World"], delay=0)
+
+    assert results == ["Hola", "Mundo"]
+    # Only the cache miss reaches the backend, and its result is remembered.
+    mock_instance.translate.assert_called_once_with("World")
+    assert memory.get("google", "es", service.whitelist_fp, "World") == "Mundo"
+    memory.close()
+
+def test_translate_batch_all_cached_skips_backend(mocker, tmp_path):
+    from langsync.translator import TranslationService
+    from langsync.memory import TranslationMemory
+    mock_instance = _mock_google(mocker)
+
+    memory = TranslationMemory(str(tmp_path / "mem.sqlite"))
+    service = TranslationService(source_lang="en", target_lang="es", memory=memory)
+    memory.put("google", "es", service.whitelist_fp, "Hello", "Hola")
+
+    assert service.translate_batch(["Hello"], delay=0) == ["Hola"]
+    mock_instance.translate.assert_not_called()
+    memory.close()
+
+def test_services_sharing_flights_translate_once(mocker):
+    from langsync.translator import TranslationService
+    from langsync.singleflight import SingleFlight
+    mock_instance = _mock_google(mocker)
+    mock_instance.translate.return_value = "Hola"
+
+    flights = SingleFlight()
+    es_es = TranslationService(source_lang="en", target_lang="es", flights=flights)
+    es_mx = TranslationService(source_lang="en", target_lang="es", flights=flights)
+
+    assert es_es.translate_batch(["Hello"], delay=0) == ["Hola"]
+    assert es_mx.translate_batch(["Hello"], delay=0) == ["Hola"]
+    mock_instance.translate.assert_called_once_with("Hello")
+    assert flights.shared == 1
+
+def test_services_sharing_protections_protect_once(mocker):
+    from langsync.translator import ProtectionTable, TranslationService
+    _mock_google(mocker).translate.side_effect = lambda text: f"x {text}"
+    protect = mocker.spy(TextProtector, "protect")
+
+    protections = ProtectionTable(whitelist=["Lascade"])
+    protections.precompute(["Lascade rocks", "Done."])
+    de = TranslationService(target_lang="de", protections=protections)
+    fr = TranslationService(target_lang="fr", protections=protections)
+
+    assert de.translate_batch(["Lascade rocks", "Done."], delay=0) == ["x Lascade rocks", "x Done."]
+    assert fr.translate_batch(["Lascade rocks", "Done."], delay=0) == ["x Lascade rocks", "x Done."]
+    assert protect.call_count == 2
+    assert de.whitelist_fp == fr.whitelist_fp == protections.fingerprint
+
+def test_batch_packer_round_trip():
+    from langsync.translator import BatchPacker
+    texts = ["Save", "Cancel", "Hello PH0X"]
+    joined = BatchPacker.join(texts)
+    assert BatchPacker.split(joined, 3) == texts
+
+def test_batch_packer_tolerates_mangled_separators():
+    from langsync.translator import BatchPacker
+    translated = "Guardar\n seg 1 x \nCancelar\nSEG2X\nHola PH0X"
+    assert BatchPacker.split(translated, 3) == ["Guardar", "Cancelar", "Hola PH0X"]
+
+def test_batch_packer_only_drops_misaligned_segments():
+    from langsync.translator import BatchPacker
+    # Separator 2 was lost: segments 1 and 2 can't be told apart, 0 and 3 can.
+    translated = "Guardar\nSEG1X\nCancelar Hola\nSEG3X\nMundo"
+    assert BatchPacker.split(translated, 4) == ["Guardar", None, None, "Mundo"]
+
+def test_batch_packer_plan_respects_char_limit():
+    from langsync.translator import BatchPacker
+    packs = BatchPacker.plan(["a" * 40, "b" * 40, "c" * 40, "d" * 200], max_chars=100)
+    assert packs == [[0, 1], [2], [3]]
+
+def test_translate_batch_packed_uses_one_request(mocker):
+    from langsync.translator import TranslationService
+    mock_instance = _mock_google(mocker)
+    mock_instance.translate.return_value = "Hola\nSEG1X\nMundo"
+
+    service = TranslationService(source_lang="en", target_lang="es", pack=True)
+    assert service.translate_batch(["Hello", "World"], delay=0) == ["Hola", "Mundo"]
+    mock_instance.translate.assert_called_once()
+    mock_instance.translate_batch.assert_not_called()
+
+def test_translate_batch_packed_misaligned_returns_none(mocker):
+    from langsync.translator import TranslationService
+    mock_instance = _mock_google(mocker)
+    mock_instance.translate.return_value = "Hola Mundo"
+
+    service = TranslationService(source_lang="en", target_lang="es", pack=True)
+    assert service.translate_batch(["Hello", "World"], delay=0) == [None, None]
+    assert service.misaligned == 2
+
+def test_translate_batch_acquires_from_limiter(mocker):
+    from langsync.translator import TranslationService
+    mock_instance = _mock_google(mocker)
+    mock_instance.translate.return_value = "Hola\nSEG1X\nMundo"
+    limiter = mocker.Mock()
+    sleep = mocker.patch("langsync.translator.time.sleep")
+
+    service = TranslationService(source_lang="en", target_lang="es", pack=True, limiter=limiter)
+    service.translate_batch(["Hello", "World"], delay=0.5)
+
+    limiter.acquire.assert_called_once_with(len("Hello\nSEG1X\nWorld"), lang="es", cancel=None)
+    # The limiter replaces the fixed per-call sleep.
+    sleep.assert_not_called()
+
+def test_unpacked_batch_acquires_per_backend_request(mocker):
+    from langsync.translator import TranslationService
+    from langsync.backends.offline import OfflineBackend
+    mock_instance = _mock_google(mocker)
+    mock_instance.translate.side_effect = lambda text: text.upper()
+    limiter = mocker.Mock()
+
+    service = TranslationService(source_lang="en", target_lang="es", limiter=limiter)
+    assert service.translate_batch(["Hello", "World", "Again"], delay=0) == ["HELLO", "WORLD", "AGAIN"]
+    # Google sends one request per item, so each one is paced on its own.
+    assert limiter.acquire.call_count == mock_instance.translate.call_count == 3
+    assert [c.args[0] for c in limiter.acquire.call_args_list] == [5, 5, 5]
+
+    # A native batch backend sends the chunk as one request: one acquisition.
+    limiter.reset_mock()
+    batch = mocker.spy(OfflineBackend, "translate_batch")
+    service = TranslationService(source_lang="en", target_lang="es", limiter=limiter,
+                                 backends=[OfflineBackend("en", "es", latency=0)])
+    service.translate_batch(["Hello", "World", "Again"], delay=0)
+    assert limiter.acquire.call_count == batch.call_count == 1
+
+def test_open_circuit_skips_backend(mocker):
+    from langsync.translator import TranslationService
+    from langsync.circuit import CircuitBreaker, CIRCUIT_OPEN
+    from langsync.errors import TranslationError
+    mock_instance = _mock_google(mocker)
+    mock_instance.translate.side_effect = Exception("Connection refused")
+
+    breaker = CircuitBreaker(threshold=2, cooldown=60)
+    service = TranslationService(source_lang="en", target_lang="es", breaker=breaker)
+    for _ in range(2):
+        with pytest.raises(TranslationError):
+            service.translate_batch(["Hello"], delay=0)
+
+    with pytest.raises(TranslationError) as exc:
+        service.translate_batch(["Hello"], delay=0)
+    assert exc.value.kind == CIRCUIT_OPEN
+    assert mock_instance.translate.call_count == 2
+
+def test_cancelled_service_sends_nothing(mocker):
+    from langsync.translator import TranslationService
+    from langsync.cancel import CANCELLED, CancelToken
+    from langsync.errors import TranslationError
+    mock_instance = _mock_google(mocker)
+
+    cancel = CancelToken()
+    service = TranslationService(source_lang="en", target_lang="es", cancel=cancel)
+    cancel.cancel()
+    with pytest.raises(TranslationError) as exc:
+        service.translate_batch(["Hello"], delay=0)
+    assert exc.value.kind == CANCELLED
+    mock_instance.translate.assert_not_called()